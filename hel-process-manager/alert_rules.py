@@ -0,0 +1,301 @@
+import ast
+import configparser
+import os
+import re
+
+import numpy as np
+
+ALERT_RULES_PATH = os.path.join(os.path.expanduser('~'), '.config', 'hel-process', 'alerts.conf')
+
+EXAMPLE_RULES = """\
+# One section per rule. 'when' is evaluated for every process on each tick.
+# Fields: cpu (%), mem (%), rss, swap (bytes; K/M/G/T suffixes allowed),
+# read, write, io (KB/s), threads, and name, user, exe (== / != "text").
+# System fields: sys.cpu, sys.mem, sys.swap (%), sys.load1, sys.load5,
+# sys.load15, sys.psi_cpu, sys.psi_mem, sys.psi_io (% stalled, last 10s).
+# A rule using only sys. fields fires once for the whole system.
+# Append 'for 60s' (or m/h) to require the condition to hold that long.
+# Optional keys: clear (condition that ends the alert, default: 'when' is
+# false), cooldown (seconds between notifications, default 300),
+# notify (yes/no, default yes), command (run with {rule} {pid} {name}).
+#
+# [cpu-pinned]
+# when = sys.cpu > 95 for 60s
+# clear = sys.cpu < 80
+#
+# [busy]
+# when = cpu > 90 for 60s
+# clear = cpu < 70
+#
+# [big-java]
+# when = proc.name == "java" and rss > 8G
+"""
+
+DEFAULT_COOLDOWN = 300.0
+SIZE_SUFFIXES = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, '': 1}
+
+# Numeric fields and how to read them from the columnar snapshot.
+NUMERIC_FIELDS = {
+    'cpu': lambda columns: columns['cpu'],
+    'mem': lambda columns: columns['mem'],
+    'rss': lambda columns: columns['rss'],
+    'swap': lambda columns: columns['swap'],
+    'read': lambda columns: columns['read'],
+    'write': lambda columns: columns['write'],
+    'io': lambda columns: columns['read'] + columns['write'],
+    'threads': lambda columns: columns['threads'],
+}
+# Text fields are interned to integer codes (see snapshot_columns.KeyInterner).
+TEXT_FIELDS = ('name', 'user', 'exe')
+# System-wide fields (sys.<field>), one value per tick from the system sample
+# passed to AlertEngine.evaluate(); see AlertsHandler.system_alert_values().
+SYSTEM_FIELDS = ('cpu', 'mem', 'swap', 'load1', 'load5', 'load15', 'psi_cpu', 'psi_mem', 'psi_io')
+
+FOR_CLAUSE = re.compile(r'\s+for\s+(\d+(?:\.\d+)?)\s*(ms|s|m|h|)\s*$')
+SIZE_LITERAL = re.compile(r'\b(\d+(?:\.\d+)?)\s*([KMGT])(?:i?B)?\b')
+QUOTED = re.compile(r'("[^"]*"|\'[^\']*\')')
+
+COMPARISONS = {
+    ast.Gt: np.greater, ast.GtE: np.greater_equal, ast.Lt: np.less,
+    ast.LtE: np.less_equal, ast.Eq: np.equal, ast.NotEq: np.not_equal,
+}
+ARITHMETIC = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.Div: np.divide}
+
+class AlertRuleError(ValueError):
+    pass
+
+def expand_sizes(text):
+    """Replaces size literals such as 8G or 512MiB with byte counts, leaving quoted strings alone."""
+    parts = QUOTED.split(text)
+    for index in range(0, len(parts), 2):
+        parts[index] = SIZE_LITERAL.sub(lambda m: repr(float(m.group(1)) * SIZE_SUFFIXES[m.group(2)]), parts[index])
+    return ''.join(parts)
+
+def field_name(node):
+    """Returns the field a Name or proc.<field> node refers to, 'sys.<field>' for a system field, or None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in ('proc', 'sys'):
+        return node.attr if node.value.id == 'proc' else f"sys.{node.attr}"
+    return None
+
+class ExpressionCompiler:
+    """
+    Turns a rule condition into a function of the columnar snapshot that
+    returns one boolean per process. The expression is parsed once with
+    Python's ast module, checked against a small whitelist of node types and
+    translated into numpy operations, so evaluating a rule over 20k
+    processes is a few array operations rather than 20k Python calls.
+
+    With system=True, sys.<field> terms are allowed and read the scalar
+    'sys.<field>' entries of the columns dict. A condition that uses only
+    those compiles to a function returning a single boolean.
+    """
+    def __init__(self, interners, system=False):
+        self.interners = interners
+        self.system = system
+
+    def compile(self, text, per_process=False):
+        """
+        Returns (condition, per_process): per_process is False for conditions
+        over sys. fields only, unless per_process=True asks for one boolean
+        per process regardless.
+        """
+        try:
+            tree = ast.parse(expand_sizes(text).strip(), mode='eval')
+        except SyntaxError as e:
+            raise AlertRuleError(f"{text!r}: {e.msg}") from None
+        self.process_fields = False
+        evaluate = self.node(tree.body)
+        if not self.process_fields and not per_process:
+            return (lambda columns: bool(evaluate(columns))), False
+        return (lambda columns: np.broadcast_to(evaluate(columns), columns['pid'].shape).astype(bool)), True
+
+    def node(self, node):
+        if isinstance(node, ast.BoolOp):
+            operands = [self.node(value) for value in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            def boolean(columns):
+                result = operands[0](columns)
+                for operand in operands[1:]:
+                    result = combine(result, operand(columns))
+                return result
+            return boolean
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub)):
+            operand = self.node(node.operand)
+            negate = np.logical_not if isinstance(node.op, ast.Not) else np.negative
+            return lambda columns: negate(operand(columns))
+        if isinstance(node, ast.Compare):
+            return self.comparison(node)
+        if isinstance(node, ast.BinOp) and type(node.op) in ARITHMETIC:
+            left, right, op = self.node(node.left), self.node(node.right), ARITHMETIC[type(node.op)]
+            return lambda columns: op(left(columns), right(columns))
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            value = node.value
+            return lambda columns: value
+        name = field_name(node)
+        if name in NUMERIC_FIELDS:
+            self.process_fields = True
+            return NUMERIC_FIELDS[name]
+        if name is not None and name.startswith('sys.'):
+            if not self.system:
+                raise AlertRuleError(f"system fields are only available in alert rules: {name}")
+            if name[4:] not in SYSTEM_FIELDS:
+                raise AlertRuleError(f"unknown system field: {name}")
+            # NaN (not available on this kernel) compares False.
+            return lambda columns: columns.get(name, np.nan)
+        if name in TEXT_FIELDS:
+            raise AlertRuleError(f"'{name}' can only be compared with == or != to a quoted string")
+        raise AlertRuleError(f"unsupported term: {ast.unparse(node)}")
+
+    def comparison(self, node):
+        terms = [node.left] + node.comparators
+        parts = []
+        for left, op, right in zip(terms, node.ops, terms[1:]):
+            if type(op) not in COMPARISONS:
+                raise AlertRuleError(f"unsupported comparison in {ast.unparse(node)}")
+            parts.append(self.text_comparison(left, op, right) or self.numeric_comparison(left, op, right))
+        def chained(columns):
+            result = parts[0](columns)
+            for part in parts[1:]:
+                result = np.logical_and(result, part(columns))
+            return result
+        return chained
+
+    def numeric_comparison(self, left, op, right):
+        left, right, compare = self.node(left), self.node(right), COMPARISONS[type(op)]
+        # NaN (value not readable) compares False, so unknown values never alert.
+        return lambda columns: compare(left(columns), right(columns))
+
+    def text_comparison(self, left, op, right):
+        if isinstance(left, ast.Constant) and isinstance(left.value, str):
+            left, right = right, left
+        name = field_name(left)
+        if name not in TEXT_FIELDS:
+            return None
+        if not (isinstance(right, ast.Constant) and isinstance(right.value, str)) or type(op) not in (ast.Eq, ast.NotEq):
+            raise AlertRuleError(f"'{name}' can only be compared with == or != to a quoted string")
+        interner, text, equal = self.interners[name], right.value, isinstance(op, ast.Eq)
+        self.process_fields = True
+        def compare(columns):
+            # Looked up on every evaluation: the text may only get a code once
+            # a matching process first appears.
+            matches = columns[name] == interner.codes.get(text, -1)
+            return matches if equal else ~matches
+        return compare
+
+class AlertRule:
+    def __init__(self, name, condition, duration, clear, cooldown, notify, command, per_process=True):
+        self.name = name
+        self.condition = condition
+        self.per_process = per_process  # False: evaluated once for the system, keyed SYSTEM_KEY
+        self.duration = duration
+        self.clear = clear
+        self.cooldown = cooldown
+        self.notify = notify
+        self.command = command
+        self.pending = {}   # (pid, create_time) or SYSTEM_KEY -> time the condition became true
+        self.firing = {}    # (pid, create_time) -> time the alert fired
+        self.notified = {}  # (pid, create_time) -> time of the last notification
+
+def parse_rules(text, interners):
+    """Parses and compiles the rules of an alerts.conf; raises AlertRuleError naming the faulty rule."""
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read_string(text)
+    except configparser.Error as e:
+        raise AlertRuleError(str(e)) from None
+    compiler = ExpressionCompiler(interners, system=True)
+    rules = []
+    for name in parser.sections():
+        section = parser[name]
+        try:
+            when = section['when']
+            duration = 0.0
+            match = FOR_CLAUSE.search(when)
+            if match:
+                duration = float(match.group(1)) * DURATION_UNITS[match.group(2)]
+                when = when[:match.start()]
+            condition, per_process = compiler.compile(when)
+            clear = None
+            if section.get('clear'):
+                clear, clear_per_process = compiler.compile(section['clear'], per_process)
+                if clear_per_process and not per_process:
+                    raise AlertRuleError("'clear' of a system rule can only use sys. fields")
+            rules.append(AlertRule(
+                name, condition, duration, clear,
+                section.getfloat('cooldown', DEFAULT_COOLDOWN), section.getboolean('notify', True),
+                section.get('command', '').strip() or None, per_process,
+            ))
+        except KeyError:
+            raise AlertRuleError(f"[{name}]: missing 'when'") from None
+        except (AlertRuleError, ValueError) as e:
+            raise AlertRuleError(f"[{name}]: {e}") from None
+    return rules
+
+# Key of the one "process" a system rule is evaluated for.
+SYSTEM_KEY = (None, None)
+
+class AlertEngine:
+    """
+    Evaluates compiled rules against each new columnar snapshot and returns
+    state changes only. A rule fires for a process once its condition has
+    held for the rule's duration and resolves when its clear condition (by
+    default: the condition no longer holding) is met, so a separate clear
+    threshold gives hysteresis. Notifications for the same process and rule
+    are rate-limited by the rule's cooldown. Rules over sys. fields only
+    go through the same states once for the whole system, with pid None.
+    """
+    def __init__(self, rules):
+        self.rules = rules
+
+    def evaluate(self, columns, now, system=None):
+        """
+        Returns a list of (state, rule, pid, notify) with state 'firing' or
+        'resolved'. system is {field: value} for the sys. fields (see
+        SYSTEM_FIELDS); missing ones evaluate as NaN.
+        """
+        if system:
+            columns = dict(columns, **{f"sys.{field}": value for field, value in system.items()})
+        pids, create_times = columns['pid'], columns['create_time']
+        changes = []
+        for rule in self.rules:
+            with np.errstate(all='ignore'):
+                matching = rule.condition(columns)
+            if not rule.per_process:
+                true_now = {SYSTEM_KEY} if matching else set()
+            else:
+                true_now = set(zip(pids[matching].tolist(), create_times[matching].tolist()))
+
+            # Pending conditions restart whenever they stop holding.
+            rule.pending = {key: rule.pending.get(key, now) for key in true_now if key not in rule.firing}
+            for key, since in list(rule.pending.items()):
+                if now - since >= rule.duration:
+                    del rule.pending[key]
+                    rule.firing[key] = now
+                    notify = now - rule.notified.get(key, float('-inf')) >= rule.cooldown
+                    if notify:
+                        rule.notified[key] = now
+                    changes.append(('firing', rule, key[0], notify))
+
+            if rule.firing and not rule.per_process:
+                with np.errstate(all='ignore'):
+                    holding = not rule.clear(columns) if rule.clear is not None else matching
+                if not holding:
+                    del rule.firing[SYSTEM_KEY]
+                    changes.append(('resolved', rule, None, False))
+            elif rule.firing:
+                # Only rows of firing processes are looked at; exited ones resolve.
+                holding = np.isin(pids, [key[0] for key in rule.firing])
+                with np.errstate(all='ignore'):
+                    holding &= ~rule.clear(columns) if rule.clear is not None else matching
+                still_firing = set(zip(pids[holding].tolist(), create_times[holding].tolist()))
+                for key in [key for key in rule.firing if key not in still_firing]:
+                    del rule.firing[key]
+                    changes.append(('resolved', rule, key[0], False))
+
+            # Past its cooldown a notification no longer suppresses anything.
+            for key in [key for key, at in rule.notified.items() if now - at >= rule.cooldown]:
+                del rule.notified[key]
+        return changes
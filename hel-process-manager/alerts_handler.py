@@ -0,0 +1,110 @@
+import os
+import shlex
+import shutil
+import subprocess
+import time
+from datetime import datetime
+from PyQt5.QtWidgets import QTableWidgetItem
+from PyQt5.QtGui import QBrush, QColor
+
+import psutil
+
+from alert_rules import ALERT_RULES_PATH, EXAMPLE_RULES, AlertEngine, AlertRuleError, parse_rules
+from process_data_handler import NumericTableWidgetItem
+from procfs_linux import read_pressure
+
+# Entries kept in the alert log table, newest first.
+ALERT_LOG_ROWS = 500
+
+class AlertsHandler:
+    def load_alert_rules(self):
+        """Loads ALERT_RULES_PATH into the editor and activates it; without a file, the commented example is shown."""
+        try:
+            with open(ALERT_RULES_PATH, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            text = EXAMPLE_RULES
+        self.alert_rules_editor.setPlainText(text)
+        self.compile_alert_rules(text)
+
+    def compile_alert_rules(self, text):
+        try:
+            rules = parse_rules(text, self.group_interners)
+        except AlertRuleError as e:
+            self.alert_status_label.setText(self.lang.get('alert_rules_error', "Rules not applied: {error}").format(error=e))
+            return False
+        self.alert_engine = AlertEngine(rules)
+        self.alert_status_label.setText(self.lang.get('alert_rules_loaded', "{count} rule(s) active.").format(count=len(rules)))
+        return True
+
+    def apply_alert_rules(self):
+        text = self.alert_rules_editor.toPlainText()
+        if not self.compile_alert_rules(text):
+            return
+        try:
+            os.makedirs(os.path.dirname(ALERT_RULES_PATH), exist_ok=True)
+            with open(ALERT_RULES_PATH, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            self.alert_status_label.setText(self.lang.get('alert_rules_not_saved', "Rules applied but not saved: {error}").format(error=e))
+
+    def system_alert_values(self):
+        """
+        The sys. fields of the alert rules: CPU and memory from the graphs'
+        sample of this tick, plus swap, load averages and PSI (the 'some'
+        avg10 stall share); values this kernel doesn't provide are left out.
+        """
+        values = dict(self.system_sample)
+        values['swap'] = psutil.swap_memory().percent
+        values['load1'], values['load5'], values['load15'] = os.getloadavg()
+        for field, resource in (('psi_cpu', 'cpu'), ('psi_mem', 'memory'), ('psi_io', 'io')):
+            try:
+                values[field] = read_pressure(resource)['some']['avg10']
+            except (OSError, KeyError, ValueError):
+                pass
+        return values
+
+    def update_alerts(self):
+        if not self.alert_engine.rules:
+            return
+        system = self.system_alert_values() if not all(rule.per_process for rule in self.alert_engine.rules) else None
+        for state, rule, pid, notify in self.alert_engine.evaluate(self.process_columns, time.monotonic(), system):
+            if pid is None:
+                name = self.lang.get('alert_system', "System")
+            else:
+                row_data = self.process_snapshot.get(pid)
+                name = row_data['name'] if row_data else ""
+            self.log_alert(state, rule, pid, name)
+            if notify:
+                self.run_alert_hooks(rule, pid, name)
+
+    def log_alert(self, state, rule, pid, name):
+        firing = state == 'firing'
+        self.alert_log_table.setSortingEnabled(False)
+        self.alert_log_table.insertRow(0)
+        self.alert_log_table.setItem(0, 0, QTableWidgetItem(datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        self.alert_log_table.setItem(0, 1, QTableWidgetItem(rule.name))
+        self.alert_log_table.setItem(0, 2, NumericTableWidgetItem(str(pid) if pid is not None else "", pid))
+        self.alert_log_table.setItem(0, 3, QTableWidgetItem(name))
+        state_item = QTableWidgetItem(self.lang.get('alert_firing', "Firing") if firing else self.lang.get('alert_resolved', "Resolved"))
+        if firing:
+            state_item.setBackground(QBrush(QColor(255, 170, 170)))
+        self.alert_log_table.setItem(0, 4, state_item)
+        self.alert_log_table.setRowCount(min(self.alert_log_table.rowCount(), ALERT_LOG_ROWS))
+        self.alert_log_table.setSortingEnabled(True)
+
+    def run_alert_hooks(self, rule, pid, name):
+        """Sends the desktop notification and starts the rule's command without waiting for either."""
+        if pid is None:
+            message = self.lang.get('alert_notification_system', "{rule}: system-wide").format(rule=rule.name)
+        else:
+            message = self.lang.get('alert_notification', "{rule}: {name} (PID {pid})").format(rule=rule.name, name=name, pid=pid)
+        try:
+            if rule.notify and shutil.which('notify-send'):
+                subprocess.Popen(['notify-send', self.lang.get('alert_title', "Process alert"), message],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+            if rule.command:
+                command = [part.format(rule=rule.name, pid=pid if pid is not None else "", name=name) for part in shlex.split(rule.command)]
+                subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            self.alert_status_label.setText(self.lang.get('alert_hook_error', "Alert '{rule}': hook failed: {error}").format(rule=rule.name, error=e))
@@ -0,0 +1,79 @@
+import numpy as np
+
+from snapshot_columns import SlotAllocator
+
+# (metric, columnar snapshot column(s) summed into it, smallest standard
+# deviation assumed). The floor keeps a process that has been perfectly flat
+# (an idle daemon at 0.0% CPU) from producing an infinite z-score the first
+# time it does anything at all.
+ANOMALY_METRICS = (
+    ('cpu', ('cpu',), 2.0),
+    ('rss', ('rss',), 4.0 * 1024 * 1024),
+    ('io', ('read', 'write'), 64.0),
+)
+DEFAULT_Z_THRESHOLD = 4.0
+# Ticks of history a process needs before it can be called anomalous.
+ANOMALY_MIN_SAMPLES = 30
+# Ticks the baseline mostly reflects (the span of the exponential average).
+DEFAULT_ANOMALY_WINDOW = 300
+
+class AnomalyDetector:
+    """
+    Exponentially weighted mean and variance of CPU %, RSS and I/O rate for
+    every process, updated each tick with array operations over the columnar
+    snapshot. The weight of a new value is 2 / (window + 1), so the baseline
+    follows a process that settles into a new steady state instead of
+    averaging over its whole lifetime; until a process has `window` samples
+    the plain running mean is used. Each new value is scored against the
+    baseline before it is folded in; processes whose z-score exceeds the
+    threshold on any metric are reported.
+    """
+    def __init__(self, z_threshold=DEFAULT_Z_THRESHOLD, min_samples=ANOMALY_MIN_SAMPLES, window=DEFAULT_ANOMALY_WINDOW):
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.window = window
+        fields = {}
+        for metric, _, _ in ANOMALY_METRICS:
+            fields.update({f'{metric}_n': np.int64, f'{metric}_mean': np.float64, f'{metric}_var': np.float64})
+        self.state = SlotAllocator(fields)
+        self.anomalies = {}  # pid -> {metric: (z, mean, std)}
+
+    def update(self, columns):
+        slots, is_new = self.state.assign(columns['pid'], columns['create_time'])
+        s = self.state.arrays
+        new_slots = slots[is_new]
+        z_scores = {}
+        alpha = 2.0 / (self.window + 1)
+        for metric, sources, std_floor in ANOMALY_METRICS:
+            n_field, mean_field, var_field = f'{metric}_n', f'{metric}_mean', f'{metric}_var'
+            s[n_field][new_slots] = 0
+            s[mean_field][new_slots] = 0.0
+            s[var_field][new_slots] = 0.0
+
+            x = columns[sources[0]] if len(sources) == 1 else sum(columns[name] for name in sources)
+            known = ~np.isnan(x)
+            rows, x = slots[known], x[known]
+            n, mean, var = s[n_field][rows], s[mean_field][rows], s[var_field][rows]
+
+            # Score against the baseline so far.
+            std = np.sqrt(var)
+            z = (x - mean) / np.maximum(std, std_floor)
+            scored = n >= self.min_samples
+            z_scores[metric] = (known.nonzero()[0][scored], z[scored], mean[scored], std[scored])
+
+            # Then fold the new value in; 1/n while warming up keeps the first
+            # samples from being weighted as if they were a long history.
+            n = n + 1
+            weight = np.maximum(1.0 / n, alpha)
+            delta = x - mean
+            s[n_field][rows] = n
+            s[mean_field][rows] = mean + weight * delta
+            s[var_field][rows] = (1.0 - weight) * (var + weight * delta * delta)
+
+        pids = columns['pid']
+        anomalies = {}
+        for metric, (indexes, z, mean, std) in z_scores.items():
+            hits = z > self.z_threshold
+            for pid, score, usual, spread in zip(pids[indexes[hits]].tolist(), z[hits].tolist(), mean[hits].tolist(), std[hits].tolist()):
+                anomalies.setdefault(pid, {})[metric] = (score, usual, spread)
+        self.anomalies = anomalies
@@ -0,0 +1,139 @@
+import time
+import psutil
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# Operations the bulk worker can apply; each takes the psutil.Process and the
+# argument (nice value for renice, signal number, list of CPUs for affinity,
+# I/O class for ionice). The privileged helper accepts the same names.
+BULK_OPERATIONS = {
+    'kill': lambda proc, argument: proc.kill(),
+    'terminate': lambda proc, argument: proc.terminate(),
+    'suspend': lambda proc, argument: proc.suspend(),
+    'resume': lambda proc, argument: proc.resume(),
+    'renice': lambda proc, argument: proc.nice(argument),
+    'signal': lambda proc, argument: proc.send_signal(argument),
+    'affinity': lambda proc, argument: proc.cpu_affinity(argument),
+    'ionice': lambda proc, argument: proc.ionice(argument),
+}
+PROGRESS_EVERY = 50
+# Default seconds a process gets to exit after SIGTERM before it is killed.
+DEFAULT_GRACE_PERIOD = 5
+# How long to wait for SIGKILLed processes to disappear (D-state processes may not).
+KILL_WAIT = 1.0
+
+def apply_operation(proc, operation, argument):
+    """Applies one operation and returns (outcome, message) with outcome 'ok', 'gone', 'denied' or 'error'."""
+    try:
+        BULK_OPERATIONS[operation](proc, argument)
+        return 'ok', ""
+    except psutil.NoSuchProcess:
+        return 'gone', ""
+    except psutil.AccessDenied:
+        return 'denied', ""
+    except (psutil.Error, OSError, ValueError) as e:
+        return 'error', str(e)
+
+class BulkActionWorker(QThread):
+    """
+    Applies one operation to many processes off the UI thread.
+
+    targets are (pid, name, psutil.Process) taken from the collector's
+    snapshot; psutil checks each process's start time before signalling, so
+    a PID reused since the snapshot is reported as gone rather than hit.
+    With freeze_first every target is stopped before any is acted on, so a
+    process tree can't fork replacements while it is being killed; the ones
+    the operation then fails on are resumed.
+
+    The 'stop' operation shuts processes down gracefully: SIGTERM to all,
+    then psutil.wait_procs() for up to grace seconds, then SIGKILL for the
+    ones still running. Its outcomes are 'terminated' (exited on SIGTERM) and
+    'killed' (needed SIGKILL) besides the usual ones.
+
+    When a privileged helper is connected, the targets we may not act on
+    are retried through it in one batched round-trip per pass.
+
+    Emits progress(done, total) every PROGRESS_EVERY processes and
+    finished_actions with {pid: (name, outcome, message)}.
+    """
+    progress = pyqtSignal(int, int)
+    finished_actions = pyqtSignal(object)
+
+    def __init__(self, targets, operation, argument=None, freeze_first=False, grace=DEFAULT_GRACE_PERIOD, helper=None, parent=None):
+        super().__init__(parent)
+        self.targets = targets
+        self.operation = operation
+        self.argument = argument
+        self.freeze_first = freeze_first
+        self.grace = grace
+        self.helper = helper
+
+    def run(self):
+        if self.operation == 'stop':
+            self.finished_actions.emit(self.stop_gracefully())
+            return
+        if not self.freeze_first:
+            self.finished_actions.emit(self.apply_batch(self.targets, self.operation, self.argument, report=True))
+            return
+        frozen = {pid for pid, (name, outcome, message) in self.apply_batch(self.targets, 'suspend', None).items() if outcome == 'ok'}
+        results = self.apply_batch(self.targets, self.operation, self.argument, report=True)
+        # Don't leave the ones the operation failed on stopped.
+        self.apply_batch([target for target in self.targets if target[0] in frozen and results[target[0]][1] not in ('ok', 'gone')], 'resume', None)
+        self.finished_actions.emit(results)
+
+    def apply_batch(self, targets, operation, argument, report=False):
+        """Applies an operation to targets and returns {pid: (name, outcome, message)}; denied ones go to the helper."""
+        total = len(targets)
+        results = {}
+        denied = []
+        for done, (pid, name, proc) in enumerate(targets, start=1):
+            outcome, message = apply_operation(proc, operation, argument)
+            if outcome == 'denied' and self.helper is not None and self.helper.connected:
+                denied.append((pid, name, proc))
+            else:
+                results[pid] = (name, outcome, message)
+            if report and done % PROGRESS_EVERY == 0:
+                self.progress.emit(done, total)
+        identities = []
+        for pid, name, proc in denied:
+            try:
+                identities.append((pid, proc.create_time()))
+            except psutil.Error:
+                identities.append((pid, None))
+        for (pid, name, proc), outcome in zip(denied, self.helper.apply(operation, argument, identities) if denied else ()):
+            results[pid] = (name,) + tuple(outcome)
+        return results
+
+    def stop_gracefully(self):
+        total = len(self.targets)
+        results = {}
+        names = {}
+        waiting = []
+        procs = {pid: proc for pid, name, proc in self.targets}
+        for pid, (name, outcome, message) in self.apply_batch(self.targets, 'terminate', None).items():
+            if outcome == 'ok':
+                names[pid] = name
+                waiting.append(procs[pid])
+            else:
+                results[pid] = (name, outcome, message)
+        self.progress.emit(len(results), total)
+        started = time.monotonic()
+
+        def exited(proc):
+            results[proc.pid] = (names[proc.pid], 'terminated', f"{time.monotonic() - started:.1f}s")
+            self.progress.emit(len(results), total)
+
+        # wait_procs polls each process (reaping our own children) until it
+        # exits or the grace period runs out.
+        gone, alive = psutil.wait_procs(waiting, timeout=self.grace, callback=exited)
+        killed = []
+        kills = self.apply_batch([(proc.pid, names[proc.pid], proc) for proc in alive], 'kill', None)
+        for proc in alive:
+            name, outcome, message = kills[proc.pid]
+            if outcome == 'ok':
+                killed.append(proc)
+            # A process that exits between the wait and SIGKILL still exited on SIGTERM.
+            results[proc.pid] = (name, 'killed' if outcome == 'ok' else 'terminated' if outcome == 'gone' else outcome, message)
+        gone, alive = psutil.wait_procs(killed, timeout=KILL_WAIT)
+        for proc in alive:
+            results[proc.pid] = (names[proc.pid], 'error', "still running after SIGKILL")
+        return results
@@ -0,0 +1,144 @@
+import os
+import signal
+from collections import Counter
+from PyQt5.QtWidgets import QMenu, QMessageBox, QInputDialog
+
+from bulk_actions import BulkActionWorker
+
+# Names listed in the confirmation before it switches to "... and N more".
+CONFIRM_NAMES = 5
+# Per-PID results listed in the status tooltip.
+RESULT_TOOLTIP_ROWS = 100
+# Outcomes in summary order: (outcome, lang key, default text)
+BULK_OUTCOMES = (
+    ('ok', 'bulk_outcome_ok', "done"),
+    ('terminated', 'bulk_outcome_terminated', "exited after SIGTERM"),
+    ('killed', 'bulk_outcome_killed', "killed after the grace period"),
+    ('gone', 'bulk_outcome_gone', "already gone"),
+    ('denied', 'bulk_outcome_denied', "permission denied"),
+    ('error', 'bulk_outcome_error', "failed"),
+)
+
+class BulkActionsHandler:
+    def show_process_context_menu(self, view, position):
+        pids = self.selected_pids()
+        if not pids:
+            return
+        menu = QMenu(self)
+        menu.addAction(self.lang.get('graceful_stop', "End Process"), lambda: self.run_bulk_action('stop'))
+        menu.addAction(self.lang.get('bulk_terminate', "Terminate"), lambda: self.run_bulk_action('terminate'))
+        menu.addAction(self.lang.get('kill', "Kill"), lambda: self.run_bulk_action('kill'))
+        menu.addAction(self.lang.get('kill_tree', "Kill Process Tree"), self.kill_selected_trees)
+        menu.addSeparator()
+        menu.addAction(self.lang.get('suspend_process', "Suspend"), lambda: self.run_bulk_action('suspend'))
+        menu.addAction(self.lang.get('resume_process', "Resume"), lambda: self.run_bulk_action('resume'))
+        menu.addAction(self.lang.get('renice', "Renice"), self.bulk_renice)
+        if len(pids) == 1:
+            menu.addSeparator()
+            menu.addAction(self.lang.get('limit_resources', "Limit Resources..."), lambda: self.limit_selected_process(False))
+            menu.addAction(self.lang.get('limit_tree_resources', "Limit Process Tree..."), lambda: self.limit_selected_process(True))
+        menu.exec_(view.viewport().mapToGlobal(position))
+
+    def describe_targets(self, pids):
+        """Summarises processes for a confirmation, e.g. 'chrome (212), python3 (3) and 5 more'."""
+        names = Counter(self.process_snapshot[pid]['name'] for pid in pids if pid in self.process_snapshot)
+        shown = ", ".join(f"{name} ({count})" for name, count in names.most_common(CONFIRM_NAMES))
+        if len(names) > CONFIRM_NAMES:
+            shown += " " + self.lang.get('bulk_more_names', "and {count} more").format(count=len(names) - CONFIRM_NAMES)
+        return shown
+
+    def run_bulk_action(self, operation, processes=None, argument=None, freeze_first=False, status_label=None):
+        """
+        Applies an operation to the selected processes (or the given
+        (pid, create_time) pairs) on a worker thread after a single
+        confirmation. Processes whose PID now belongs to a process started
+        later are left out. Progress and the final summary go to
+        status_label (default: the label under the process buttons), and the
+        table is refreshed once when everything is done.
+        """
+        status_label = status_label or self.bulk_status_label
+        if self.bulk_worker is not None and self.bulk_worker.isRunning():
+            status_label.setText(self.lang.get('bulk_busy', "Another bulk action is still running."))
+            return
+        processes = self.selected_processes() if processes is None else processes
+        targets = []
+        for pid, create_time in processes:
+            row_data = self.process_snapshot.get(pid)
+            # Never signal ourselves, e.g. when killing the tree of the shell that started us.
+            if row_data is not None and row_data['create_time'] == create_time and pid != os.getpid():
+                targets.append((pid, row_data['name'], row_data['proc_object']))
+        if not targets:
+            if processes:
+                QMessageBox.warning(self, self.lang['title'], self.lang.get('no_such_process_error', "Process no longer exists."))
+            else:
+                QMessageBox.warning(self, self.lang['title'], self.lang.get('select_process_warning', "Please select a process."))
+            return
+        label = self.bulk_operation_label(operation, freeze_first, argument)
+        if operation != 'resume':
+            reply = QMessageBox.question(
+                self, self.lang['title'],
+                self.lang.get('bulk_confirm', "{action} {count} process(es)?\n{names}").format(
+                    action=label, count=len(targets), names=self.describe_targets([pid for pid, _, _ in targets])),
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        self.bulk_label = label
+        self.bulk_status_target = status_label
+        self.bulk_worker = BulkActionWorker(targets, operation, argument, freeze_first, self.grace_period_spin.value(), self.privileged_helper)
+        self.bulk_worker.progress.connect(self.show_bulk_progress)
+        self.bulk_worker.finished_actions.connect(self.finish_bulk_action)
+        self.show_bulk_progress(0, len(targets))
+        self.bulk_worker.start()
+
+    def bulk_operation_label(self, operation, freeze_first=False, argument=None):
+        if freeze_first:
+            return self.lang.get('kill_tree', "Kill Process Tree")
+        if operation == 'signal':
+            return signal.Signals(argument).name
+        return {
+            'stop': self.lang.get('graceful_stop', "End Process"),
+            'kill': self.lang.get('kill', "Kill"),
+            'terminate': self.lang.get('bulk_terminate', "Terminate"),
+            'suspend': self.lang.get('suspend_process', "Suspend"),
+            'resume': self.lang.get('resume_process', "Resume"),
+            'renice': self.lang.get('renice', "Renice"),
+            'affinity': self.lang.get('set_cpu_affinity', "Set CPU Affinity"),
+        }[operation]
+
+    def bulk_renice(self):
+        if not self.selected_pids():
+            return
+        value, ok = QInputDialog.getInt(self, self.lang.get('renice_title', "Change Priority"),
+                                        self.lang.get('bulk_renice_prompt', "Nice Value (-20 to 19):"), 0, -20, 19)
+        if ok:
+            self.run_bulk_action('renice', argument=value)
+
+    def kill_selected_trees(self):
+        """Kills the selected processes and all their descendants, freezing the whole tree first."""
+        processes = []
+        for pid, create_time in self.selected_processes():
+            row_data = self.process_snapshot.get(pid)
+            if row_data is None or row_data['create_time'] != create_time:
+                continue
+            processes.extend((child, self.process_snapshot[child]['create_time']) for child in self.descendant_pids(pid))
+        self.run_bulk_action('kill', list(dict.fromkeys(processes)), freeze_first=True)
+
+    def show_bulk_progress(self, done, total):
+        self.bulk_status_target.setText(self.lang.get('bulk_progress', "{action}: {done}/{total}").format(action=self.bulk_label, done=done, total=total))
+
+    def finish_bulk_action(self, results):
+        """Shows the outcome counts in the status label and each PID's result in its tooltip; no dialogs."""
+        outcome_texts = {outcome: self.lang.get(key, default) for outcome, key, default in BULK_OUTCOMES}
+        outcomes = Counter(outcome for _, outcome, _ in results.values())
+        counts = ", ".join(f"{outcomes[outcome]} {outcome_texts[outcome]}" for outcome, _, _ in BULK_OUTCOMES if outcomes[outcome])
+        self.bulk_status_target.setText(f"{self.bulk_label}: {counts}")
+        # Problems first, then the rest in PID order.
+        order = {outcome: index for index, (outcome, _, _) in enumerate(reversed(BULK_OUTCOMES))}
+        lines = [f"{pid} {name}: {outcome_texts[outcome]}" + (f" ({message})" if message else "")
+                 for pid, (name, outcome, message) in sorted(results.items(), key=lambda entry: (order[entry[1][1]], entry[0]))]
+        if len(lines) > RESULT_TOOLTIP_ROWS:
+            lines = lines[:RESULT_TOOLTIP_ROWS] + [self.lang.get('bulk_more_names', "and {count} more").format(count=len(lines) - RESULT_TOOLTIP_ROWS)]
+        self.bulk_status_target.setToolTip("\n".join(lines))
+        self.update_processes()
+        if self.pattern_table.isVisible():
+            self.update_pattern_preview()
@@ -0,0 +1,200 @@
+import os
+
+from procfs_linux import PROC_ROOT
+
+CGROUP_MOUNT = '/sys/fs/cgroup'
+
+def find_cgroup2_root(mount=CGROUP_MOUNT):
+    """
+    Returns the cgroup v2 mount point: the cgroupfs mount itself on unified
+    systems, or its 'unified' subdirectory on hybrid v1/v2 setups.
+    """
+    if os.path.exists(os.path.join(mount, 'cgroup.controllers')):
+        return mount
+    unified = os.path.join(mount, 'unified')
+    if os.path.isdir(unified):
+        return unified
+    return mount
+
+def read_pid_cgroup(pid):
+    """Returns the cgroup v2 path of a PID (e.g. '/system.slice/sshd.service'), or None if it has none."""
+    with open(os.path.join(PROC_ROOT, str(pid), 'cgroup'), 'rb') as f:
+        for line in f:
+            if line.startswith(b'0::'):
+                return line[3:].strip().decode(errors='replace')
+    return None
+
+def read_flat_keyed(path):
+    """Parses a flat-keyed cgroup file such as cpu.stat ('key value' per line)."""
+    values = {}
+    with open(path, 'rb') as f:
+        for line in f:
+            key, _, value = line.partition(b' ')
+            try:
+                values[key.decode()] = int(value)
+            except ValueError:
+                continue
+    return values
+
+def read_single_value(path):
+    with open(path, 'rb') as f:
+        value = f.read().strip()
+    return None if value == b'max' else int(value)
+
+def read_cgroup_stats(cgroup_path, root=None):
+    """
+    Reads the accounting files of one cgroup directly and returns a dict with
+    cpu_usec (cumulative), memory_current, io_rbytes, io_wbytes (cumulative,
+    summed over devices) and pids_current. Files a cgroup doesn't have (e.g.
+    a controller not enabled for it) come back as None.
+    """
+    directory = os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/'))
+    stats = {'cpu_usec': None, 'memory_current': None, 'io_rbytes': None, 'io_wbytes': None, 'pids_current': None}
+    try:
+        stats['cpu_usec'] = read_flat_keyed(os.path.join(directory, 'cpu.stat')).get('usage_usec')
+    except OSError:
+        pass
+    try:
+        stats['memory_current'] = read_single_value(os.path.join(directory, 'memory.current'))
+    except (OSError, ValueError):
+        pass
+    try:
+        stats['pids_current'] = read_single_value(os.path.join(directory, 'pids.current'))
+    except (OSError, ValueError):
+        pass
+    try:
+        rbytes = wbytes = 0
+        with open(os.path.join(directory, 'io.stat'), 'rb') as f:
+            # one line per device: "8:0 rbytes=... wbytes=... rios=... wios=..."
+            for line in f:
+                for field in line.split()[1:]:
+                    key, _, value = field.partition(b'=')
+                    if key == b'rbytes':
+                        rbytes += int(value)
+                    elif key == b'wbytes':
+                        wbytes += int(value)
+        stats['io_rbytes'], stats['io_wbytes'] = rbytes, wbytes
+    except (OSError, ValueError):
+        pass
+    return stats
+
+# Transient cgroups created for resource limits live under this directory of
+# the cgroup v2 root, one per limited process or process tree.
+LIMITS_PARENT = 'hel-process-limits'
+LIMIT_CONTROLLERS = ('cpu', 'memory', 'io')
+CPU_PERIOD_USEC = 100000
+
+def write_cgroup_file(directory, name, value):
+    with open(os.path.join(directory, name), 'w') as f:
+        f.write(value)
+
+def enable_controllers(directory):
+    """Enables the limit controllers for a cgroup's children, one at a time so a missing one doesn't block the others."""
+    for controller in LIMIT_CONTROLLERS:
+        try:
+            write_cgroup_file(directory, 'cgroup.subtree_control', f'+{controller}')
+        except OSError:
+            pass
+
+def create_transient_cgroup(name, root=None):
+    """
+    Creates LIMITS_PARENT/<name> below the cgroup v2 root (root defaults to
+    find_cgroup2_root(); pass a directory to work against a copy) with the
+    cpu, memory and io controllers enabled where available, and returns its
+    cgroup path. Raises OSError when the hierarchy can't be written.
+    """
+    root = root or find_cgroup2_root()
+    parent = os.path.join(root, LIMITS_PARENT)
+    enable_controllers(root)
+    os.makedirs(parent, exist_ok=True)
+    enable_controllers(parent)
+    os.makedirs(os.path.join(parent, name), exist_ok=True)
+    return f'/{LIMITS_PARENT}/{name}'
+
+def list_transient_cgroups(root=None):
+    """Returns the cgroup paths of the transient limit cgroups that currently exist."""
+    parent = os.path.join(root or find_cgroup2_root(), LIMITS_PARENT)
+    try:
+        return sorted(f'/{LIMITS_PARENT}/{entry.name}' for entry in os.scandir(parent) if entry.is_dir())
+    except OSError:
+        return []
+
+def is_cgroup_populated(cgroup_path, root=None):
+    """Returns whether a cgroup (or one of its children) still has processes; raises OSError if it can't be read."""
+    directory = os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/'))
+    return bool(read_flat_keyed(os.path.join(directory, 'cgroup.events')).get('populated', 1))
+
+def remove_cgroup_if_empty(cgroup_path, root=None):
+    """Removes a cgroup whose processes have all exited; returns True if it was removed."""
+    try:
+        if is_cgroup_populated(cgroup_path, root):
+            return False
+        os.rmdir(os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/')))
+        return True
+    except OSError:
+        return False
+
+def move_pids_to_cgroup(cgroup_path, pids, root=None):
+    """Moves whole processes into a cgroup; returns {pid: OSError} for the ones that couldn't be moved."""
+    procs = os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/'), 'cgroup.procs')
+    errors = {}
+    for pid in pids:
+        try:
+            # One PID per write(); the kernel rejects several in one call.
+            with open(procs, 'w') as f:
+                f.write(str(pid))
+        except OSError as e:
+            errors[pid] = e
+    return errors
+
+def write_cgroup_limits(cgroup_path, limits, root=None):
+    """
+    Writes the limits given in a dict to a cgroup; a None value lifts that
+    limit ('max'). Keys: cpu_percent (100 = one full CPU), memory_high and
+    memory_max (bytes) and io ({'major:minor': (read bytes/s, write bytes/s)}).
+    Keys left out are not touched. Raises OSError; a controller that isn't
+    enabled shows up as FileNotFoundError.
+    """
+    directory = os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/'))
+    if 'cpu_percent' in limits:
+        percent = limits['cpu_percent']
+        quota = 'max' if percent is None else str(max(1000, int(percent * CPU_PERIOD_USEC / 100)))
+        write_cgroup_file(directory, 'cpu.max', f'{quota} {CPU_PERIOD_USEC}')
+    for key, name in (('memory_high', 'memory.high'), ('memory_max', 'memory.max')):
+        if key in limits:
+            write_cgroup_file(directory, name, 'max' if limits[key] is None else str(int(limits[key])))
+    for device, (read_bps, write_bps) in limits.get('io', {}).items():
+        write_cgroup_file(directory, 'io.max', '{} rbps={} wbps={}'.format(
+            device, 'max' if read_bps is None else int(read_bps), 'max' if write_bps is None else int(write_bps)))
+
+def read_cgroup_limits(cgroup_path, root=None):
+    """
+    Reads back the limits of a cgroup in write_cgroup_limits' format, with
+    None for unlimited or unavailable values; io only lists limited devices.
+    """
+    directory = os.path.join(root or find_cgroup2_root(), cgroup_path.lstrip('/'))
+    limits = {'cpu_percent': None, 'memory_high': None, 'memory_max': None, 'io': {}}
+    try:
+        with open(os.path.join(directory, 'cpu.max'), 'rb') as f:
+            quota, period = f.read().split()[:2]  # "50000 100000" or "max 100000"
+        if quota != b'max':
+            limits['cpu_percent'] = int(quota) * 100 / int(period)
+    except (OSError, ValueError, IndexError):
+        pass
+    for key, name in (('memory_high', 'memory.high'), ('memory_max', 'memory.max')):
+        try:
+            limits[key] = read_single_value(os.path.join(directory, name))
+        except (OSError, ValueError):
+            pass
+    try:
+        with open(os.path.join(directory, 'io.max'), 'rb') as f:
+            # "8:0 rbps=1048576 wbps=max riops=max wiops=max"
+            for line in f:
+                parts = line.split()
+                fields = dict(part.partition(b'=')[::2] for part in parts[1:])
+                rates = tuple(None if fields.get(key, b'max') == b'max' else int(fields[key]) for key in (b'rbps', b'wbps'))
+                if rates != (None, None):
+                    limits['io'][parts[0].decode()] = rates
+    except (OSError, ValueError, IndexError):
+        pass
+    return limits
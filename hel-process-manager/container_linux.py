@@ -0,0 +1,74 @@
+import json
+import os
+import re
+
+# Container runtimes put each container in a cgroup whose last path components
+# carry the container ID, e.g.
+#   /system.slice/docker-<id>.scope               (docker, systemd driver)
+#   /docker/<id>                                  (docker, cgroupfs driver)
+#   /machine.slice/libpod-<id>.scope/container    (podman)
+#   /kubepods.slice/.../cri-containerd-<id>.scope (containerd / kubernetes)
+#   /kubepods/burstable/pod<uid>/<id>             (kubernetes, cgroupfs driver)
+#   /lxc.payload.<name>                           (lxc / incus)
+CONTAINER_PATTERNS = (
+    ('docker', re.compile(r'(?:/docker-|/docker/)([0-9a-f]{64})(?:\.scope)?(?:/|$)')),
+    ('podman', re.compile(r'/libpod-(?:conmon-)?([0-9a-f]{64})(?:\.scope)?(?:/|$)')),
+    ('cri-o', re.compile(r'/crio-(?:conmon-)?([0-9a-f]{64})(?:\.scope)?(?:/|$)')),
+    ('containerd', re.compile(r'/cri-containerd-([0-9a-f]{64})(?:\.scope)?(?:/|$)')),
+    ('kubernetes', re.compile(r'/kubepods[^/]*/(?:[^/]+/)*?([0-9a-f]{64})(?:/|$)')),
+    ('lxc', re.compile(r'/lxc\.payload\.([^/]+)')),
+)
+
+DOCKER_ROOT = '/var/lib/docker'
+PODMAN_CONTAINERS_JSON = (
+    '/var/lib/containers/storage/overlay-containers/containers.json',
+    os.path.expanduser('~/.local/share/containers/storage/overlay-containers/containers.json'),
+)
+
+def container_from_cgroup(cgroup_path):
+    """
+    Returns (runtime, container_id) for a cgroup v2 path that belongs to a
+    container, or None for host processes.
+    """
+    if not cgroup_path:
+        return None
+    for runtime, pattern in CONTAINER_PATTERNS:
+        match = pattern.search(cgroup_path)
+        if match:
+            return runtime, match.group(1)
+    return None
+
+def read_podman_names(paths=PODMAN_CONTAINERS_JSON):
+    """Returns {container_id: name} from podman's rootful and rootless container stores."""
+    names = {}
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                containers = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for container in containers:
+            if container.get('names'):
+                names[container['id']] = container['names'][0]
+    return names
+
+def lookup_container_name(runtime, container_id, podman_names=None):
+    """
+    Best-effort human name of a container, read from the runtime's on-disk
+    state without talking to its daemon. Falls back to the short ID (or the
+    lxc name, which is the ID) when the state isn't readable, e.g. unprivileged.
+    """
+    if runtime == 'lxc':
+        return container_id
+    if runtime == 'docker':
+        try:
+            with open(os.path.join(DOCKER_ROOT, 'containers', container_id, 'config.v2.json'), 'rb') as f:
+                return json.load(f).get('Name', '').lstrip('/') or container_id[:12]
+        except (OSError, ValueError):
+            pass
+    elif runtime == 'podman':
+        if podman_names is None:
+            podman_names = read_podman_names()
+        if container_id in podman_names:
+            return podman_names[container_id]
+    return container_id[:12]
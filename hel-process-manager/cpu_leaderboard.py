@@ -0,0 +1,74 @@
+import heapq
+from collections import deque
+from operator import itemgetter
+
+# Leaderboard windows in seconds (5, 15 and 60 minutes).
+LEADERBOARD_WINDOWS = (300, 900, 3600)
+BUCKET_SECONDS = 10
+
+class CpuTimeLeaderboard:
+    """
+    CPU seconds per process over sliding windows, including processes that
+    have since exited.
+
+    CPU time is added to fixed BUCKET_SECONDS buckets. Each window keeps a
+    running total per process plus the buckets it currently covers; when a
+    bucket slides out of a window its entries are subtracted once. Adding
+    time and querying a window therefore never rescan the history, and the
+    cost of expiry is proportional to what expires.
+    """
+    def __init__(self, windows=LEADERBOARD_WINDOWS, bucket_seconds=BUCKET_SECONDS):
+        self.windows = windows
+        self.bucket_seconds = bucket_seconds
+        self.current_index = None
+        self.current_bucket = None
+        self.window_buckets = {window: deque() for window in windows}  # (bucket index, {key: seconds})
+        self.totals = {window: {} for window in windows}
+        self.info = {}  # key -> (pid, name, cmdline)
+
+    def advance(self, now):
+        """Starts a new bucket if one is due and expires buckets that left each window."""
+        index = int(now // self.bucket_seconds)
+        if index != self.current_index:
+            self.current_index = index
+            self.current_bucket = {}
+            for buckets in self.window_buckets.values():
+                buckets.append((index, self.current_bucket))
+        longest = max(self.windows)
+        for window, buckets in self.window_buckets.items():
+            expired_up_to = index - window // self.bucket_seconds
+            totals = self.totals[window]
+            while buckets and buckets[0][0] <= expired_up_to:
+                for key, seconds in buckets.popleft()[1].items():
+                    remaining = totals[key] - seconds
+                    if remaining > 1e-9:
+                        totals[key] = remaining
+                    else:
+                        del totals[key]
+                        if window == longest:
+                            self.info.pop(key, None)
+
+    def add(self, key, seconds, now, info):
+        """Credits seconds of CPU time to a process; info is its (pid, name, cmdline)."""
+        if seconds <= 0:
+            return
+        self.advance(now)
+        self.info[key] = info
+        self.current_bucket[key] = self.current_bucket.get(key, 0.0) + seconds
+        for totals in self.totals.values():
+            totals[key] = totals.get(key, 0.0) + seconds
+
+    def top(self, window, count, now, by=None):
+        """
+        Returns the count largest entries of a window as (key, seconds), where
+        key is the process key, or by(key) when aggregating (e.g. by name).
+        """
+        self.advance(now)
+        totals = self.totals[window]
+        if by is not None:
+            grouped = {}
+            for key, seconds in totals.items():
+                group = by(key)
+                grouped[group] = grouped.get(group, 0.0) + seconds
+            totals = grouped
+        return heapq.nlargest(count, totals.items(), key=itemgetter(1))
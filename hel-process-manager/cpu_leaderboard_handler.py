@@ -0,0 +1,135 @@
+import time
+from PyQt5.QtWidgets import QTableWidgetItem
+
+from process_data_handler import NumericTableWidgetItem
+from cpu_leaderboard import LEADERBOARD_WINDOWS
+
+LEADERBOARD_ROWS = 100
+# Seconds a process that left the snapshot, or whose exit was credited, is
+# remembered so a late exit event or a lingering zombie row isn't counted twice.
+LEADERBOARD_GRACE = 60.0
+
+class CpuLeaderboardHandler:
+    def credit_cpu_time(self, now):
+        """
+        Feeds the leaderboard with the CPU time each process used since the
+        previous tick, taken from the collector's snapshot, plus the final
+        CPU time of processes that exited in between, taken from the
+        lifecycle tracker. Processes that already ran before the monitor
+        started only count from then on.
+
+        Both sources key processes by (pid, create_time). What was credited
+        to a process is kept for LEADERBOARD_GRACE seconds after it leaves
+        the snapshot, since the tracker may report its exit later, and a
+        process whose exit was credited is not credited again while it
+        lingers in the snapshot as a zombie.
+        """
+        events, self.leaderboard_seq = self.lifecycle_tracker.events_since(self.leaderboard_seq)
+        for event in events:
+            if event.kind != 'exit':
+                continue
+            key = (event.pid, event.create_time)
+            if key in self.leaderboard_exited:
+                continue
+            prev = self.leaderboard_prev.get(event.pid)
+            if prev is not None and prev[0] == key:
+                credited = prev[1]
+                del self.leaderboard_prev[event.pid]
+            elif event.create_time >= self.leaderboard_started:
+                credited = 0.0
+            else:
+                continue
+            self.leaderboard_exited[key] = now
+            self.cpu_leaderboard.add(key, event.cpu - credited, now, (event.pid, event.name, event.cmdline))
+
+        for pid, row_data in self.process_snapshot.items():
+            cpu_time = row_data['cpu_time']
+            if cpu_time is None:
+                continue
+            key = (pid, row_data['create_time'])
+            if key in self.leaderboard_exited:
+                continue
+            prev = self.leaderboard_prev.get(pid)
+            if prev is not None and prev[0] == key:
+                credited = prev[1]
+            elif row_data['create_time'] and row_data['create_time'] >= self.leaderboard_started:
+                credited = 0.0
+            else:
+                credited = cpu_time
+            self.cpu_leaderboard.add(key, cpu_time - credited, now, (pid, row_data['name'], row_data['exe'] or row_data['name']))
+            self.leaderboard_prev[pid] = (key, cpu_time, now)
+        expired = now - LEADERBOARD_GRACE
+        for pid in [pid for pid, prev in self.leaderboard_prev.items() if prev[2] < expired]:
+            del self.leaderboard_prev[pid]
+        for key in [key for key, credited_at in self.leaderboard_exited.items() if credited_at < expired]:
+            del self.leaderboard_exited[key]
+
+    def leaderboard_running(self, key):
+        """Whether the process behind a leaderboard key is still in the snapshot and hasn't exited."""
+        row_data = self.process_snapshot.get(key[0])
+        return row_data is not None and row_data['create_time'] == key[1] and key not in self.leaderboard_exited
+
+    def update_cpu_leaderboard(self):
+        now = time.monotonic()
+        self.credit_cpu_time(now)
+        if self.leaderboard_table.isVisible():
+            self.render_cpu_leaderboard(now)
+
+    def render_cpu_leaderboard(self, now=None):
+        now = time.monotonic() if now is None else now
+        window = self.leaderboard_window_selector.currentData()
+        by_name = self.leaderboard_by_name.isChecked()
+        info = self.cpu_leaderboard.info
+        group_of = (lambda key: info[key][1]) if by_name else None
+        top = self.cpu_leaderboard.top(window, LEADERBOARD_ROWS, now, by=group_of)
+
+        # The other windows' values for the same rows
+        window_totals = {}
+        for other in LEADERBOARD_WINDOWS:
+            totals = self.cpu_leaderboard.totals[other]
+            if by_name:
+                grouped = {}
+                for key, seconds in totals.items():
+                    grouped[info[key][1]] = grouped.get(info[key][1], 0.0) + seconds
+                totals = grouped
+            window_totals[other] = totals
+        if by_name:
+            process_counts = {}
+            running = set()
+            for key in self.cpu_leaderboard.totals[window]:
+                name = info[key][1]
+                process_counts[name] = process_counts.get(name, 0) + 1
+                if self.leaderboard_running(key):
+                    running.add(name)
+
+        exited_text = self.lang.get('leaderboard_exited', "Exited")
+        running_text = self.lang.get('leaderboard_running', "Running")
+        self.leaderboard_table.setSortingEnabled(False)
+        self.leaderboard_table.setRowCount(len(top))
+        for row, (key, _) in enumerate(top):
+            if by_name:
+                name, command = key, ""
+                count = process_counts.get(key, 0)
+                first = NumericTableWidgetItem(str(count), count)
+                alive = key in running
+            else:
+                pid, name, command = info[key]
+                first = NumericTableWidgetItem(str(pid), pid)
+                alive = self.leaderboard_running(key)
+            self.leaderboard_table.setItem(row, 0, first)
+            self.leaderboard_table.setItem(row, 1, QTableWidgetItem(name))
+            command_item = QTableWidgetItem(command)
+            command_item.setToolTip(command)
+            self.leaderboard_table.setItem(row, 2, command_item)
+            for col, other in enumerate(LEADERBOARD_WINDOWS, start=3):
+                seconds = window_totals[other].get(key, 0.0)
+                self.leaderboard_table.setItem(row, col, NumericTableWidgetItem(f"{seconds:.1f}", seconds))
+            self.leaderboard_table.setItem(row, 6, QTableWidgetItem(running_text if alive else exited_text))
+        self.leaderboard_table.setSortingEnabled(True)
+        self.update_leaderboard_headers()
+
+    def update_leaderboard_headers(self):
+        headers = list(self.lang.get('columns_leaderboard_table', ["PID", "Name", "Command", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Status"]))
+        if self.leaderboard_by_name.isChecked():
+            headers[0] = self.lang.get('leaderboard_processes', "Processes")
+        self.leaderboard_table.setHorizontalHeaderLabels(headers)
@@ -1,36 +1,157 @@
+import time
 from PyQt5.QtCore import QTimer
 import psutil
+import pyqtgraph as pg
+
+from procfs_linux import read_diskstats, list_whole_disks, list_stacked_devices, read_system_run_delay, read_pressure
+
+# Per-device series plotted on the Performance tab, in plot order.
+DISK_DEVICE_METRICS = ('iops', 'throughput', 'await', 'util', 'queue')
+SECTOR_SIZE = 512
 
 class GraphHandler:
     def init_graphs(self):
         self.timer = QTimer()
+        # The process snapshot is collected first so the views below see this tick's data.
+        self.timer.timeout.connect(self.refresh_snapshot)
+        self.timer.timeout.connect(self.sample_group_cgroups)
         self.timer.timeout.connect(self.update_graphs)
         self.timer.timeout.connect(self.update_system_info)
         self.timer.timeout.connect(self.update_network_activity)
         self.timer.timeout.connect(self.update_network_monitor)
         self.timer.timeout.connect(self.update_disk_io_graph)
+        self.timer.timeout.connect(self.update_run_delay_graph)
         self.timer.timeout.connect(self.update_status_bar)
+        self.timer.timeout.connect(self.update_thread_view)
+        self.timer.timeout.connect(self.update_inspect_detail)
+        self.timer.timeout.connect(self.update_lifecycle_view)
+        self.timer.timeout.connect(self.update_cpu_leaderboard)
+        self.timer.timeout.connect(self.update_alerts)
+        self.timer.timeout.connect(self.update_policy_log)
+        self.timer.timeout.connect(self.update_limits_view)
+        self.timer.timeout.connect(self.update_helper_status)
         self.timer.start(1000)
 
     def update_graphs(self):
-        self.cpu_data = self.cpu_data[-59:] + [psutil.cpu_percent()]
-        self.ram_data = self.ram_data[-59:] + [psutil.virtual_memory().percent]
+        # Also kept for the alert rules' sys.cpu and sys.mem.
+        self.system_sample = {'cpu': psutil.cpu_percent(), 'mem': psutil.virtual_memory().percent}
+        self.cpu_data = self.cpu_data[-59:] + [self.system_sample['cpu']]
+        self.ram_data = self.ram_data[-59:] + [self.system_sample['mem']]
         self.cpu_curve.setData(self.cpu_data)
         self.ram_curve.setData(self.ram_data)
 
     def update_disk_io_graph(self):
-        disk_io = psutil.disk_io_counters()
-        if disk_io:
-            read_speed = (disk_io.read_bytes - self.last_disk_read_bytes) / 1024
-            write_speed = (disk_io.write_bytes - self.last_disk_write_bytes) / 1024
-
-            self.disk_read_data = self.disk_read_data[-59:] + [read_speed]
-            self.disk_write_data = self.disk_write_data[-59:] + [write_speed]
-            self.disk_read_curve.setData(self.disk_read_data)
-            self.disk_write_curve.setData(self.disk_write_data)
-
-            self.last_disk_read_bytes = disk_io.read_bytes
-            self.last_disk_write_bytes = disk_io.write_bytes
+        try:
+            diskstats = read_diskstats()
+        except OSError:
+            diskstats = None
+
+        if diskstats is not None:
+            # One /proc/diskstats parse feeds both the aggregate and the per-device
+            # graphs. /sys/block is only listed again when a new device appears.
+            if self.whole_disks is None or not self.diskstats_devices.issuperset(diskstats):
+                try:
+                    self.whole_disks = list_whole_disks()
+                    # dm-*/md* I/O also shows up on the disks below them, so
+                    # the aggregate only counts the bottom of each stack.
+                    self.physical_disks = self.whole_disks - list_stacked_devices()
+                except OSError:
+                    self.whole_disks = self.physical_disks = set()
+            self.diskstats_devices = set(diskstats)
+            disks = {name: stats for name, stats in diskstats.items() if name in self.whole_disks}
+            physical = [stats for name, stats in disks.items() if name in self.physical_disks]
+            read_bytes = sum(stats['sectors_read'] for stats in physical) * SECTOR_SIZE
+            write_bytes = sum(stats['sectors_written'] for stats in physical) * SECTOR_SIZE
+            self.update_disk_device_graphs(disks)
         else:
-            self.disk_read_plot.setTitle(self.lang.get('disk_io_not_available', "Disk I/O Not Available"))
-            self.disk_write_plot.setTitle("")
+            disk_io = psutil.disk_io_counters()
+            if not disk_io:
+                self.disk_read_plot.setTitle(self.lang.get('disk_io_not_available', "Disk I/O Not Available"))
+                self.disk_write_plot.setTitle("")
+                return
+            read_bytes = disk_io.read_bytes
+            write_bytes = disk_io.write_bytes
+
+        read_speed = (read_bytes - self.last_disk_read_bytes) / 1024
+        write_speed = (write_bytes - self.last_disk_write_bytes) / 1024
+
+        self.disk_read_data = self.disk_read_data[-59:] + [read_speed]
+        self.disk_write_data = self.disk_write_data[-59:] + [write_speed]
+        self.disk_read_curve.setData(self.disk_read_data)
+        self.disk_write_curve.setData(self.disk_write_data)
+
+        self.last_disk_read_bytes = read_bytes
+        self.last_disk_write_bytes = write_bytes
+
+    def update_run_delay_graph(self):
+        """
+        Plots how long runnable tasks waited for a CPU, summed over all CPUs, in
+        ms per second. Kernels without schedstats fall back to the CPU pressure
+        stall time from PSI.
+        """
+        try:
+            run_delay = read_system_run_delay()
+        except (OSError, ValueError):
+            try:
+                run_delay = read_pressure('cpu')['some']['total'] * 1000
+                self.run_delay_plot.setTitle(self.lang.get('cpu_pressure_graph_title', "CPU Pressure Stall (ms/s)"))
+            except (OSError, KeyError, ValueError):
+                self.run_delay_plot.setTitle(self.lang.get('run_delay_not_available', "Run Queue Delay Not Available"))
+                return
+        now = time.monotonic()
+        if self.last_run_delay is not None:
+            prev_time, prev_delay = self.last_run_delay
+            elapsed = now - prev_time
+            if elapsed > 0:
+                self.run_delay_data = self.run_delay_data[-59:] + [max(run_delay - prev_delay, 0) / 1e6 / elapsed]
+                self.run_delay_curve.setData(self.run_delay_data)
+        self.last_run_delay = (now, run_delay)
+
+    def compute_disk_device_metrics(self, prev, curr, elapsed):
+        """
+        Derives IOPS, throughput (KB/s), average await (ms), utilisation (%) and
+        in-flight queue depth for one device from two /proc/diskstats samples.
+        """
+        ios = (curr['reads'] - prev['reads']) + (curr['writes'] - prev['writes'])
+        sectors = (curr['sectors_read'] - prev['sectors_read']) + (curr['sectors_written'] - prev['sectors_written'])
+        io_ms = (curr['ms_reading'] - prev['ms_reading']) + (curr['ms_writing'] - prev['ms_writing'])
+        busy_ms = curr['ms_io'] - prev['ms_io']
+        return {
+            'iops': max(ios, 0) / elapsed,
+            'throughput': max(sectors, 0) * SECTOR_SIZE / 1024 / elapsed,
+            'await': io_ms / ios if ios > 0 else 0.0,
+            'util': min(max(busy_ms, 0) / (elapsed * 10), 100.0),
+            'queue': curr['in_flight'],
+        }
+
+    def update_disk_device_graphs(self, disks):
+        now = time.monotonic()
+        prev_time, prev_disks = self.last_disk_device_sample
+        self.last_disk_device_sample = (now, disks)
+        if prev_time is None:
+            return
+        elapsed = now - prev_time
+        if elapsed <= 0:
+            return
+
+        for name in list(self.disk_device_data):
+            if name not in disks:
+                del self.disk_device_data[name]
+                for metric in DISK_DEVICE_METRICS:
+                    curve = self.disk_device_curves[metric].pop(name, None)
+                    if curve is not None:
+                        self.disk_device_plots[metric].removeItem(curve)
+
+        for name in sorted(disks):
+            if name not in prev_disks:
+                continue
+            metrics = self.compute_disk_device_metrics(prev_disks[name], disks[name], elapsed)
+            series = self.disk_device_data.setdefault(name, {metric: [] for metric in DISK_DEVICE_METRICS})
+            for metric in DISK_DEVICE_METRICS:
+                series[metric] = series[metric][-59:] + [metrics[metric]]
+                curve = self.disk_device_curves[metric].get(name)
+                if curve is None:
+                    pen = pg.intColor(sorted(disks).index(name), hues=max(len(disks), 1))
+                    curve = self.disk_device_plots[metric].plot(pen=pen, name=name)
+                    self.disk_device_curves[metric][name] = curve
+                curve.setData(series[metric])
@@ -0,0 +1,272 @@
+import os
+import time
+import numpy as np
+from PyQt5.QtWidgets import QTreeWidgetItem
+from PyQt5.QtCore import Qt
+
+from cgroup_linux import read_cgroup_stats, find_cgroup2_root
+from snapshot_columns import group_totals
+
+MB = 1024 * 1024
+
+# Grouping modes offered next to the search bar: (mode, lang key, default label)
+GROUP_MODES = (
+    ('none', 'group_by_none', "No Grouping"),
+    ('cgroup', 'group_by_cgroup', "Service / cgroup"),
+    ('container', 'group_by_container', "Container"),
+    ('user', 'group_by_user', "User"),
+    ('exe', 'group_by_exe', "Executable"),
+)
+# Modes aggregated with numpy over the columnar snapshot; the mode name is the code column.
+COLUMN_GROUP_MODES = ('user', 'exe')
+# A cgroup rate against a sample older than this would be an average over the
+# gap rather than a current rate, so it is shown as N/A instead.
+CGROUP_RATE_MAX_AGE = 5.0
+
+class SortableTreeWidgetItem(QTreeWidgetItem):
+    """Tree item that sorts numeric columns by value rather than by display text."""
+    def __init__(self, texts):
+        super().__init__(texts)
+        self.sort_values = {}
+
+    def set_value(self, column, text, value):
+        self.setText(column, text)
+        self.sort_values[column] = value if value is not None else float('-inf')
+
+    def __lt__(self, other):
+        column = self.treeWidget().sortColumn() if self.treeWidget() else 0
+        if column in self.sort_values and isinstance(other, SortableTreeWidgetItem) and column in other.sort_values:
+            return self.sort_values[column] < other.sort_values[column]
+        return super().__lt__(other)
+
+class GroupViewHandler:
+    def change_group_mode(self):
+        self.group_mode = self.group_mode_selector.currentData()
+        grouped = self.group_mode != 'none'
+        self.table.setVisible(not grouped)
+        self.group_tree.setVisible(grouped)
+        self.group_expanded = set()
+        self.render_process_table()
+
+    def remember_group_expanded(self, item):
+        key = item.data(0, Qt.UserRole)
+        if key is not None and item.parent() is None:
+            if item.isExpanded():
+                self.group_expanded.add(key)
+                self.populate_group(item)
+            else:
+                self.group_expanded.discard(key)
+
+    def group_key(self, row_data):
+        """Returns the group a process belongs to in the current mode."""
+        if self.group_mode == 'cgroup':
+            return row_data.get('cgroup')
+        if self.group_mode == 'container':
+            return row_data['container'][0] if row_data.get('container') else None
+        return None
+
+    def group_label(self, key, rows):
+        """Returns (display name, tooltip) of a group row."""
+        not_available = self.lang.get('not_available', 'N/A')
+        if self.group_mode == 'user':
+            return key or not_available, key or not_available
+        if self.group_mode == 'exe':
+            # '[name]' keys (kernel threads) are not paths
+            return (key if key.startswith('[') else os.path.basename(key) or key), key
+        if self.group_mode == 'container':
+            if key is None:
+                return self.lang.get('container_host', "Host"), self.lang.get('container_host', "Host")
+            container_id, name, runtime = rows[0]['container']
+            return name, f"{runtime}: {container_id}"
+        if key is None:
+            return not_available, not_available
+        return os.path.basename(key.rstrip('/')) or key, key
+
+    def group_cgroup_paths(self, members):
+        """
+        Returns {group key: cgroup path} whose accounting files describe the
+        whole group. A container's processes may sit in sub-cgroups of the
+        container's own (podman's /container, pod hierarchies), so the common
+        ancestor of its members' cgroups is used.
+        """
+        if self.group_mode == 'cgroup':
+            return {key: key for key in members if key is not None}
+        if self.group_mode == 'container':
+            paths = {}
+            for key, rows in members.items():
+                cgroups = [row_data['cgroup'] for row_data in rows if row_data.get('cgroup')]
+                if key is not None and cgroups:
+                    paths[key] = os.path.commonpath(cgroups)
+            return paths
+        return {}
+
+    def sum_member_stats(self, rows):
+        """Rollup from the processes themselves, for groups without a cgroup of their own (e.g. the host)."""
+        cpu = memory = read_rate = write_rate = 0.0
+        for row_data in rows:
+            cpu += row_data['cpu']
+            memory += row_data['rss'] or 0
+            if row_data['io_rates']:
+                read_rate += row_data['io_rates'][0]
+                write_rate += row_data['io_rates'][1]
+        return cpu, memory, read_rate, write_rate, len(rows)
+
+    def collect_cgroup_stats(self, cgroup_paths, now, prev=None):
+        """
+        Reads CPU, memory, I/O and pid accounting straight from each cgroup's
+        own files rather than summing its processes, which is both cheaper and
+        correct for short-lived children. Returns {path: (cpu_percent,
+        memory_bytes, read_kbps, write_kbps, pids)} with None where missing.
+        prev holds the counters of the previous call (default: the group view's).
+        Rates are None until there is a previous sample younger than
+        CGROUP_RATE_MAX_AGE.
+        """
+        prev = self.cgroup_prev if prev is None else prev
+        if self.cgroup_root is None:
+            self.cgroup_root = find_cgroup2_root()
+        stats = {}
+        for path in cgroup_paths:
+            raw = read_cgroup_stats(path, self.cgroup_root)
+            counters = (raw['cpu_usec'] or 0, raw['io_rbytes'] or 0, raw['io_wbytes'] or 0)
+            if path in prev and now - prev[path][0] > CGROUP_RATE_MAX_AGE:
+                del prev[path]
+            fresh = path in prev
+            cpu_rate, read_rate, write_rate = self.sample_counter_rates(prev, path, now, counters)
+            stats[path] = (
+                cpu_rate / 1e4 if fresh and raw['cpu_usec'] is not None else None,
+                raw['memory_current'],
+                read_rate / 1024 if fresh and raw['io_rbytes'] is not None else None,
+                write_rate / 1024 if fresh and raw['io_wbytes'] is not None else None,
+                raw['pids_current'],
+            )
+        for path in list(prev):
+            if path not in stats:
+                del prev[path]
+        return stats
+
+    def sample_group_cgroups(self):
+        """Samples the cgroup counters of the visible group view on every tick, so a Refresh shows current rates."""
+        if self.group_mode in COLUMN_GROUP_MODES or self.group_mode == 'none' or not self.group_tree.isVisible():
+            return
+        members = {}
+        for row_data in self.process_snapshot.values():
+            members.setdefault(self.group_key(row_data), []).append(row_data)
+        self.collect_cgroup_stats(set(self.group_cgroup_paths(members).values()), time.monotonic())
+
+    def rollup_cgroup_groups(self, processes_data):
+        """
+        Groups for the cgroup and container modes, totalled from each group's
+        cgroup files. Yields (key, label, tooltip, stats, member pids).
+        """
+        members = {}
+        for row_data in processes_data:
+            members.setdefault(self.group_key(row_data), []).append(row_data)
+
+        cgroup_paths = self.group_cgroup_paths(members)
+        cgroup_stats = self.collect_cgroup_stats(set(cgroup_paths.values()), time.monotonic())
+        for key, rows in members.items():
+            if key in cgroup_paths:
+                stats = cgroup_stats[cgroup_paths[key]]
+            else:
+                stats = self.sum_member_stats(rows)
+            label, tooltip = self.group_label(key, rows)
+            yield key, label, tooltip, stats, [row_data['pid'] for row_data in rows]
+
+    def rollup_column_groups(self, processes_data):
+        """
+        Groups for the user and executable modes, computed as one bincount per
+        metric over the columnar snapshot; only the membership of expanded
+        groups is ever turned back into rows. Yields the same tuples as
+        rollup_cgroup_groups.
+        """
+        columns = self.process_columns
+        codes = columns[self.group_mode]
+        pids = columns['pid']
+        values = columns
+        if len(processes_data) != len(pids):
+            # The search bar filtered some processes out.
+            mask = np.isin(pids, np.fromiter((row_data['pid'] for row_data in processes_data), np.int64, len(processes_data)))
+            codes, pids = codes[mask], pids[mask]
+            values = {name: column[mask] for name, column in columns.items()}
+
+        totals = group_totals(codes, values)
+        present = np.flatnonzero(totals['count'])
+        # Sorting by code lines the members of each group up in code order,
+        # which is also the order of `present`.
+        members = np.split(pids[np.argsort(codes, kind='stable')], np.cumsum(totals['count'][present])[:-1])
+        labels = self.group_interners[self.group_mode].labels
+        for code, member_pids in zip(present.tolist(), members):
+            key = labels[code]
+            label, tooltip = self.group_label(key, None)
+            stats = (totals['cpu'][code], totals['rss'][code], totals['read'][code], totals['write'][code], int(totals['count'][code]))
+            yield key, label, tooltip, stats, member_pids.tolist()
+
+    def populate_group(self, group_item):
+        """Adds the process rows of a group the first time it is expanded."""
+        if group_item.childCount():
+            return
+        not_available = self.lang.get('not_available', 'N/A')
+
+        def fmt(value):
+            return f"{value:.1f}" if value is not None else not_available
+
+        sorting = self.group_tree.isSortingEnabled()
+        self.group_tree.setSortingEnabled(False)
+        for pid in self.group_members.get(group_item.data(0, Qt.UserRole), ()):
+            row_data = self.group_snapshot.get(pid)
+            if row_data is None:
+                continue
+            io_rates = row_data['io_rates'] or (None, None, None)
+            rss = row_data['rss']
+            child = SortableTreeWidgetItem([row_data['name']])
+            child.set_value(1, str(row_data['pid']), row_data['pid'])
+            child.setData(1, Qt.UserRole, row_data['pid'])
+            child.set_value(3, fmt(row_data['cpu']), row_data['cpu'])
+            child.set_value(4, fmt(rss / MB if rss is not None else None), rss)
+            child.set_value(5, fmt(io_rates[0]), io_rates[0])
+            child.set_value(6, fmt(io_rates[1]), io_rates[1])
+            group_item.addChild(child)
+        self.group_tree.setSortingEnabled(sorting)
+
+    def render_group_view(self, processes_data):
+        """
+        Rebuilds the group tree. Only group rows are created up front; a
+        group's processes are added when it is (or stays) expanded, so a
+        20k-process snapshot costs one tree item per group per tick.
+        """
+        not_available = self.lang.get('not_available', 'N/A')
+        if self.group_mode in COLUMN_GROUP_MODES:
+            groups = self.rollup_column_groups(processes_data)
+        else:
+            groups = self.rollup_cgroup_groups(processes_data)
+
+        def fmt(value, pattern="{:.1f}"):
+            return pattern.format(value) if value is not None else not_available
+
+        self.group_tree.setSortingEnabled(False)
+        self.group_tree.clear()
+        self.group_members = {}
+        self.group_snapshot = self.process_snapshot
+        expanded_items = []
+        for key, label, tooltip, stats, member_pids in groups:
+            cpu, memory, read_rate, write_rate, pids = stats
+            # The ungrouped remainder (None) is stored as '' so its expansion is remembered too
+            stored_key = key if key is not None else ''
+            self.group_members[stored_key] = member_pids
+            group_item = SortableTreeWidgetItem([label])
+            group_item.setData(0, Qt.UserRole, stored_key)
+            group_item.setToolTip(0, tooltip)
+            group_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            count = pids if pids is not None else len(member_pids)
+            group_item.set_value(2, str(count), count)
+            group_item.set_value(3, fmt(cpu), cpu)
+            group_item.set_value(4, fmt(memory / MB if memory is not None else None), memory)
+            group_item.set_value(5, fmt(read_rate), read_rate)
+            group_item.set_value(6, fmt(write_rate), write_rate)
+            self.group_tree.addTopLevelItem(group_item)
+            if stored_key in self.group_expanded:
+                expanded_items.append(group_item)
+        for group_item in expanded_items:
+            self.populate_group(group_item)
+            group_item.setExpanded(True)
+        self.group_tree.setSortingEnabled(True)
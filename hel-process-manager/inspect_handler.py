@@ -1,48 +1,86 @@
 import psutil
 from PyQt5.QtWidgets import QMessageBox
 
+from memory_map import MemoryMapDialog
+from inspect_panel import InspectPanel
+from procfs_linux import count_pid_fds
+
 class InspectHandler:
     def inspect_process(self):
         proc = self.get_selected_process_object()
         if proc is None:
             return
+        if self.inspect_panel is None:
+            self.inspect_panel = InspectPanel(self, self.lang, self.privileged_helper)
         try:
-            info = self.lang.get('inspect_pid', "PID: {pid}\n").format(pid=proc.pid)
-            info += self.lang.get('inspect_name', "Name: {name}\n").format(name=proc.name())
-            info += self.lang.get('inspect_exe', "Executable: {exe}\n").format(exe=proc.exe() if proc.exe() else self.lang.get('not_available', 'N/A'))
-            info += self.lang.get('inspect_status', "Status: {status}\n").format(status=proc.status())
-            info += self.lang.get('inspect_threads', "Threads: {threads}\n").format(threads=proc.num_threads())
-            info += self.lang.get('inspect_user', "User: {user}\n").format(user=proc.username())
-            info += self.lang.get('inspect_ppid', "Parent PID: {ppid}\n").format(ppid=proc.ppid())
-            info += self.lang.get('inspect_cwd', "CWD: {cwd}\n").format(cwd=proc.cwd() if proc.cwd() else self.lang.get('not_available', 'N/A'))
-            info += self.lang.get('inspect_cmdline', "Command Line: {cmdline}\n").format(cmdline=' '.join(proc.cmdline()) if proc.cmdline() else self.lang.get('not_available', 'N/A'))
-            open_files_info = []
-            try:
-                for f in proc.open_files():
-                    open_files_info.append(f.path)
-                info += self.lang.get('inspect_open_files', "\nOpen Files ({count}):\n{files}\n").format(
-                    count=len(open_files_info), files='\n'.join(open_files_info) if open_files_info else self.lang.get('none', 'None'))
-            except psutil.AccessDenied:
-                info += self.lang.get('inspect_open_files_denied', "\nOpen Files: Permission Denied\n")
-            except Exception as e:
-                info += self.lang.get('inspect_open_files_error', "\nOpen Files: Error retrieving ({error})\n").format(error=e)
-            connections_info = []
-            try:
-                for conn in proc.connections():
-                    laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
-                    raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
-                    connections_info.append(f"  {conn.status} Local: {laddr}, Remote: {raddr}")
-                info += self.lang.get('inspect_connections', "\nConnections ({count}):\n{conns}\n").format(
-                    count=len(connections_info), conns='\n'.join(connections_info) if connections_info else self.lang.get('none', 'None'))
-            except psutil.AccessDenied:
-                info += self.lang.get('inspect_connections_denied', "\nConnections: Permission Denied\n")
-            except Exception as e:
-                info += self.lang.get('inspect_connections_error', "\nConnections: Error retrieving ({error})\n").format(error=e)
-            QMessageBox.information(self, self.lang.get('inspect_dialog_title', "Process Details"), info)
+            self.inspect_panel.load(proc)
         except psutil.NoSuchProcess:
             QMessageBox.warning(self, self.lang['title'], self.lang.get('no_such_process_error', "Process no longer exists."))
             self.update_processes()
+            return
         except psutil.AccessDenied:
             QMessageBox.critical(self, self.lang['title'], self.lang.get('permission_denied_error', "Permission denied to inspect this process. Try running as administrator/root."))
+            return
         except Exception as e:
             QMessageBox.critical(self, self.lang['title'], self.lang.get('inspect_error', "An error occurred while trying to inspect the process: {e}").format(e=e))
+            return
+        self.inspect_panel.show()
+        self.inspect_panel.raise_()
+
+    def on_inspect_selection_changed(self):
+        # An open panel follows the selection; loading the new process cancels
+        # whatever the panel was still fetching for the old one.
+        if self.inspect_panel is None or not self.inspect_panel.isVisible():
+            return
+        pid = self.selected_pid()
+        if pid is None or pid == self.inspect_panel.pid:
+            return
+        try:
+            self.inspect_panel.load(psutil.Process(pid))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    def update_inspect_detail(self):
+        """
+        Feeds the inspect panel's sparklines. Everything except the fd count
+        comes from the snapshot the collector just took, so an open panel
+        costs one extra read per tick rather than a second scan.
+        """
+        panel = self.inspect_panel
+        if panel is None or not panel.isVisible() or panel.pid is None:
+            return
+        row = self.process_snapshot.get(panel.pid)
+        if row is None:
+            return
+        view = panel.detail_view
+        values = {'cpu': row['cpu']}
+        if row['rss'] is not None:
+            values['rss'] = row['rss'] / (1024 * 1024)
+        if row['io_rates']:
+            values['read'], values['write'], _ = row['io_rates']
+        if isinstance(row['threads'], int):
+            values['threads'] = row['threads']
+        if row['ctx_switches']:
+            ctx_total = sum(row['ctx_switches'])
+            if view.prev_ctx is not None:
+                prev_time, prev_total = view.prev_ctx
+                elapsed = self.process_snapshot_time - prev_time
+                if elapsed > 0:
+                    values['ctx'] = max(ctx_total - prev_total, 0) / elapsed
+            view.prev_ctx = (self.process_snapshot_time, ctx_total)
+        try:
+            values['fds'] = count_pid_fds(panel.pid)
+        except OSError:
+            pass
+        view.add_sample(values)
+
+    def inspect_memory_map(self):
+        proc = self.get_selected_process_object()
+        if proc is None:
+            return
+        try:
+            name = proc.name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            name = self.lang.get('not_available', 'N/A')
+        dialog = MemoryMapDialog(self, self.lang, proc.pid, name)
+        dialog.show()
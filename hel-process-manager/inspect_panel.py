@@ -0,0 +1,325 @@
+import os
+import psutil
+from PyQt5.QtWidgets import (
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget,
+    QPushButton, QTabWidget, QTextEdit
+)
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from procfs_linux import PROC_ROOT
+from process_detail import ProcessDetailView
+
+PAGE_SIZE = 500
+CHUNK_SIZE = 5000
+
+def iter_open_fds(proc):
+    """Yields chunks of 'fd -> target' lines, reading /proc/<pid>/fd lazily so huge fd tables can be cancelled."""
+    fd_dir = os.path.join(PROC_ROOT, str(proc.pid), 'fd')
+    if not os.path.isdir(PROC_ROOT):
+        yield [f.path for f in proc.open_files()]
+        return
+    chunk = []
+    with os.scandir(fd_dir) as entries:
+        for entry in entries:
+            try:
+                chunk.append(f"{entry.name} -> {os.readlink(entry.path)}")
+            except OSError:
+                continue  # closed while we were listing
+            if len(chunk) >= CHUNK_SIZE:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+def iter_connections(proc):
+    connections = proc.net_connections() if hasattr(proc, 'net_connections') else proc.connections()
+    lines = []
+    for conn in connections:
+        laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
+        raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
+        lines.append(f"{conn.status} Local: {laddr}, Remote: {raddr}")
+    yield lines
+
+def privileged_loaders(helper):
+    """Returns fallbacks of iter_open_fds and iter_connections that go through the privileged helper."""
+    def check_helper(proc):
+        if not helper.connected:
+            raise psutil.AccessDenied(proc.pid)
+
+    def iter_helper_fds(proc):
+        check_helper(proc)
+        yield helper.open_fds(proc.pid, proc.create_time())
+
+    def iter_helper_connections(proc):
+        check_helper(proc)
+        yield [f"{status} Local: {laddr}, Remote: {raddr}" for status, laddr, raddr in helper.connections(proc.pid, proc.create_time())]
+
+    return iter_helper_fds, iter_helper_connections
+
+def iter_environment(proc):
+    yield [f"{key}={value}" for key, value in sorted(proc.environ().items())]
+
+def iter_limits(proc):
+    limits_path = os.path.join(PROC_ROOT, str(proc.pid), 'limits')
+    with open(limits_path, 'r') as f:
+        yield [line.rstrip() for line in f if line.strip()]
+
+class SectionLoader(QThread):
+    """
+    Runs one section's loader generator off the UI thread, emitting each
+    chunk as it arrives. If the loader is denied access, privileged_loader
+    (when given) is tried instead.
+    """
+    chunk = pyqtSignal(list)
+    done = pyqtSignal()
+    failed = pyqtSignal(str, str)  # kind ('denied', 'gone' or 'error'), message
+
+    def __init__(self, loader, proc, privileged_loader=None):
+        super().__init__()
+        self.loader = loader
+        self.proc = proc
+        self.privileged_loader = privileged_loader
+
+    def run(self):
+        try:
+            try:
+                self.emit_chunks(self.loader)
+            except (psutil.AccessDenied, PermissionError):
+                if self.privileged_loader is None:
+                    raise
+                self.emit_chunks(self.privileged_loader)
+        except (psutil.AccessDenied, PermissionError) as e:
+            self.failed.emit('denied', str(e))
+        except (psutil.NoSuchProcess, FileNotFoundError) as e:
+            self.failed.emit('gone', str(e))
+        except Exception as e:
+            self.failed.emit('error', str(e))
+        else:
+            if not self.isInterruptionRequested():
+                self.done.emit()
+
+    def emit_chunks(self, loader):
+        for lines in loader(self.proc):
+            if self.isInterruptionRequested():
+                return
+            self.chunk.emit(lines)
+
+class InspectSection(QWidget):
+    """A filterable, paginated list that is filled in the background the first time it is shown."""
+    def __init__(self, lang, loader, privileged_loader=None):
+        super().__init__()
+        self.lang = lang
+        self.loader = loader
+        self.privileged_loader = privileged_loader
+        self.items = []
+        self.filtered = []
+        self.page = 0
+        self.worker = None
+        self.retired_workers = set()
+        self.loading = False
+        self.loaded = False
+        self.proc = None
+
+        layout = QVBoxLayout(self)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText(lang.get('inspect_filter', "Filter..."))
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        layout.addWidget(self.filter_edit)
+        self.list_widget = QListWidget()
+        layout.addWidget(self.list_widget)
+
+        pager = QHBoxLayout()
+        self.prev_btn = QPushButton(lang.get('prev_page', "Previous"))
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.page - 1))
+        pager.addWidget(self.prev_btn)
+        self.page_label = QLabel("")
+        pager.addWidget(self.page_label, 1)
+        self.next_btn = QPushButton(lang.get('next_page', "Next"))
+        self.next_btn.clicked.connect(lambda: self.show_page(self.page + 1))
+        pager.addWidget(self.next_btn)
+        layout.addLayout(pager)
+
+    def reset(self, proc):
+        """Cancels any running load and points the section at a new process."""
+        self.cancel()
+        self.proc = proc
+        self.loaded = False
+        self.items = []
+        self.filtered = []
+        self.page = 0
+        self.list_widget.clear()
+        self.page_label.setText("")
+
+    def ensure_loaded(self):
+        if self.proc is None or self.loading or self.loaded:
+            return
+        self.loading = True
+        self.worker = SectionLoader(self.loader, self.proc, self.privileged_loader)
+        self.worker.chunk.connect(self.add_chunk)
+        self.worker.done.connect(self.load_finished)
+        self.worker.failed.connect(self.load_failed)
+        self.worker.start()
+        self.update_page_label()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.chunk.disconnect()
+            self.worker.done.disconnect()
+            self.worker.failed.disconnect()
+            self.worker.requestInterruption()
+            # Keep the thread object alive until it actually returns.
+            retired = self.worker
+            self.retired_workers.add(retired)
+            retired.finished.connect(lambda: self.retired_workers.discard(retired))
+            self.worker = None
+        self.loading = False
+
+    def matches(self, line):
+        text = self.filter_edit.text().lower()
+        return not text or text in line.lower()
+
+    def add_chunk(self, lines):
+        self.items.extend(lines)
+        page_was_full = len(self.filtered) >= (self.page + 1) * PAGE_SIZE
+        self.filtered.extend(line for line in lines if self.matches(line))
+        if not page_was_full:
+            self.show_page(self.page)
+        else:
+            self.update_page_label()
+
+    def load_finished(self):
+        self.loading = False
+        self.loaded = True
+        self.worker = None
+        self.show_page(self.page)
+
+    def load_failed(self, kind, message):
+        self.loading = False
+        self.loaded = True
+        self.worker = None
+        if kind == 'denied':
+            text = self.lang.get('inspect_section_denied', "Permission Denied")
+        elif kind == 'gone':
+            text = self.lang.get('no_such_process_error', "Process no longer exists.")
+        else:
+            text = self.lang.get('inspect_section_error', "Error retrieving ({error})").format(error=message)
+        self.list_widget.clear()
+        self.page_label.setText(text)
+
+    def apply_filter(self):
+        self.filtered = [line for line in self.items if self.matches(line)]
+        self.show_page(0)
+
+    def page_count(self):
+        return max((len(self.filtered) + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+
+    def show_page(self, page):
+        self.page = min(max(page, 0), self.page_count() - 1)
+        start = self.page * PAGE_SIZE
+        self.list_widget.clear()
+        self.list_widget.addItems(self.filtered[start:start + PAGE_SIZE])
+        self.update_page_label()
+
+    def update_page_label(self):
+        if self.loading:
+            text = self.lang.get('inspect_loading', "Loading... {count} items").format(count=len(self.items))
+        else:
+            text = self.lang.get('inspect_page', "Page {page}/{pages} ({count} items)").format(page=self.page + 1, pages=self.page_count(), count=len(self.filtered))
+        self.page_label.setText(text)
+        self.prev_btn.setEnabled(self.page > 0)
+        self.next_btn.setEnabled(self.page < self.page_count() - 1)
+
+class InspectPanel(QDialog):
+    """
+    Non-modal process details. Basic fields are read in one oneshot() when a
+    process is loaded and live sparklines are fed on every tick; the heavier
+    sections load in the background the first time their tab is opened and
+    are cancelled when another process is loaded.
+    """
+    def __init__(self, parent, lang, helper):
+        super().__init__(parent)
+        self.lang = lang
+        self.pid = None
+        self.resize(800, 600)
+
+        layout = QVBoxLayout(self)
+        self.basic_info = QTextEdit()
+        self.basic_info.setReadOnly(True)
+        self.basic_info.setMaximumHeight(200)
+        layout.addWidget(self.basic_info)
+        self.detail_view = ProcessDetailView(lang)
+        layout.addWidget(self.detail_view)
+
+        self.section_tabs = QTabWidget()
+        iter_helper_fds, iter_helper_connections = privileged_loaders(helper)
+        self.sections = [
+            (InspectSection(lang, iter_open_fds, iter_helper_fds), lang.get('inspect_section_open_files', "Open Files")),
+            (InspectSection(lang, iter_connections, iter_helper_connections), lang.get('inspect_section_connections', "Connections")),
+            (InspectSection(lang, iter_environment), lang.get('inspect_section_environment', "Environment")),
+            (InspectSection(lang, iter_limits), lang.get('inspect_section_limits', "Limits")),
+        ]
+        for section, title in self.sections:
+            self.section_tabs.addTab(section, title)
+        self.section_tabs.currentChanged.connect(self.load_current_section)
+        layout.addWidget(self.section_tabs)
+
+    def read_basic_info(self, proc):
+        """Reads the summary fields with a single oneshot(); fields we may not read show as denied."""
+        not_available = self.lang.get('not_available', 'N/A')
+        denied = self.lang.get('permission_denied', "Permission Denied / N/A")
+
+        def field(getter):
+            try:
+                return getter()
+            except psutil.AccessDenied:
+                return denied
+
+        with proc.oneshot():
+            name = proc.name()
+            exe = field(proc.exe)
+            status = proc.status()
+            threads = proc.num_threads()
+            user = field(proc.username)
+            ppid = proc.ppid()
+            cwd = field(proc.cwd)
+            cmdline = field(proc.cmdline)
+        if isinstance(cmdline, list):
+            cmdline = ' '.join(cmdline)
+
+        info = self.lang.get('inspect_pid', "PID: {pid}\n").format(pid=proc.pid)
+        info += self.lang.get('inspect_name', "Name: {name}\n").format(name=name)
+        info += self.lang.get('inspect_exe', "Executable: {exe}\n").format(exe=exe or not_available)
+        info += self.lang.get('inspect_status', "Status: {status}\n").format(status=status)
+        info += self.lang.get('inspect_threads', "Threads: {threads}\n").format(threads=threads)
+        info += self.lang.get('inspect_user', "User: {user}\n").format(user=user)
+        info += self.lang.get('inspect_ppid', "Parent PID: {ppid}\n").format(ppid=ppid)
+        info += self.lang.get('inspect_cwd', "CWD: {cwd}\n").format(cwd=cwd or not_available)
+        info += self.lang.get('inspect_cmdline', "Command Line: {cmdline}\n").format(cmdline=cmdline or not_available)
+        return name, info
+
+    def load(self, proc):
+        """Shows a new process; raises psutil.NoSuchProcess if it already exited."""
+        name, info = self.read_basic_info(proc)
+        self.pid = proc.pid
+        self.setWindowTitle(f"{self.lang.get('inspect_dialog_title', 'Process Details')} - {name} ({proc.pid})")
+        self.basic_info.setPlainText(info)
+        self.detail_view.reset()
+        for section, _ in self.sections:
+            section.reset(proc)
+        self.load_current_section()
+
+    def load_current_section(self):
+        if self.isVisible():
+            self.section_tabs.currentWidget().ensure_loaded()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.load_current_section()
+
+    def done(self, result):
+        # Closing (or Esc) drops the loaded data; the next Inspect starts fresh.
+        # Hiding along with a minimised parent keeps it.
+        for section, _ in self.sections:
+            section.reset(None)
+        self.pid = None
+        super().done(result)
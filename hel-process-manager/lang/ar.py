@@ -20,7 +20,7 @@ lang = {
     "tab_about": "حول",
 
     # تم تصحيح المفتاح ليتطابق مع الكود البرمجي (كان "columns" وأصبح "columns_process_table")
-    "columns_process_table": ["PID", "الاسم", "المعالج %", "الذاكرة %", "المستخدم", "معرف الأب", "وقت البدء", "المسار", "الخيوط", "الحالة"],
+    "columns_process_table": ["PID", "الاسم", "المعالج %", "الذاكرة %", "المستخدم", "معرف الأب", "وقت البدء", "المسار", "الخيوط", "الحالة", "قراءة KB/ث", "كتابة KB/ث", "عمليات I/O/ث", "RSS ميجا", "PSS ميجا", "USS ميجا", "التبديل ميجا", "انتظار التشغيل مللي/ث", "تبديل طوعي/ث", "تبديل قسري/ث", "آخر معالج", "أخطاء صفحات ثانوية/ث", "أخطاء صفحات رئيسية/ث", "درجة OOM", "ضغط الذاكرة", "الحاوية", "معرف الحاوية", "PID في النطاق", "النمو MB/س", "امتلاء الذاكرة خلال", "NUMA محلي %"],
 
     # مفاتيح الأعمدة الفردية لم تعد ضرورية إذا كنا نستخدم قائمة واحدة للأعمدة
     # "start_time_col": "وقت البدء",
@@ -140,4 +140,160 @@ lang = {
     "startup_info_placeholder": "قائمة برامج بدء التشغيل معقدة وتعتمد على نظام التشغيل.\\nيوفر psutil وصولاً مباشراً محدوداً لهذا الغرض.\\n\\nعلى ويندوز، يتضمن الأمر غالبًا مفاتيح السجل ومجلدات بدء التشغيل.\\nعلى لينكس، يتضمن الأمر systemd و XDG autostart ومديري الجلسات.\\n\\nتتطلب هذه الميزة تطبيقات خاصة بكل نظام.",
     "startup_error": "خطأ في استرداد برامج بدء التشغيل: {e}",
     "startup_feature_note": "هذه الميزة هي مكان مؤقت وتتطلب تطبيقًا خاصًا بالنظام لتمكين/تعطيل برامج بدء التشغيل.",
+    "disk_iops_graph_title": "عمليات القرص في الثانية (لكل جهاز)",
+    "disk_throughput_graph_title": "إنتاجية القرص (KB/ث لكل جهاز)",
+    "disk_await_graph_title": "متوسط زمن انتظار القرص (مللي ثانية)",
+    "disk_util_graph_title": "استخدام القرص (%)",
+    "disk_queue_graph_title": "عمق طابور القرص (عمليات قيد التنفيذ)",
+    "smaps_age_tooltip": "تم القياس منذ {age:.0f} ثانية",
+    "memory_map": "خريطة الذاكرة",
+    "memory_map_title": "خريطة الذاكرة - {name} ({pid})",
+    "memory_map_loading": "جارٍ قراءة خريطة الذاكرة...",
+    "memory_map_progress": "تم تحليل {count} من التعيينات...",
+    "memory_map_summary": "{count} تعيين، RSS {rss:.1f} ميجا، PSS {pss:.1f} ميجا، المعدّل {dirty:.1f} ميجا، التبديل {swap:.1f} ميجا",
+    "memory_map_error": "تعذرت قراءة خريطة الذاكرة: {e}",
+    "memory_map_groups_header": "حسب التعيين",
+    "memory_map_top_header": "أكبر التعيينات (حسب RSS)",
+    "memory_map_group_columns": ["التعيين", "العدد", "الحجم KB", "RSS KB", "PSS KB", "المعدّل KB", "التبديل KB"],
+    "memory_map_top_columns": ["العنوان", "الصلاحيات", "التعيين", "الحجم KB", "RSS KB", "PSS KB", "المعدّل KB", "التبديل KB"],
+    "show_threads": "إظهار الخيوط",
+    "hide_threads": "إخفاء الخيوط",
+    "threads_select_process": "اختر عملية لعرض خيوطها.",
+    "threads_error": "تعذرت قراءة خيوط المعرف {pid}: {e}",
+    "threads_header": "خيوط المعرف {pid} ({count})",
+    "columns_thread_table": ["TID", "الاسم", "الحالة", "المعالج %", "تبديلات طوعية", "تبديلات قسرية", "آخر معالج"],
+    "inspect_section_open_files": "الملفات المفتوحة",
+    "inspect_section_connections": "الاتصالات",
+    "inspect_section_environment": "متغيرات البيئة",
+    "inspect_section_limits": "الحدود",
+    "inspect_filter": "تصفية...",
+    "prev_page": "السابق",
+    "next_page": "التالي",
+    "inspect_loading": "جارٍ التحميل... {count} عنصر",
+    "inspect_page": "الصفحة {page}/{pages} ({count} عنصر)",
+    "inspect_section_denied": "تم رفض الإذن",
+    "inspect_section_error": "خطأ في الاسترداد ({error})",
+    "detail_metrics": ["المعالج %", "RSS ميجا", "قراءة KB/ث", "كتابة KB/ث", "الواصفات المفتوحة", "الخيوط", "تبديلات السياق/ث"],
+    "run_delay_graph_title": "تأخير طابور تشغيل المعالج (مللي ثانية/ث، كل المعالجات)",
+    "run_delay_not_available": "تأخير طابور التشغيل غير متوفر",
+    "cpu_pressure_graph_title": "توقف ضغط المعالج (مللي ثانية/ث)",
+    "group_by": "التجميع حسب:",
+    "group_by_none": "بدون تجميع",
+    "group_by_cgroup": "الخدمة / cgroup",
+    "columns_group_tree": ["المجموعة / العملية", "PID", "العمليات", "المعالج %", "الذاكرة MB", "قراءة KB/s", "كتابة KB/s"],
+    "group_by_container": "الحاوية",
+    "container_host": "المضيف",
+    "group_by_user": "المستخدم",
+    "group_by_exe": "الملف التنفيذي",
+    "tab_recently_exited": "المنتهية مؤخراً",
+    "columns_lifecycle_table": ["وقت الانتهاء", "PID", "PPID", "الاسم", "سطر الأوامر", "مدة التشغيل ث", "المعالج ث", "حالة الخروج"],
+    "exit_signal": "إشارة {signal}",
+    "lifecycle_source_connector": "يتم التقاط كل عملية منتهية عبر موصل العمليات في النواة.",
+    "lifecycle_source_polling": "يتم التقاط العمليات المنتهية بفحص /proc كل {interval} مللي ثانية (شغّل كمستخدم root لالتقاط دقيق).",
+    "tab_cpu_leaderboard": "زمن المعالج",
+    "leaderboard_window": "الترتيب حسب زمن المعالج خلال:",
+    "leaderboard_minutes": "{minutes} دقيقة",
+    "leaderboard_by_name": "دمج العمليات ذات الاسم نفسه",
+    "leaderboard_processes": "العمليات",
+    "leaderboard_running": "قيد التشغيل",
+    "leaderboard_exited": "منتهية",
+    "columns_leaderboard_table": ["PID", "الاسم", "الأمر", "المعالج ث (5 د)", "المعالج ث (15 د)", "المعالج ث (60 د)", "الحالة"],
+    "leak_fit_tooltip": "ملاءمة خطية r² = {r2:.2f}",
+    "leak_eta": "{hours}س {minutes:02d}د",
+    "anomaly_threshold": "تمييز القيم الشاذة فوق درجة z:",
+    "anomaly_off": "معطّل",
+    "anomaly_tooltip": "درجة z {z:.1f} (عادةً {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "التنبيهات",
+    "apply_alert_rules": "تطبيق القواعد",
+    "alert_rules_error": "لم يتم تطبيق القواعد: {error}",
+    "alert_rules_loaded": "{count} قاعدة نشطة.",
+    "alert_rules_not_saved": "تم تطبيق القواعد لكن لم تُحفظ: {error}",
+    "alert_firing": "نشط",
+    "alert_resolved": "تم الحل",
+    "alert_title": "تنبيه عملية",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "التنبيه '{rule}': فشل الإجراء: {error}",
+    "columns_alert_log": ["الوقت", "القاعدة", "PID", "الاسم", "الحالة"],
+    "tab_policies": "السياسات",
+    "apply_policies": "تطبيق السياسات",
+    "policies_error": "لم يتم تطبيق السياسات: {error}",
+    "policies_loaded": "{count} سياسة نشطة.",
+    "policies_not_saved": "تم تطبيق السياسات لكن لم تُحفظ: {error}",
+    "policy_failed": "فشل: {error}",
+    "columns_policy_log": ["الوقت", "السياسة", "PID", "الاسم", "النتيجة"],
+    "affinity_preset": "إعداد مسبق:",
+    "affinity_preset_current": "التقارب الحالي",
+    "affinity_preset_all": "كل المعالجات",
+    "affinity_preset_physical": "الأنوية الفعلية فقط",
+    "affinity_preset_node": "العقدة {node} (المعالجات {cpus})",
+    "affinity_preset_socket": "المقبس {socket} (المعالجات {cpus})",
+    "topology_socket": "المقبس {socket}",
+    "topology_node": "عقدة NUMA {node}",
+    "topology_node_memory": "({size:.1f} ميجابايت من هذه العملية)",
+    "topology_l3": "L3 مشتركة: المعالجات {cpus}",
+    "topology_core": "النواة {core} (SMT: المعالجات {cpus})",
+    "numa_memory_unknown": "توزيع الذاكرة: غير متاح",
+    "numa_memory_placement": "توزيع الذاكرة: {placement}",
+    "numa_node_share": "العقدة {node}: {size:.1f} ميجابايت ({percent:.0f}%)",
+    "numa_nodes_header": "\nعقد NUMA:\n",
+    "numa_node_format": "  العقدة {node} (المعالجات {cpus}): المستخدم {used_gb:.2f} جيجابايت / {total_gb:.2f} جيجابايت، الحر {free_gb:.2f} جيجابايت\n",
+    "limit_resources": "تقييد الموارد...",
+    "limit_tree_resources": "تقييد شجرة العمليات...",
+    "limit_resources_title": "تقييد الموارد",
+    "limit_resources_target": "{name} (PID {pid}): سيتم نقل {count} عملية إلى cgroup جديدة.",
+    "limit_unlimited": "غير محدود",
+    "limit_no_device": "بدون حد للإدخال/الإخراج",
+    "limit_cpu": "حد المعالج (100% = معالج واحد):",
+    "limit_memory_high": "الذاكرة العليا (إبطاء فوقها):",
+    "limit_memory_max": "الذاكرة القصوى (نفاد الذاكرة فوقها):",
+    "limit_io_device": "جهاز الإدخال/الإخراج:",
+    "limit_io_read": "حد القراءة:",
+    "limit_io_write": "حد الكتابة:",
+    "limit_error": "تعذر إعداد cgroup: {e}",
+    "limit_move_error": "تعذر نقل العملية إلى {cgroup}: {e}",
+    "limit_success": "تم نقل {count} عملية إلى {cgroup}.",
+    "limit_partial": "تعذر نقل {count}.",
+    "remove_limits": "إزالة القيود",
+    "tab_limits": "القيود",
+    "limits_hint": "انقر بزر الماوس الأيمن على عملية واختر تقييد الموارد لنقلها (أو شجرتها) إلى cgroup بحدود للمعالج والذاكرة والإدخال/الإخراج.",
+    "columns_limits_table": ["Cgroup", "العمليات", "المعالج %", "حد المعالج %", "الذاكرة MB", "الذاكرة العليا MB", "الذاكرة القصوى MB", "قراءة KB/s", "حد القراءة KB/s", "كتابة KB/s", "حد الكتابة KB/s"],
+    "bulk_terminate": "إنهاء",
+    "kill_tree": "إنهاء شجرة العمليات",
+    "bulk_more_names": "و{count} أخرى",
+    "bulk_busy": "لا يزال إجراء جماعي آخر قيد التشغيل.",
+    "bulk_confirm": "{action} {count} عملية؟\n{names}",
+    "bulk_renice_prompt": "قيمة Nice (-20 إلى 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "إنهاء العملية",
+    "grace_period": "SIGKILL بعد:",
+    "bulk_outcome_ok": "تم",
+    "bulk_outcome_terminated": "انتهت بعد SIGTERM",
+    "bulk_outcome_killed": "قُتلت بعد مهلة السماح",
+    "bulk_outcome_gone": "منتهية مسبقًا",
+    "bulk_outcome_denied": "تم رفض الإذن",
+    "bulk_outcome_error": "فشلت",
+    "tab_pattern_actions": "إجراءات بالنمط",
+    "pattern_label": "النمط (تعبير نمطي):",
+    "pattern_full_cmdline": "مطابقة سطر الأوامر كاملًا",
+    "pattern_users": "المستخدمون (مفصولون بفواصل):",
+    "pattern_condition": "الشرط (كما في قواعد التنبيه):",
+    "pattern_preview": "معاينة",
+    "pattern_apply": "تطبيق على المطابقات",
+    "pattern_error": "استعلام غير صالح: {error}",
+    "pattern_summary": "{count} عملية: المعالج {cpu:.1f}%، RSS {rss:.1f} MB، قراءة {read:.1f} KB/s، كتابة {write:.1f} KB/s",
+    "pattern_action_signal": "إرسال إشارة",
+    "pattern_action_renice": "تعيين قيمة nice",
+    "pattern_action_affinity": "تعيين تقارب المعالج",
+    "columns_pattern_table": ["PID", "الاسم", "المستخدم", "المعالج %", "الذاكرة MB", "سطر الأوامر"],
+    "helper_start": "العمل كمسؤول",
+    "helper_stop": "التخلي عن الصلاحيات",
+    "helper_starting": "بانتظار المصادقة...",
+    "helper_running": "المساعد ذو الصلاحيات قيد التشغيل.",
+    "helper_tooltip": "تشغيل مساعد ذي صلاحيات لإدارة عمليات المستخدمين الآخرين وفحصها.",
+    "helper_start_error": "تعذر تشغيل المساعد ذي الصلاحيات: {e}",
+    "alert_system": "النظام",
+    "alert_notification_system": "{rule}: على مستوى النظام",
+    "anomaly_window": "خلال آخر:",
+    "limit_needs_helper": "إدارة مجموعات التحكم تتطلب صلاحيات الجذر؛ استخدم \"العمل كمسؤول\" وحاول مرة أخرى.",
+    "numa_memory_pending": "توزيع الذاكرة: جارٍ القياس...",
 }
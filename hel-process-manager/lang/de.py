@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Autostart-Programme",
     "tab_about": "Über",
 
-    "columns_process_table": ["PID", "Name", "CPU %", "RAM %", "Benutzer", "Übergeordneter PID", "Startzeit", "Pfad", "Threads", "Status"],
+    "columns_process_table": ["PID", "Name", "CPU %", "RAM %", "Benutzer", "Übergeordneter PID", "Startzeit", "Pfad", "Threads", "Status", "Lesen KB/s", "Schreiben KB/s", "I/O-Aufrufe/s", "RSS MB", "PSS MB", "USS MB", "Swap MB", "Run-Wartezeit ms/s", "Freiw. KW/s", "Unfreiw. KW/s", "Letzte CPU", "Kleine Seitenfehler/s", "Große Seitenfehler/s", "OOM-Wert", "Speicherdruck", "Container", "Container-ID", "NS-PID", "Wachstum MB/h", "RAM voll in", "NUMA lokal %"],
 
     "about_text": (
         "Helwan Prozessmanager\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "Die Auflistung von Autostart-Programmen ist komplex und plattformspezifisch.\\npsutil bietet hierfür nur begrenzten direkten Zugriff.\\n\\nUnter Windows umfasst dies oft Registrierungsschlüssel und Autostart-Ordner.\\nUnter Linux umfasst dies systemd, XDG Autostart und Sitzungsmanager.\\n\\nDiese Funktion würde plattformspezifische Implementierungen erfordern.",
     "startup_error": "Fehler beim Abrufen der Autostart-Programme: {e}",
     "startup_feature_note": "Diese Funktion ist ein Platzhalter und erfordert eine plattformspezifische Implementierung, um Autostart-Programme zu aktivieren/deaktivieren.",
-    "language_file_missing_hint": "Stellen Sie sicher, dass der Ordner 'lang' mit 'en.py' und 'ar.py' (oder anderen Sprachdateien) vorhanden ist."
+    "language_file_missing_hint": "Stellen Sie sicher, dass der Ordner 'lang' mit 'en.py' und 'ar.py' (oder anderen Sprachdateien) vorhanden ist.",
+    "disk_iops_graph_title": "Festplatten-IOPS (pro Gerät)",
+    "disk_throughput_graph_title": "Festplatten-Durchsatz (KB/s pro Gerät)",
+    "disk_await_graph_title": "Durchschnittliche Festplatten-Wartezeit (ms)",
+    "disk_util_graph_title": "Festplattenauslastung (%)",
+    "disk_queue_graph_title": "Festplatten-Warteschlangentiefe (laufende E/A)",
+    "smaps_age_tooltip": "Vor {age:.0f}s erfasst",
+    "memory_map": "Speicherabbild",
+    "memory_map_title": "Speicherabbild - {name} ({pid})",
+    "memory_map_loading": "Speicherabbild wird gelesen...",
+    "memory_map_progress": "{count} Zuordnungen analysiert...",
+    "memory_map_summary": "{count} Zuordnungen, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Dirty {dirty:.1f} MB, Swap {swap:.1f} MB",
+    "memory_map_error": "Speicherabbild konnte nicht gelesen werden: {e}",
+    "memory_map_groups_header": "Nach Zuordnung",
+    "memory_map_top_header": "Größte Zuordnungen (nach RSS)",
+    "memory_map_group_columns": ["Zuordnung", "Anzahl", "Größe KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "memory_map_top_columns": ["Adresse", "Rechte", "Zuordnung", "Größe KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "show_threads": "Threads anzeigen",
+    "hide_threads": "Threads ausblenden",
+    "threads_select_process": "Wählen Sie einen Prozess, um seine Threads zu sehen.",
+    "threads_error": "Threads von PID {pid} konnten nicht gelesen werden: {e}",
+    "threads_header": "Threads von PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Name", "Zustand", "CPU %", "Freiwillige Wechsel", "Unfreiwillige Wechsel", "Letzte CPU"],
+    "inspect_section_open_files": "Geöffnete Dateien",
+    "inspect_section_connections": "Verbindungen",
+    "inspect_section_environment": "Umgebung",
+    "inspect_section_limits": "Limits",
+    "inspect_filter": "Filtern...",
+    "prev_page": "Zurück",
+    "next_page": "Weiter",
+    "inspect_loading": "Wird geladen... {count} Einträge",
+    "inspect_page": "Seite {page}/{pages} ({count} Einträge)",
+    "inspect_section_denied": "Zugriff verweigert",
+    "inspect_section_error": "Fehler beim Abrufen ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Lesen KB/s", "Schreiben KB/s", "Offene FDs", "Threads", "Kontextwechsel/s"],
+    "run_delay_graph_title": "CPU-Run-Queue-Verzögerung (ms/s, alle CPUs)",
+    "run_delay_not_available": "Run-Queue-Verzögerung nicht verfügbar",
+    "cpu_pressure_graph_title": "CPU-Druck-Stillstand (ms/s)",
+    "group_by": "Gruppieren nach:",
+    "group_by_none": "Keine Gruppierung",
+    "group_by_cgroup": "Dienst / cgroup",
+    "columns_group_tree": ["Gruppe / Prozess", "PID", "Prozesse", "CPU %", "Speicher MB", "Lesen KB/s", "Schreiben KB/s"],
+    "group_by_container": "Container",
+    "container_host": "Host",
+    "group_by_user": "Benutzer",
+    "group_by_exe": "Programmdatei",
+    "tab_recently_exited": "Kürzlich beendet",
+    "columns_lifecycle_table": ["Endzeit", "PID", "PPID", "Name", "Befehlszeile", "Laufzeit s", "CPU s", "Exit-Status"],
+    "exit_signal": "Signal {signal}",
+    "lifecycle_source_connector": "Jedes Prozessende wird über den Proc-Connector des Kernels erfasst.",
+    "lifecycle_source_polling": "Prozessenden werden durch Abfragen von /proc alle {interval} ms erfasst (als root ausführen für lückenlose Erfassung).",
+    "tab_cpu_leaderboard": "CPU-Zeit",
+    "leaderboard_window": "Nach CPU-Zeit ordnen über:",
+    "leaderboard_minutes": "{minutes} Minuten",
+    "leaderboard_by_name": "Prozesse gleichen Namens zusammenfassen",
+    "leaderboard_processes": "Prozesse",
+    "leaderboard_running": "Läuft",
+    "leaderboard_exited": "Beendet",
+    "columns_leaderboard_table": ["PID", "Name", "Befehl", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Status"],
+    "leak_fit_tooltip": "Lineare Anpassung r² = {r2:.2f}",
+    "leak_eta": "{hours} h {minutes:02d} min",
+    "anomaly_threshold": "Anomalien ab z-Wert hervorheben:",
+    "anomaly_off": "Aus",
+    "anomaly_tooltip": "z-Wert {z:.1f} (üblich {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Warnungen",
+    "apply_alert_rules": "Regeln anwenden",
+    "alert_rules_error": "Regeln nicht angewendet: {error}",
+    "alert_rules_loaded": "{count} Regel(n) aktiv.",
+    "alert_rules_not_saved": "Regeln angewendet, aber nicht gespeichert: {error}",
+    "alert_firing": "Ausgelöst",
+    "alert_resolved": "Behoben",
+    "alert_title": "Prozesswarnung",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "Warnung '{rule}': Aktion fehlgeschlagen: {error}",
+    "columns_alert_log": ["Zeit", "Regel", "PID", "Name", "Zustand"],
+    "tab_policies": "Richtlinien",
+    "apply_policies": "Richtlinien anwenden",
+    "policies_error": "Richtlinien nicht angewendet: {error}",
+    "policies_loaded": "{count} Richtlinie(n) aktiv.",
+    "policies_not_saved": "Richtlinien angewendet, aber nicht gespeichert: {error}",
+    "policy_failed": "Fehlgeschlagen: {error}",
+    "columns_policy_log": ["Zeit", "Richtlinie", "PID", "Name", "Ergebnis"],
+    "affinity_preset": "Vorgabe:",
+    "affinity_preset_current": "Aktuelle Affinität",
+    "affinity_preset_all": "Alle CPUs",
+    "affinity_preset_physical": "Nur physische Kerne",
+    "affinity_preset_node": "Knoten {node} (CPUs {cpus})",
+    "affinity_preset_socket": "Sockel {socket} (CPUs {cpus})",
+    "topology_socket": "Sockel {socket}",
+    "topology_node": "NUMA-Knoten {node}",
+    "topology_node_memory": "({size:.1f} MB dieses Prozesses)",
+    "topology_l3": "Gemeinsamer L3: CPUs {cpus}",
+    "topology_core": "Kern {core} (SMT: CPUs {cpus})",
+    "numa_memory_unknown": "Speicherverteilung: nicht verfügbar",
+    "numa_memory_placement": "Speicherverteilung: {placement}",
+    "numa_node_share": "Knoten {node}: {size:.1f} MB ({percent:.0f}%)",
+    "numa_nodes_header": "\nNUMA-Knoten:\n",
+    "numa_node_format": "  Knoten {node} (CPUs {cpus}): Belegt {used_gb:.2f} GB / {total_gb:.2f} GB, Frei {free_gb:.2f} GB\n",
+    "limit_resources": "Ressourcen begrenzen...",
+    "limit_tree_resources": "Prozessbaum begrenzen...",
+    "limit_resources_title": "Ressourcen begrenzen",
+    "limit_resources_target": "{name} (PID {pid}): {count} Prozess(e) werden in eine neue cgroup verschoben.",
+    "limit_unlimited": "Unbegrenzt",
+    "limit_no_device": "Keine E/A-Begrenzung",
+    "limit_cpu": "CPU-Grenze (100% = eine CPU):",
+    "limit_memory_high": "Speicher hoch (darüber gedrosselt):",
+    "limit_memory_max": "Speicher max (darüber OOM):",
+    "limit_io_device": "E/A-Gerät:",
+    "limit_io_read": "Lesegrenze:",
+    "limit_io_write": "Schreibgrenze:",
+    "limit_error": "cgroup konnte nicht eingerichtet werden: {e}",
+    "limit_move_error": "Prozess konnte nicht nach {cgroup} verschoben werden: {e}",
+    "limit_success": "{count} Prozess(e) nach {cgroup} verschoben.",
+    "limit_partial": "{count} konnten nicht verschoben werden.",
+    "remove_limits": "Grenzen entfernen",
+    "tab_limits": "Grenzen",
+    "limits_hint": "Klicken Sie mit der rechten Maustaste auf einen Prozess und wählen Sie Ressourcen begrenzen, um ihn (oder seinen Baum) in eine cgroup mit CPU-, Speicher- und E/A-Grenzen zu verschieben.",
+    "columns_limits_table": ["Cgroup", "Prozesse", "CPU %", "CPU-Grenze %", "Speicher MB", "Speicher hoch MB", "Speicher max MB", "Lesen KB/s", "Lesegrenze KB/s", "Schreiben KB/s", "Schreibgrenze KB/s"],
+    "bulk_terminate": "Beenden",
+    "kill_tree": "Prozessbaum beenden",
+    "bulk_more_names": "und {count} weitere",
+    "bulk_busy": "Eine andere Sammelaktion läuft noch.",
+    "bulk_confirm": "{action}: {count} Prozess(e)?\n{names}",
+    "bulk_renice_prompt": "Nice-Wert (-20 bis 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "Prozess beenden",
+    "grace_period": "SIGKILL nach:",
+    "bulk_outcome_ok": "erledigt",
+    "bulk_outcome_terminated": "nach SIGTERM beendet",
+    "bulk_outcome_killed": "nach der Wartezeit getötet",
+    "bulk_outcome_gone": "bereits beendet",
+    "bulk_outcome_denied": "Zugriff verweigert",
+    "bulk_outcome_error": "fehlgeschlagen",
+    "tab_pattern_actions": "Musteraktionen",
+    "pattern_label": "Muster (Regex):",
+    "pattern_full_cmdline": "Gesamte Befehlszeile prüfen",
+    "pattern_users": "Benutzer (durch Kommas getrennt):",
+    "pattern_condition": "Bedingung (wie in Alarmregeln):",
+    "pattern_preview": "Vorschau",
+    "pattern_apply": "Auf Treffer anwenden",
+    "pattern_error": "Ungültige Abfrage: {error}",
+    "pattern_summary": "{count} Prozess(e): CPU {cpu:.1f}%, RSS {rss:.1f} MB, Lesen {read:.1f} KB/s, Schreiben {write:.1f} KB/s",
+    "pattern_action_signal": "Signal senden",
+    "pattern_action_renice": "Nice-Wert setzen",
+    "pattern_action_affinity": "CPU-Zuweisung setzen",
+    "columns_pattern_table": ["PID", "Name", "Benutzer", "CPU %", "Speicher MB", "Befehlszeile"],
+    "helper_start": "Als Administrator handeln",
+    "helper_stop": "Rechte abgeben",
+    "helper_starting": "Warte auf Authentifizierung...",
+    "helper_running": "Der privilegierte Helfer läuft.",
+    "helper_tooltip": "Einen privilegierten Helfer starten, um Prozesse anderer Benutzer zu verwalten und zu untersuchen.",
+    "helper_start_error": "Der privilegierte Helfer konnte nicht gestartet werden: {e}",
+    "alert_system": "System",
+    "alert_notification_system": "{rule}: systemweit",
+    "anomaly_window": "über die letzten:",
+    "limit_needs_helper": "Zum Verwalten von Cgroups sind Root-Rechte nötig; verwenden Sie \"Als Administrator handeln\" und versuchen Sie es erneut.",
+    "numa_memory_pending": "Speicherverteilung: wird gemessen...",
 }
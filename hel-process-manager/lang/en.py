@@ -20,7 +20,7 @@ lang = {
     "tab_about": "About",
 
     # تم تصحيح هذا المفتاح ليكون "columns_process_table"
-    "columns_process_table": ["PID", "Name", "CPU %", "RAM %", "User", "Parent PID", "Start Time", "Path", "Threads", "Status"],
+    "columns_process_table": ["PID", "Name", "CPU %", "RAM %", "User", "Parent PID", "Start Time", "Path", "Threads", "Status", "Read KB/s", "Write KB/s", "I/O Calls/s", "RSS MB", "PSS MB", "USS MB", "Swap MB", "Run Wait ms/s", "Vol CS/s", "Invol CS/s", "Last CPU", "Minor Faults/s", "Major Faults/s", "OOM Score", "Mem Pressure", "Container", "Container ID", "NS PID", "Growth MB/h", "RAM Full In", "NUMA Local %"],
 
     # هذه المفاتيح الفردية لم تعد ضرورية مع وجود "columns_process_table"
     # "start_time_col": "Start Time",
@@ -141,4 +141,160 @@ lang = {
     "startup_error": "Error retrieving startup programs: {e}",
     "startup_feature_note": "This feature is a placeholder and requires platform-specific implementation to enable/disable startup programs.",
     "language_file_missing_hint": "Ensure 'lang' folder exists with 'en.py' and 'ar.py' inside.",
+    "disk_iops_graph_title": "Disk IOPS (per device)",
+    "disk_throughput_graph_title": "Disk Throughput (KB/s per device)",
+    "disk_await_graph_title": "Disk Average Await (ms)",
+    "disk_util_graph_title": "Disk Utilisation (%)",
+    "disk_queue_graph_title": "Disk Queue Depth (in-flight I/Os)",
+    "smaps_age_tooltip": "Sampled {age:.0f}s ago",
+    "memory_map": "Memory Map",
+    "memory_map_title": "Memory Map - {name} ({pid})",
+    "memory_map_loading": "Reading memory map...",
+    "memory_map_progress": "Parsed {count} mappings...",
+    "memory_map_summary": "{count} mappings, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Dirty {dirty:.1f} MB, Swap {swap:.1f} MB",
+    "memory_map_error": "Could not read memory map: {e}",
+    "memory_map_groups_header": "By mapping",
+    "memory_map_top_header": "Largest mappings (by RSS)",
+    "memory_map_group_columns": ["Mapping", "Count", "Size KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "memory_map_top_columns": ["Address", "Perms", "Mapping", "Size KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "show_threads": "Show Threads",
+    "hide_threads": "Hide Threads",
+    "threads_select_process": "Select a process to see its threads.",
+    "threads_error": "Could not read threads of PID {pid}: {e}",
+    "threads_header": "Threads of PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Name", "State", "CPU %", "Voluntary Switches", "Involuntary Switches", "Last CPU"],
+    "inspect_section_open_files": "Open Files",
+    "inspect_section_connections": "Connections",
+    "inspect_section_environment": "Environment",
+    "inspect_section_limits": "Limits",
+    "inspect_filter": "Filter...",
+    "prev_page": "Previous",
+    "next_page": "Next",
+    "inspect_loading": "Loading... {count} items",
+    "inspect_page": "Page {page}/{pages} ({count} items)",
+    "inspect_section_denied": "Permission Denied",
+    "inspect_section_error": "Error retrieving ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Read KB/s", "Write KB/s", "Open FDs", "Threads", "Context Switches/s"],
+    "run_delay_graph_title": "CPU Run Queue Delay (ms/s, all CPUs)",
+    "run_delay_not_available": "Run Queue Delay Not Available",
+    "cpu_pressure_graph_title": "CPU Pressure Stall (ms/s)",
+    "group_by": "Group by:",
+    "group_by_none": "No Grouping",
+    "group_by_cgroup": "Service / cgroup",
+    "columns_group_tree": ["Group / Process", "PID", "Processes", "CPU %", "Memory MB", "Read KB/s", "Write KB/s"],
+    "group_by_container": "Container",
+    "container_host": "Host",
+    "group_by_user": "User",
+    "group_by_exe": "Executable",
+    "tab_recently_exited": "Recently Exited",
+    "columns_lifecycle_table": ["Exit Time", "PID", "PPID", "Name", "Command Line", "Runtime s", "CPU s", "Exit Status"],
+    "exit_signal": "Signal {signal}",
+    "lifecycle_source_connector": "Capturing every process exit via the kernel proc connector.",
+    "lifecycle_source_polling": "Capturing process exits by polling /proc every {interval} ms (run as root for exact capture).",
+    "tab_cpu_leaderboard": "CPU Time",
+    "leaderboard_window": "Rank by CPU time over:",
+    "leaderboard_minutes": "{minutes} minutes",
+    "leaderboard_by_name": "Combine processes with the same name",
+    "leaderboard_processes": "Processes",
+    "leaderboard_running": "Running",
+    "leaderboard_exited": "Exited",
+    "columns_leaderboard_table": ["PID", "Name", "Command", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Status"],
+    "leak_fit_tooltip": "Linear fit r² = {r2:.2f}",
+    "leak_eta": "{hours}h {minutes:02d}m",
+    "anomaly_threshold": "Highlight anomalies above z-score:",
+    "anomaly_off": "Off",
+    "anomaly_tooltip": "z-score {z:.1f} (usually {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Alerts",
+    "apply_alert_rules": "Apply Rules",
+    "alert_rules_error": "Rules not applied: {error}",
+    "alert_rules_loaded": "{count} rule(s) active.",
+    "alert_rules_not_saved": "Rules applied but not saved: {error}",
+    "alert_firing": "Firing",
+    "alert_resolved": "Resolved",
+    "alert_title": "Process alert",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "Alert '{rule}': hook failed: {error}",
+    "columns_alert_log": ["Time", "Rule", "PID", "Name", "State"],
+    "tab_policies": "Policies",
+    "apply_policies": "Apply Policies",
+    "policies_error": "Policies not applied: {error}",
+    "policies_loaded": "{count} policy(ies) active.",
+    "policies_not_saved": "Policies applied but not saved: {error}",
+    "policy_failed": "Failed: {error}",
+    "columns_policy_log": ["Time", "Policy", "PID", "Name", "Result"],
+    "affinity_preset": "Preset:",
+    "affinity_preset_current": "Current affinity",
+    "affinity_preset_all": "All CPUs",
+    "affinity_preset_physical": "Physical cores only",
+    "affinity_preset_node": "Node {node} (CPUs {cpus})",
+    "affinity_preset_socket": "Socket {socket} (CPUs {cpus})",
+    "topology_socket": "Socket {socket}",
+    "topology_node": "NUMA node {node}",
+    "topology_node_memory": "({size:.1f} MB of this process)",
+    "topology_l3": "Shared L3: CPUs {cpus}",
+    "topology_core": "Core {core} (SMT: CPUs {cpus})",
+    "numa_memory_unknown": "Memory placement: not available",
+    "numa_memory_placement": "Memory placement: {placement}",
+    "numa_node_share": "node {node}: {size:.1f} MB ({percent:.0f}%)",
+    "numa_nodes_header": "\nNUMA Nodes:\n",
+    "numa_node_format": "  Node {node} (CPUs {cpus}): Used {used_gb:.2f} GB / {total_gb:.2f} GB, Free {free_gb:.2f} GB\n",
+    "limit_resources": "Limit Resources...",
+    "limit_tree_resources": "Limit Process Tree...",
+    "limit_resources_title": "Limit Resources",
+    "limit_resources_target": "{name} (PID {pid}): {count} process(es) will be moved to a new cgroup.",
+    "limit_unlimited": "Unlimited",
+    "limit_no_device": "No I/O limit",
+    "limit_cpu": "CPU limit (100% = one CPU):",
+    "limit_memory_high": "Memory high (throttle above):",
+    "limit_memory_max": "Memory max (OOM above):",
+    "limit_io_device": "I/O device:",
+    "limit_io_read": "Read limit:",
+    "limit_io_write": "Write limit:",
+    "limit_error": "Could not set up the cgroup: {e}",
+    "limit_move_error": "Could not move the process into {cgroup}: {e}",
+    "limit_success": "Moved {count} process(es) into {cgroup}.",
+    "limit_partial": "{count} could not be moved.",
+    "remove_limits": "Remove Limits",
+    "tab_limits": "Limits",
+    "limits_hint": "Right-click a process and choose Limit Resources to move it (or its tree) into a cgroup with CPU, memory and I/O limits.",
+    "columns_limits_table": ["Cgroup", "Processes", "CPU %", "CPU Limit %", "Memory MB", "Memory High MB", "Memory Max MB", "Read KB/s", "Read Limit KB/s", "Write KB/s", "Write Limit KB/s"],
+    "bulk_terminate": "Terminate",
+    "kill_tree": "Kill Process Tree",
+    "bulk_more_names": "and {count} more",
+    "bulk_busy": "Another bulk action is still running.",
+    "bulk_confirm": "{action} {count} process(es)?\n{names}",
+    "bulk_renice_prompt": "Nice Value (-20 to 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "End Process",
+    "grace_period": "SIGKILL after:",
+    "bulk_outcome_ok": "done",
+    "bulk_outcome_terminated": "exited after SIGTERM",
+    "bulk_outcome_killed": "killed after the grace period",
+    "bulk_outcome_gone": "already gone",
+    "bulk_outcome_denied": "permission denied",
+    "bulk_outcome_error": "failed",
+    "tab_pattern_actions": "Pattern Actions",
+    "pattern_label": "Pattern (regex):",
+    "pattern_full_cmdline": "Match full command line",
+    "pattern_users": "Users (comma-separated):",
+    "pattern_condition": "Condition (as in alert rules):",
+    "pattern_preview": "Preview",
+    "pattern_apply": "Apply to Matches",
+    "pattern_error": "Invalid query: {error}",
+    "pattern_summary": "{count} process(es): CPU {cpu:.1f}%, RSS {rss:.1f} MB, Read {read:.1f} KB/s, Write {write:.1f} KB/s",
+    "pattern_action_signal": "Send signal",
+    "pattern_action_renice": "Set nice value",
+    "pattern_action_affinity": "Set CPU affinity",
+    "columns_pattern_table": ["PID", "Name", "User", "CPU %", "Memory MB", "Command Line"],
+    "helper_start": "Act as Administrator",
+    "helper_stop": "Drop Privileges",
+    "helper_starting": "Waiting for authentication...",
+    "helper_running": "The privileged helper is running.",
+    "helper_tooltip": "Start a privileged helper so other users' processes can be managed and inspected.",
+    "helper_start_error": "Could not start the privileged helper: {e}",
+    "alert_system": "System",
+    "alert_notification_system": "{rule}: system-wide",
+    "anomaly_window": "over the last:",
+    "limit_needs_helper": "Managing cgroups needs root; use \"Act as Administrator\" and try again.",
+    "numa_memory_pending": "Memory placement: measuring...",
 }
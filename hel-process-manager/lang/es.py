@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Programas de Inicio",
     "tab_about": "Acerca de",
 
-    "columns_process_table": ["PID", "Nombre", "CPU %", "RAM %", "Usuario", "PID Padre", "Hora de Inicio", "Ruta", "Hilos", "Estado"],
+    "columns_process_table": ["PID", "Nombre", "CPU %", "RAM %", "Usuario", "PID Padre", "Hora de Inicio", "Ruta", "Hilos", "Estado", "Lectura KB/s", "Escritura KB/s", "Llamadas E/S/s", "RSS MB", "PSS MB", "USS MB", "Swap MB", "Espera Ejec. ms/s", "CC Vol./s", "CC Invol./s", "Última CPU", "Fallos Menores/s", "Fallos Mayores/s", "Puntuación OOM", "Presión de Memoria", "Contenedor", "ID de contenedor", "PID en NS", "Crecimiento MB/h", "RAM llena en", "NUMA local %"],
 
     "about_text": (
         "Gestor de Procesos Helwan\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "La lista de programas de inicio es compleja y específica de cada plataforma.\\npsutil ofrece acceso directo limitado para este propósito.\\n\\nEn Windows, a menudo implica claves de registro y carpetas de inicio.\\nEn Linux, implica systemd, autoinicio XDG y gestores de sesión.\\n\\nEsta característica requeriría implementaciones específicas de la plataforma.",
     "startup_error": "Error al recuperar programas de inicio: {e}",
     "startup_feature_note": "Esta característica es un marcador de posición y requiere una implementación específica de la plataforma para habilitar/deshabilitar programas de inicio.",
-    "language_file_missing_hint": "Asegúrese de que la carpeta 'lang' exista con 'en.py' y 'ar.py' (u otros archivos de idioma) dentro."
+    "language_file_missing_hint": "Asegúrese de que la carpeta 'lang' exista con 'en.py' y 'ar.py' (u otros archivos de idioma) dentro.",
+    "disk_iops_graph_title": "IOPS de Disco (por dispositivo)",
+    "disk_throughput_graph_title": "Rendimiento de Disco (KB/s por dispositivo)",
+    "disk_await_graph_title": "Espera Media de Disco (ms)",
+    "disk_util_graph_title": "Utilización de Disco (%)",
+    "disk_queue_graph_title": "Profundidad de Cola de Disco (E/S en curso)",
+    "smaps_age_tooltip": "Muestreado hace {age:.0f}s",
+    "memory_map": "Mapa de Memoria",
+    "memory_map_title": "Mapa de Memoria - {name} ({pid})",
+    "memory_map_loading": "Leyendo mapa de memoria...",
+    "memory_map_progress": "{count} mapeos analizados...",
+    "memory_map_summary": "{count} mapeos, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Sucia {dirty:.1f} MB, Swap {swap:.1f} MB",
+    "memory_map_error": "No se pudo leer el mapa de memoria: {e}",
+    "memory_map_groups_header": "Por mapeo",
+    "memory_map_top_header": "Mapeos más grandes (por RSS)",
+    "memory_map_group_columns": ["Mapeo", "Cantidad", "Tamaño KB", "RSS KB", "PSS KB", "Sucia KB", "Swap KB"],
+    "memory_map_top_columns": ["Dirección", "Permisos", "Mapeo", "Tamaño KB", "RSS KB", "PSS KB", "Sucia KB", "Swap KB"],
+    "show_threads": "Mostrar Hilos",
+    "hide_threads": "Ocultar Hilos",
+    "threads_select_process": "Seleccione un proceso para ver sus hilos.",
+    "threads_error": "No se pudieron leer los hilos del PID {pid}: {e}",
+    "threads_header": "Hilos del PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Nombre", "Estado", "CPU %", "Cambios Voluntarios", "Cambios Involuntarios", "Última CPU"],
+    "inspect_section_open_files": "Archivos Abiertos",
+    "inspect_section_connections": "Conexiones",
+    "inspect_section_environment": "Entorno",
+    "inspect_section_limits": "Límites",
+    "inspect_filter": "Filtrar...",
+    "prev_page": "Anterior",
+    "next_page": "Siguiente",
+    "inspect_loading": "Cargando... {count} elementos",
+    "inspect_page": "Página {page}/{pages} ({count} elementos)",
+    "inspect_section_denied": "Permiso Denegado",
+    "inspect_section_error": "Error al obtener ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Lectura KB/s", "Escritura KB/s", "FDs Abiertos", "Hilos", "Cambios de Contexto/s"],
+    "run_delay_graph_title": "Retardo de Cola de Ejecución (ms/s, todas las CPU)",
+    "run_delay_not_available": "Retardo de Cola de Ejecución No Disponible",
+    "cpu_pressure_graph_title": "Bloqueo por Presión de CPU (ms/s)",
+    "group_by": "Agrupar por:",
+    "group_by_none": "Sin agrupar",
+    "group_by_cgroup": "Servicio / cgroup",
+    "columns_group_tree": ["Grupo / Proceso", "PID", "Procesos", "CPU %", "Memoria MB", "Lectura KB/s", "Escritura KB/s"],
+    "group_by_container": "Contenedor",
+    "container_host": "Anfitrión",
+    "group_by_user": "Usuario",
+    "group_by_exe": "Ejecutable",
+    "tab_recently_exited": "Finalizados recientemente",
+    "columns_lifecycle_table": ["Hora de salida", "PID", "PPID", "Nombre", "Línea de comandos", "Duración s", "CPU s", "Estado de salida"],
+    "exit_signal": "Señal {signal}",
+    "lifecycle_source_connector": "Capturando cada salida de proceso mediante el proc connector del kernel.",
+    "lifecycle_source_polling": "Capturando salidas de procesos consultando /proc cada {interval} ms (ejecute como root para una captura exacta).",
+    "tab_cpu_leaderboard": "Tiempo de CPU",
+    "leaderboard_window": "Clasificar por tiempo de CPU en:",
+    "leaderboard_minutes": "{minutes} minutos",
+    "leaderboard_by_name": "Combinar procesos con el mismo nombre",
+    "leaderboard_processes": "Procesos",
+    "leaderboard_running": "En ejecución",
+    "leaderboard_exited": "Finalizado",
+    "columns_leaderboard_table": ["PID", "Nombre", "Comando", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Estado"],
+    "leak_fit_tooltip": "Ajuste lineal r² = {r2:.2f}",
+    "leak_eta": "{hours} h {minutes:02d} min",
+    "anomaly_threshold": "Resaltar anomalías por encima de z:",
+    "anomaly_off": "Desactivado",
+    "anomaly_tooltip": "Puntuación z {z:.1f} (normalmente {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Alertas",
+    "apply_alert_rules": "Aplicar reglas",
+    "alert_rules_error": "Reglas no aplicadas: {error}",
+    "alert_rules_loaded": "{count} regla(s) activa(s).",
+    "alert_rules_not_saved": "Reglas aplicadas pero no guardadas: {error}",
+    "alert_firing": "Activa",
+    "alert_resolved": "Resuelta",
+    "alert_title": "Alerta de proceso",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "Alerta '{rule}': la acción falló: {error}",
+    "columns_alert_log": ["Hora", "Regla", "PID", "Nombre", "Estado"],
+    "tab_policies": "Políticas",
+    "apply_policies": "Aplicar políticas",
+    "policies_error": "Políticas no aplicadas: {error}",
+    "policies_loaded": "{count} política(s) activa(s).",
+    "policies_not_saved": "Políticas aplicadas pero no guardadas: {error}",
+    "policy_failed": "Error: {error}",
+    "columns_policy_log": ["Hora", "Política", "PID", "Nombre", "Resultado"],
+    "affinity_preset": "Preajuste:",
+    "affinity_preset_current": "Afinidad actual",
+    "affinity_preset_all": "Todas las CPU",
+    "affinity_preset_physical": "Solo núcleos físicos",
+    "affinity_preset_node": "Nodo {node} (CPU {cpus})",
+    "affinity_preset_socket": "Zócalo {socket} (CPU {cpus})",
+    "topology_socket": "Zócalo {socket}",
+    "topology_node": "Nodo NUMA {node}",
+    "topology_node_memory": "({size:.1f} MB de este proceso)",
+    "topology_l3": "L3 compartida: CPU {cpus}",
+    "topology_core": "Núcleo {core} (SMT: CPU {cpus})",
+    "numa_memory_unknown": "Ubicación de memoria: no disponible",
+    "numa_memory_placement": "Ubicación de memoria: {placement}",
+    "numa_node_share": "nodo {node}: {size:.1f} MB ({percent:.0f}%)",
+    "numa_nodes_header": "\nNodos NUMA:\n",
+    "numa_node_format": "  Nodo {node} (CPU {cpus}): Usado {used_gb:.2f} GB / {total_gb:.2f} GB, Libre {free_gb:.2f} GB\n",
+    "limit_resources": "Limitar recursos...",
+    "limit_tree_resources": "Limitar árbol de procesos...",
+    "limit_resources_title": "Limitar recursos",
+    "limit_resources_target": "{name} (PID {pid}): {count} proceso(s) se moverán a un nuevo cgroup.",
+    "limit_unlimited": "Ilimitado",
+    "limit_no_device": "Sin límite de E/S",
+    "limit_cpu": "Límite de CPU (100% = una CPU):",
+    "limit_memory_high": "Memoria alta (se frena por encima):",
+    "limit_memory_max": "Memoria máx. (OOM por encima):",
+    "limit_io_device": "Dispositivo de E/S:",
+    "limit_io_read": "Límite de lectura:",
+    "limit_io_write": "Límite de escritura:",
+    "limit_error": "No se pudo configurar el cgroup: {e}",
+    "limit_move_error": "No se pudo mover el proceso a {cgroup}: {e}",
+    "limit_success": "{count} proceso(s) movido(s) a {cgroup}.",
+    "limit_partial": "{count} no se pudieron mover.",
+    "remove_limits": "Quitar límites",
+    "tab_limits": "Límites",
+    "limits_hint": "Haga clic derecho en un proceso y elija Limitar recursos para moverlo (o su árbol) a un cgroup con límites de CPU, memoria y E/S.",
+    "columns_limits_table": ["Cgroup", "Procesos", "CPU %", "Límite CPU %", "Memoria MB", "Memoria alta MB", "Memoria máx. MB", "Lectura KB/s", "Límite lectura KB/s", "Escritura KB/s", "Límite escritura KB/s"],
+    "bulk_terminate": "Terminar",
+    "kill_tree": "Matar árbol de procesos",
+    "bulk_more_names": "y {count} más",
+    "bulk_busy": "Otra acción masiva sigue en curso.",
+    "bulk_confirm": "¿{action} {count} proceso(s)?\n{names}",
+    "bulk_renice_prompt": "Valor nice (-20 a 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "Finalizar proceso",
+    "grace_period": "SIGKILL tras:",
+    "bulk_outcome_ok": "hechos",
+    "bulk_outcome_terminated": "terminados tras SIGTERM",
+    "bulk_outcome_killed": "matados tras el periodo de gracia",
+    "bulk_outcome_gone": "ya terminados",
+    "bulk_outcome_denied": "permiso denegado",
+    "bulk_outcome_error": "fallidos",
+    "tab_pattern_actions": "Acciones por patrón",
+    "pattern_label": "Patrón (regex):",
+    "pattern_full_cmdline": "Coincidir con la línea de comandos completa",
+    "pattern_users": "Usuarios (separados por comas):",
+    "pattern_condition": "Condición (como en las reglas de alerta):",
+    "pattern_preview": "Vista previa",
+    "pattern_apply": "Aplicar a las coincidencias",
+    "pattern_error": "Consulta no válida: {error}",
+    "pattern_summary": "{count} proceso(s): CPU {cpu:.1f}%, RSS {rss:.1f} MB, Lectura {read:.1f} KB/s, Escritura {write:.1f} KB/s",
+    "pattern_action_signal": "Enviar señal",
+    "pattern_action_renice": "Establecer valor nice",
+    "pattern_action_affinity": "Establecer afinidad de CPU",
+    "columns_pattern_table": ["PID", "Nombre", "Usuario", "CPU %", "Memoria MB", "Línea de comandos"],
+    "helper_start": "Actuar como administrador",
+    "helper_stop": "Renunciar a privilegios",
+    "helper_starting": "Esperando autenticación...",
+    "helper_running": "El asistente privilegiado está en ejecución.",
+    "helper_tooltip": "Iniciar un asistente privilegiado para gestionar e inspeccionar procesos de otros usuarios.",
+    "helper_start_error": "No se pudo iniciar el asistente privilegiado: {e}",
+    "alert_system": "Sistema",
+    "alert_notification_system": "{rule}: todo el sistema",
+    "anomaly_window": "en los últimos:",
+    "limit_needs_helper": "Gestionar cgroups requiere root; use \"Actuar como administrador\" e inténtelo de nuevo.",
+    "numa_memory_pending": "Ubicación de memoria: midiendo...",
 }
@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Programmes au Démarrage",
     "tab_about": "À Propos",
 
-    "columns_process_table": ["PID", "Nom", "CPU %", "RAM %", "Utilisateur", "PID Parent", "Heure de Début", "Chemin", "Threads", "Statut"],
+    "columns_process_table": ["PID", "Nom", "CPU %", "RAM %", "Utilisateur", "PID Parent", "Heure de Début", "Chemin", "Threads", "Statut", "Lecture KB/s", "Écriture KB/s", "Appels E/S/s", "RSS Mo", "PSS Mo", "USS Mo", "Swap Mo", "Attente Exéc. ms/s", "CC Vol./s", "CC Invol./s", "Dernier CPU", "Défauts Mineurs/s", "Défauts Majeurs/s", "Score OOM", "Pression Mémoire", "Conteneur", "ID du conteneur", "PID dans NS", "Croissance Mo/h", "RAM pleine dans", "NUMA local %"],
 
     "about_text": (
         "Gestionnaire de Processus Helwan\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "La liste des programmes de démarrage est complexe et spécifique à chaque plateforme.\\npsutil offre un accès direct limité à cet effet.\\n\\nSous Windows, cela implique souvent des clés de registre et des dossiers de démarrage.\\nSous Linux, cela implique systemd, l'autodémarrage XDG et les gestionnaires de session.\\n\\nCette fonctionnalité nécessiterait des implémentations spécifiques à la plateforme.",
     "startup_error": "Erreur lors de la récupération des programmes de démarrage : {e}",
     "startup_feature_note": "Cette fonctionnalité est un espace réservé et nécessite une implémentation spécifique à la plateforme pour activer/désactiver les programmes de démarrage.",
-    "language_file_missing_hint": "Assurez-vous que le dossier 'lang' existe avec 'en.py' et 'ar.py' (ou d'autres fichiers de langue) à l'intérieur."
+    "language_file_missing_hint": "Assurez-vous que le dossier 'lang' existe avec 'en.py' et 'ar.py' (ou d'autres fichiers de langue) à l'intérieur.",
+    "disk_iops_graph_title": "IOPS Disque (par périphérique)",
+    "disk_throughput_graph_title": "Débit Disque (KB/s par périphérique)",
+    "disk_await_graph_title": "Attente Moyenne Disque (ms)",
+    "disk_util_graph_title": "Utilisation Disque (%)",
+    "disk_queue_graph_title": "Profondeur de File Disque (E/S en cours)",
+    "smaps_age_tooltip": "Échantillonné il y a {age:.0f}s",
+    "memory_map": "Carte Mémoire",
+    "memory_map_title": "Carte Mémoire - {name} ({pid})",
+    "memory_map_loading": "Lecture de la carte mémoire...",
+    "memory_map_progress": "{count} mappages analysés...",
+    "memory_map_summary": "{count} mappages, RSS {rss:.1f} Mo, PSS {pss:.1f} Mo, Modifiée {dirty:.1f} Mo, Swap {swap:.1f} Mo",
+    "memory_map_error": "Impossible de lire la carte mémoire : {e}",
+    "memory_map_groups_header": "Par mappage",
+    "memory_map_top_header": "Plus grands mappages (par RSS)",
+    "memory_map_group_columns": ["Mappage", "Nombre", "Taille Ko", "RSS Ko", "PSS Ko", "Modifiée Ko", "Swap Ko"],
+    "memory_map_top_columns": ["Adresse", "Droits", "Mappage", "Taille Ko", "RSS Ko", "PSS Ko", "Modifiée Ko", "Swap Ko"],
+    "show_threads": "Afficher les Threads",
+    "hide_threads": "Masquer les Threads",
+    "threads_select_process": "Sélectionnez un processus pour voir ses threads.",
+    "threads_error": "Impossible de lire les threads du PID {pid} : {e}",
+    "threads_header": "Threads du PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Nom", "État", "CPU %", "Commutations Volontaires", "Commutations Involontaires", "Dernier CPU"],
+    "inspect_section_open_files": "Fichiers Ouverts",
+    "inspect_section_connections": "Connexions",
+    "inspect_section_environment": "Environnement",
+    "inspect_section_limits": "Limites",
+    "inspect_filter": "Filtrer...",
+    "prev_page": "Précédent",
+    "next_page": "Suivant",
+    "inspect_loading": "Chargement... {count} éléments",
+    "inspect_page": "Page {page}/{pages} ({count} éléments)",
+    "inspect_section_denied": "Permission Refusée",
+    "inspect_section_error": "Erreur de récupération ({error})",
+    "detail_metrics": ["CPU %", "RSS Mo", "Lecture KB/s", "Écriture KB/s", "FDs Ouverts", "Threads", "Changements de Contexte/s"],
+    "run_delay_graph_title": "Délai de File d'Exécution CPU (ms/s, tous les CPU)",
+    "run_delay_not_available": "Délai de File d'Exécution Non Disponible",
+    "cpu_pressure_graph_title": "Blocage par Pression CPU (ms/s)",
+    "group_by": "Grouper par :",
+    "group_by_none": "Aucun regroupement",
+    "group_by_cgroup": "Service / cgroup",
+    "columns_group_tree": ["Groupe / Processus", "PID", "Processus", "CPU %", "Mémoire Mo", "Lecture Ko/s", "Écriture Ko/s"],
+    "group_by_container": "Conteneur",
+    "container_host": "Hôte",
+    "group_by_user": "Utilisateur",
+    "group_by_exe": "Exécutable",
+    "tab_recently_exited": "Terminés récemment",
+    "columns_lifecycle_table": ["Heure de fin", "PID", "PPID", "Nom", "Ligne de commande", "Durée s", "CPU s", "Code de sortie"],
+    "exit_signal": "Signal {signal}",
+    "lifecycle_source_connector": "Capture de chaque fin de processus via le proc connector du noyau.",
+    "lifecycle_source_polling": "Capture des fins de processus en interrogeant /proc toutes les {interval} ms (exécuter en root pour une capture exacte).",
+    "tab_cpu_leaderboard": "Temps CPU",
+    "leaderboard_window": "Classer par temps CPU sur :",
+    "leaderboard_minutes": "{minutes} minutes",
+    "leaderboard_by_name": "Regrouper les processus de même nom",
+    "leaderboard_processes": "Processus",
+    "leaderboard_running": "En cours",
+    "leaderboard_exited": "Terminé",
+    "columns_leaderboard_table": ["PID", "Nom", "Commande", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "État"],
+    "leak_fit_tooltip": "Ajustement linéaire r² = {r2:.2f}",
+    "leak_eta": "{hours} h {minutes:02d} min",
+    "anomaly_threshold": "Surligner les anomalies au-delà du score z :",
+    "anomaly_off": "Désactivé",
+    "anomaly_tooltip": "Score z {z:.1f} (habituellement {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Alertes",
+    "apply_alert_rules": "Appliquer les règles",
+    "alert_rules_error": "Règles non appliquées : {error}",
+    "alert_rules_loaded": "{count} règle(s) active(s).",
+    "alert_rules_not_saved": "Règles appliquées mais non enregistrées : {error}",
+    "alert_firing": "Déclenchée",
+    "alert_resolved": "Résolue",
+    "alert_title": "Alerte de processus",
+    "alert_notification": "{rule} : {name} (PID {pid})",
+    "alert_hook_error": "Alerte « {rule} » : échec de l'action : {error}",
+    "columns_alert_log": ["Heure", "Règle", "PID", "Nom", "État"],
+    "tab_policies": "Politiques",
+    "apply_policies": "Appliquer les politiques",
+    "policies_error": "Politiques non appliquées : {error}",
+    "policies_loaded": "{count} politique(s) active(s).",
+    "policies_not_saved": "Politiques appliquées mais non enregistrées : {error}",
+    "policy_failed": "Échec : {error}",
+    "columns_policy_log": ["Heure", "Politique", "PID", "Nom", "Résultat"],
+    "affinity_preset": "Préréglage :",
+    "affinity_preset_current": "Affinité actuelle",
+    "affinity_preset_all": "Tous les CPU",
+    "affinity_preset_physical": "Cœurs physiques uniquement",
+    "affinity_preset_node": "Nœud {node} (CPU {cpus})",
+    "affinity_preset_socket": "Socket {socket} (CPU {cpus})",
+    "topology_socket": "Socket {socket}",
+    "topology_node": "Nœud NUMA {node}",
+    "topology_node_memory": "({size:.1f} Mo de ce processus)",
+    "topology_l3": "L3 partagé : CPU {cpus}",
+    "topology_core": "Cœur {core} (SMT : CPU {cpus})",
+    "numa_memory_unknown": "Placement mémoire : non disponible",
+    "numa_memory_placement": "Placement mémoire : {placement}",
+    "numa_node_share": "nœud {node} : {size:.1f} Mo ({percent:.0f} %)",
+    "numa_nodes_header": "\nNœuds NUMA :\n",
+    "numa_node_format": "  Nœud {node} (CPU {cpus}) : Utilisé {used_gb:.2f} Go / {total_gb:.2f} Go, Libre {free_gb:.2f} Go\n",
+    "limit_resources": "Limiter les ressources...",
+    "limit_tree_resources": "Limiter l'arbre de processus...",
+    "limit_resources_title": "Limiter les ressources",
+    "limit_resources_target": "{name} (PID {pid}) : {count} processus seront déplacés dans un nouveau cgroup.",
+    "limit_unlimited": "Illimité",
+    "limit_no_device": "Pas de limite d'E/S",
+    "limit_cpu": "Limite CPU (100 % = un CPU) :",
+    "limit_memory_high": "Mémoire haute (ralenti au-delà) :",
+    "limit_memory_max": "Mémoire max (OOM au-delà) :",
+    "limit_io_device": "Périphérique d'E/S :",
+    "limit_io_read": "Limite de lecture :",
+    "limit_io_write": "Limite d'écriture :",
+    "limit_error": "Impossible de configurer le cgroup : {e}",
+    "limit_move_error": "Impossible de déplacer le processus dans {cgroup} : {e}",
+    "limit_success": "{count} processus déplacé(s) dans {cgroup}.",
+    "limit_partial": "{count} n'ont pas pu être déplacés.",
+    "remove_limits": "Supprimer les limites",
+    "tab_limits": "Limites",
+    "limits_hint": "Faites un clic droit sur un processus et choisissez Limiter les ressources pour le déplacer (ou son arbre) dans un cgroup avec des limites CPU, mémoire et E/S.",
+    "columns_limits_table": ["Cgroup", "Processus", "CPU %", "Limite CPU %", "Mémoire Mo", "Mémoire haute Mo", "Mémoire max Mo", "Lecture Ko/s", "Limite lecture Ko/s", "Écriture Ko/s", "Limite écriture Ko/s"],
+    "bulk_terminate": "Terminer",
+    "kill_tree": "Tuer l'arbre de processus",
+    "bulk_more_names": "et {count} de plus",
+    "bulk_busy": "Une autre action groupée est encore en cours.",
+    "bulk_confirm": "{action} {count} processus ?\n{names}",
+    "bulk_renice_prompt": "Valeur nice (-20 à 19) :",
+    "bulk_progress": "{action} : {done}/{total}",
+    "graceful_stop": "Arrêter le processus",
+    "grace_period": "SIGKILL après :",
+    "bulk_outcome_ok": "effectués",
+    "bulk_outcome_terminated": "terminés après SIGTERM",
+    "bulk_outcome_killed": "tués après le délai de grâce",
+    "bulk_outcome_gone": "déjà terminés",
+    "bulk_outcome_denied": "permission refusée",
+    "bulk_outcome_error": "échoués",
+    "tab_pattern_actions": "Actions par motif",
+    "pattern_label": "Motif (regex) :",
+    "pattern_full_cmdline": "Comparer la ligne de commande complète",
+    "pattern_users": "Utilisateurs (séparés par des virgules) :",
+    "pattern_condition": "Condition (comme dans les règles d'alerte) :",
+    "pattern_preview": "Aperçu",
+    "pattern_apply": "Appliquer aux correspondances",
+    "pattern_error": "Requête invalide : {error}",
+    "pattern_summary": "{count} processus : CPU {cpu:.1f} %, RSS {rss:.1f} Mo, Lecture {read:.1f} Ko/s, Écriture {write:.1f} Ko/s",
+    "pattern_action_signal": "Envoyer un signal",
+    "pattern_action_renice": "Définir la valeur nice",
+    "pattern_action_affinity": "Définir l'affinité CPU",
+    "columns_pattern_table": ["PID", "Nom", "Utilisateur", "CPU %", "Mémoire Mo", "Ligne de commande"],
+    "helper_start": "Agir en administrateur",
+    "helper_stop": "Abandonner les privilèges",
+    "helper_starting": "En attente d'authentification...",
+    "helper_running": "L'assistant privilégié est en cours d'exécution.",
+    "helper_tooltip": "Démarrer un assistant privilégié pour gérer et inspecter les processus des autres utilisateurs.",
+    "helper_start_error": "Impossible de démarrer l'assistant privilégié : {e}",
+    "alert_system": "Système",
+    "alert_notification_system": "{rule} : tout le système",
+    "anomaly_window": "sur les dernières :",
+    "limit_needs_helper": "La gestion des cgroups nécessite root ; utilisez « Agir en administrateur » et réessayez.",
+    "numa_memory_pending": "Placement mémoire : mesure en cours...",
 }
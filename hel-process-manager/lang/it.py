@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Programmi all'Avvio",
     "tab_about": "Informazioni",
 
-    "columns_process_table": ["PID", "Nome", "CPU %", "RAM %", "Utente", "PID Genitore", "Ora di Avvio", "Percorso", "Thread", "Stato"],
+    "columns_process_table": ["PID", "Nome", "CPU %", "RAM %", "Utente", "PID Genitore", "Ora di Avvio", "Percorso", "Thread", "Stato", "Lettura KB/s", "Scrittura KB/s", "Chiamate I/O/s", "RSS MB", "PSS MB", "USS MB", "Swap MB", "Attesa Esec. ms/s", "CC Vol./s", "CC Invol./s", "Ultima CPU", "Fault Minori/s", "Fault Maggiori/s", "Punteggio OOM", "Pressione Memoria", "Container", "ID container", "PID NS", "Crescita MB/h", "RAM piena tra", "NUMA locale %"],
 
     "about_text": (
         "Gestore Processi Helwan\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "L'elenco dei programmi all'avvio è complesso e specifico della piattaforma.\\npsutil offre un accesso diretto limitato a questo scopo.\\n\\nSu Windows, ciò implica spesso chiavi di registro e cartelle di avvio.\\nSu Linux, ciò implica systemd, l'autostart XDG e i gestori di sessione.\\n\\nQuesta funzionalità richiederebbe implementazioni specifiche della piattaforma.",
     "startup_error": "Errore durante il recupero dei programmi all'avvio: {e}",
     "startup_feature_note": "Questa funzionalità è un segnaposto e richiede un'implementazione specifica della piattaforma per abilitare/disabilitare i programmi all'avvio.",
-    "language_file_missing_hint": "Assicurati che la cartella 'lang' esista con 'en.py' e 'ar.py' (o altri file di lingua) all'interno."
+    "language_file_missing_hint": "Assicurati che la cartella 'lang' esista con 'en.py' e 'ar.py' (o altri file di lingua) all'interno.",
+    "disk_iops_graph_title": "IOPS Disco (per dispositivo)",
+    "disk_throughput_graph_title": "Throughput Disco (KB/s per dispositivo)",
+    "disk_await_graph_title": "Attesa Media Disco (ms)",
+    "disk_util_graph_title": "Utilizzo Disco (%)",
+    "disk_queue_graph_title": "Profondità Coda Disco (I/O in corso)",
+    "smaps_age_tooltip": "Campionato {age:.0f}s fa",
+    "memory_map": "Mappa Memoria",
+    "memory_map_title": "Mappa Memoria - {name} ({pid})",
+    "memory_map_loading": "Lettura della mappa memoria...",
+    "memory_map_progress": "{count} mappature analizzate...",
+    "memory_map_summary": "{count} mappature, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Dirty {dirty:.1f} MB, Swap {swap:.1f} MB",
+    "memory_map_error": "Impossibile leggere la mappa memoria: {e}",
+    "memory_map_groups_header": "Per mappatura",
+    "memory_map_top_header": "Mappature più grandi (per RSS)",
+    "memory_map_group_columns": ["Mappatura", "Numero", "Dimensione KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "memory_map_top_columns": ["Indirizzo", "Permessi", "Mappatura", "Dimensione KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"],
+    "show_threads": "Mostra Thread",
+    "hide_threads": "Nascondi Thread",
+    "threads_select_process": "Seleziona un processo per vederne i thread.",
+    "threads_error": "Impossibile leggere i thread del PID {pid}: {e}",
+    "threads_header": "Thread del PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Nome", "Stato", "CPU %", "Cambi Volontari", "Cambi Involontari", "Ultima CPU"],
+    "inspect_section_open_files": "File Aperti",
+    "inspect_section_connections": "Connessioni",
+    "inspect_section_environment": "Ambiente",
+    "inspect_section_limits": "Limiti",
+    "inspect_filter": "Filtra...",
+    "prev_page": "Precedente",
+    "next_page": "Successivo",
+    "inspect_loading": "Caricamento... {count} elementi",
+    "inspect_page": "Pagina {page}/{pages} ({count} elementi)",
+    "inspect_section_denied": "Permesso Negato",
+    "inspect_section_error": "Errore durante il recupero ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Lettura KB/s", "Scrittura KB/s", "FD Aperti", "Thread", "Cambi di Contesto/s"],
+    "run_delay_graph_title": "Ritardo Coda di Esecuzione CPU (ms/s, tutte le CPU)",
+    "run_delay_not_available": "Ritardo Coda di Esecuzione Non Disponibile",
+    "cpu_pressure_graph_title": "Stallo per Pressione CPU (ms/s)",
+    "group_by": "Raggruppa per:",
+    "group_by_none": "Nessun raggruppamento",
+    "group_by_cgroup": "Servizio / cgroup",
+    "columns_group_tree": ["Gruppo / Processo", "PID", "Processi", "CPU %", "Memoria MB", "Lettura KB/s", "Scrittura KB/s"],
+    "group_by_container": "Container",
+    "container_host": "Host",
+    "group_by_user": "Utente",
+    "group_by_exe": "Eseguibile",
+    "tab_recently_exited": "Terminati di recente",
+    "columns_lifecycle_table": ["Ora di uscita", "PID", "PPID", "Nome", "Riga di comando", "Durata s", "CPU s", "Stato di uscita"],
+    "exit_signal": "Segnale {signal}",
+    "lifecycle_source_connector": "Acquisizione di ogni uscita di processo tramite il proc connector del kernel.",
+    "lifecycle_source_polling": "Acquisizione delle uscite interrogando /proc ogni {interval} ms (eseguire come root per un'acquisizione esatta).",
+    "tab_cpu_leaderboard": "Tempo CPU",
+    "leaderboard_window": "Classifica per tempo CPU negli ultimi:",
+    "leaderboard_minutes": "{minutes} minuti",
+    "leaderboard_by_name": "Unisci i processi con lo stesso nome",
+    "leaderboard_processes": "Processi",
+    "leaderboard_running": "In esecuzione",
+    "leaderboard_exited": "Terminato",
+    "columns_leaderboard_table": ["PID", "Nome", "Comando", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Stato"],
+    "leak_fit_tooltip": "Regressione lineare r² = {r2:.2f}",
+    "leak_eta": "{hours} h {minutes:02d} min",
+    "anomaly_threshold": "Evidenzia anomalie oltre lo z-score:",
+    "anomaly_off": "Disattivato",
+    "anomaly_tooltip": "z-score {z:.1f} (di solito {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Avvisi",
+    "apply_alert_rules": "Applica regole",
+    "alert_rules_error": "Regole non applicate: {error}",
+    "alert_rules_loaded": "{count} regola/e attiva/e.",
+    "alert_rules_not_saved": "Regole applicate ma non salvate: {error}",
+    "alert_firing": "Attivo",
+    "alert_resolved": "Risolto",
+    "alert_title": "Avviso processo",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "Avviso '{rule}': azione non riuscita: {error}",
+    "columns_alert_log": ["Ora", "Regola", "PID", "Nome", "Stato"],
+    "tab_policies": "Criteri",
+    "apply_policies": "Applica criteri",
+    "policies_error": "Criteri non applicati: {error}",
+    "policies_loaded": "{count} criterio/i attivo/i.",
+    "policies_not_saved": "Criteri applicati ma non salvati: {error}",
+    "policy_failed": "Non riuscito: {error}",
+    "columns_policy_log": ["Ora", "Criterio", "PID", "Nome", "Risultato"],
+    "affinity_preset": "Preimpostazione:",
+    "affinity_preset_current": "Affinità attuale",
+    "affinity_preset_all": "Tutte le CPU",
+    "affinity_preset_physical": "Solo core fisici",
+    "affinity_preset_node": "Nodo {node} (CPU {cpus})",
+    "affinity_preset_socket": "Socket {socket} (CPU {cpus})",
+    "topology_socket": "Socket {socket}",
+    "topology_node": "Nodo NUMA {node}",
+    "topology_node_memory": "({size:.1f} MB di questo processo)",
+    "topology_l3": "L3 condivisa: CPU {cpus}",
+    "topology_core": "Core {core} (SMT: CPU {cpus})",
+    "numa_memory_unknown": "Posizionamento memoria: non disponibile",
+    "numa_memory_placement": "Posizionamento memoria: {placement}",
+    "numa_node_share": "nodo {node}: {size:.1f} MB ({percent:.0f}%)",
+    "numa_nodes_header": "\nNodi NUMA:\n",
+    "numa_node_format": "  Nodo {node} (CPU {cpus}): Usata {used_gb:.2f} GB / {total_gb:.2f} GB, Libera {free_gb:.2f} GB\n",
+    "limit_resources": "Limita risorse...",
+    "limit_tree_resources": "Limita albero dei processi...",
+    "limit_resources_title": "Limita risorse",
+    "limit_resources_target": "{name} (PID {pid}): {count} processo/i verranno spostati in un nuovo cgroup.",
+    "limit_unlimited": "Illimitato",
+    "limit_no_device": "Nessun limite I/O",
+    "limit_cpu": "Limite CPU (100% = una CPU):",
+    "limit_memory_high": "Memoria alta (rallenta oltre):",
+    "limit_memory_max": "Memoria max (OOM oltre):",
+    "limit_io_device": "Dispositivo I/O:",
+    "limit_io_read": "Limite lettura:",
+    "limit_io_write": "Limite scrittura:",
+    "limit_error": "Impossibile configurare il cgroup: {e}",
+    "limit_move_error": "Impossibile spostare il processo in {cgroup}: {e}",
+    "limit_success": "{count} processo/i spostato/i in {cgroup}.",
+    "limit_partial": "{count} non è stato possibile spostarli.",
+    "remove_limits": "Rimuovi limiti",
+    "tab_limits": "Limiti",
+    "limits_hint": "Fai clic con il tasto destro su un processo e scegli Limita risorse per spostarlo (o il suo albero) in un cgroup con limiti di CPU, memoria e I/O.",
+    "columns_limits_table": ["Cgroup", "Processi", "CPU %", "Limite CPU %", "Memoria MB", "Memoria alta MB", "Memoria max MB", "Lettura KB/s", "Limite lettura KB/s", "Scrittura KB/s", "Limite scrittura KB/s"],
+    "bulk_terminate": "Termina",
+    "kill_tree": "Termina albero dei processi",
+    "bulk_more_names": "e altri {count}",
+    "bulk_busy": "Un'altra azione multipla è ancora in corso.",
+    "bulk_confirm": "{action} {count} processo/i?\n{names}",
+    "bulk_renice_prompt": "Valore nice (da -20 a 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "Termina processo",
+    "grace_period": "SIGKILL dopo:",
+    "bulk_outcome_ok": "completati",
+    "bulk_outcome_terminated": "terminati dopo SIGTERM",
+    "bulk_outcome_killed": "uccisi dopo il periodo di tolleranza",
+    "bulk_outcome_gone": "già terminati",
+    "bulk_outcome_denied": "permesso negato",
+    "bulk_outcome_error": "non riusciti",
+    "tab_pattern_actions": "Azioni per modello",
+    "pattern_label": "Modello (regex):",
+    "pattern_full_cmdline": "Confronta l'intera riga di comando",
+    "pattern_users": "Utenti (separati da virgole):",
+    "pattern_condition": "Condizione (come nelle regole di avviso):",
+    "pattern_preview": "Anteprima",
+    "pattern_apply": "Applica alle corrispondenze",
+    "pattern_error": "Query non valida: {error}",
+    "pattern_summary": "{count} processi: CPU {cpu:.1f}%, RSS {rss:.1f} MB, Lettura {read:.1f} KB/s, Scrittura {write:.1f} KB/s",
+    "pattern_action_signal": "Invia segnale",
+    "pattern_action_renice": "Imposta valore nice",
+    "pattern_action_affinity": "Imposta affinità CPU",
+    "columns_pattern_table": ["PID", "Nome", "Utente", "CPU %", "Memoria MB", "Riga di comando"],
+    "helper_start": "Agisci come amministratore",
+    "helper_stop": "Rinuncia ai privilegi",
+    "helper_starting": "In attesa di autenticazione...",
+    "helper_running": "L'assistente privilegiato è in esecuzione.",
+    "helper_tooltip": "Avvia un assistente privilegiato per gestire e ispezionare i processi di altri utenti.",
+    "helper_start_error": "Impossibile avviare l'assistente privilegiato: {e}",
+    "alert_system": "Sistema",
+    "alert_notification_system": "{rule}: intero sistema",
+    "anomaly_window": "negli ultimi:",
+    "limit_needs_helper": "La gestione dei cgroup richiede root; usa \"Agisci come amministratore\" e riprova.",
+    "numa_memory_pending": "Posizione della memoria: misurazione...",
 }
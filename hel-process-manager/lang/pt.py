@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Programas de Inicialização",
     "tab_about": "Sobre",
 
-    "columns_process_table": ["PID", "Nome", "CPU %", "RAM %", "Usuário", "PID Pai", "Hora de Início", "Caminho", "Threads", "Status"],
+    "columns_process_table": ["PID", "Nome", "CPU %", "RAM %", "Usuário", "PID Pai", "Hora de Início", "Caminho", "Threads", "Status", "Leitura KB/s", "Escrita KB/s", "Chamadas E/S/s", "RSS MB", "PSS MB", "USS MB", "Swap MB", "Espera Exec. ms/s", "TC Vol./s", "TC Invol./s", "Última CPU", "Faltas Menores/s", "Faltas Maiores/s", "Pontuação OOM", "Pressão de Memória", "Contêiner", "ID do contêiner", "PID no NS", "Crescimento MB/h", "RAM cheia em", "NUMA local %"],
 
     "about_text": (
         "Gerenciador de Processos Helwan\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "A listagem de programas de inicialização é complexa e específica da plataforma.\\npsutil oferece acesso direto limitado para isso.\\n\\nNo Windows, isso geralmente envolve chaves de registro e pastas de inicialização.\\nNo Linux, envolve systemd, inicialização XDG e gerenciadores de sessão.\\n\\nEste recurso exigiria implementações específicas da plataforma.",
     "startup_error": "Erro ao recuperar programas de inicialização: {e}",
     "startup_feature_note": "Este recurso é um espaço reservado e requer implementação específica da plataforma para habilitar/desabilitar programas de inicialização.",
-    "language_file_missing_hint": "Certifique-se de que a pasta 'lang' exista com 'en.py' e 'ar.py' (ou outros arquivos de idioma) dentro."
+    "language_file_missing_hint": "Certifique-se de que a pasta 'lang' exista com 'en.py' e 'ar.py' (ou outros arquivos de idioma) dentro.",
+    "disk_iops_graph_title": "IOPS do Disco (por dispositivo)",
+    "disk_throughput_graph_title": "Vazão do Disco (KB/s por dispositivo)",
+    "disk_await_graph_title": "Espera Média do Disco (ms)",
+    "disk_util_graph_title": "Utilização do Disco (%)",
+    "disk_queue_graph_title": "Profundidade da Fila do Disco (E/S em andamento)",
+    "smaps_age_tooltip": "Amostrado há {age:.0f}s",
+    "memory_map": "Mapa de Memória",
+    "memory_map_title": "Mapa de Memória - {name} ({pid})",
+    "memory_map_loading": "Lendo mapa de memória...",
+    "memory_map_progress": "{count} mapeamentos analisados...",
+    "memory_map_summary": "{count} mapeamentos, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Suja {dirty:.1f} MB, Swap {swap:.1f} MB",
+    "memory_map_error": "Não foi possível ler o mapa de memória: {e}",
+    "memory_map_groups_header": "Por mapeamento",
+    "memory_map_top_header": "Maiores mapeamentos (por RSS)",
+    "memory_map_group_columns": ["Mapeamento", "Quantidade", "Tamanho KB", "RSS KB", "PSS KB", "Suja KB", "Swap KB"],
+    "memory_map_top_columns": ["Endereço", "Permissões", "Mapeamento", "Tamanho KB", "RSS KB", "PSS KB", "Suja KB", "Swap KB"],
+    "show_threads": "Mostrar Threads",
+    "hide_threads": "Ocultar Threads",
+    "threads_select_process": "Selecione um processo para ver suas threads.",
+    "threads_error": "Não foi possível ler as threads do PID {pid}: {e}",
+    "threads_header": "Threads do PID {pid} ({count})",
+    "columns_thread_table": ["TID", "Nome", "Estado", "CPU %", "Trocas Voluntárias", "Trocas Involuntárias", "Última CPU"],
+    "inspect_section_open_files": "Arquivos Abertos",
+    "inspect_section_connections": "Conexões",
+    "inspect_section_environment": "Ambiente",
+    "inspect_section_limits": "Limites",
+    "inspect_filter": "Filtrar...",
+    "prev_page": "Anterior",
+    "next_page": "Próximo",
+    "inspect_loading": "Carregando... {count} itens",
+    "inspect_page": "Página {page}/{pages} ({count} itens)",
+    "inspect_section_denied": "Permissão Negada",
+    "inspect_section_error": "Erro ao obter ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Leitura KB/s", "Escrita KB/s", "FDs Abertos", "Threads", "Trocas de Contexto/s"],
+    "run_delay_graph_title": "Atraso da Fila de Execução (ms/s, todas as CPUs)",
+    "run_delay_not_available": "Atraso da Fila de Execução Não Disponível",
+    "cpu_pressure_graph_title": "Bloqueio por Pressão de CPU (ms/s)",
+    "group_by": "Agrupar por:",
+    "group_by_none": "Sem agrupamento",
+    "group_by_cgroup": "Serviço / cgroup",
+    "columns_group_tree": ["Grupo / Processo", "PID", "Processos", "CPU %", "Memória MB", "Leitura KB/s", "Escrita KB/s"],
+    "group_by_container": "Contêiner",
+    "container_host": "Host",
+    "group_by_user": "Usuário",
+    "group_by_exe": "Executável",
+    "tab_recently_exited": "Encerrados recentemente",
+    "columns_lifecycle_table": ["Hora de saída", "PID", "PPID", "Nome", "Linha de comando", "Duração s", "CPU s", "Status de saída"],
+    "exit_signal": "Sinal {signal}",
+    "lifecycle_source_connector": "Capturando cada saída de processo pelo proc connector do kernel.",
+    "lifecycle_source_polling": "Capturando saídas de processos consultando /proc a cada {interval} ms (execute como root para captura exata).",
+    "tab_cpu_leaderboard": "Tempo de CPU",
+    "leaderboard_window": "Classificar por tempo de CPU em:",
+    "leaderboard_minutes": "{minutes} minutos",
+    "leaderboard_by_name": "Combinar processos com o mesmo nome",
+    "leaderboard_processes": "Processos",
+    "leaderboard_running": "Em execução",
+    "leaderboard_exited": "Encerrado",
+    "columns_leaderboard_table": ["PID", "Nome", "Comando", "CPU s (5 min)", "CPU s (15 min)", "CPU s (60 min)", "Status"],
+    "leak_fit_tooltip": "Ajuste linear r² = {r2:.2f}",
+    "leak_eta": "{hours} h {minutes:02d} min",
+    "anomaly_threshold": "Destacar anomalias acima do escore z:",
+    "anomaly_off": "Desligado",
+    "anomaly_tooltip": "Escore z {z:.1f} (normalmente {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Alertas",
+    "apply_alert_rules": "Aplicar regras",
+    "alert_rules_error": "Regras não aplicadas: {error}",
+    "alert_rules_loaded": "{count} regra(s) ativa(s).",
+    "alert_rules_not_saved": "Regras aplicadas, mas não salvas: {error}",
+    "alert_firing": "Disparado",
+    "alert_resolved": "Resolvido",
+    "alert_title": "Alerta de processo",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "Alerta '{rule}': a ação falhou: {error}",
+    "columns_alert_log": ["Hora", "Regra", "PID", "Nome", "Estado"],
+    "tab_policies": "Políticas",
+    "apply_policies": "Aplicar políticas",
+    "policies_error": "Políticas não aplicadas: {error}",
+    "policies_loaded": "{count} política(s) ativa(s).",
+    "policies_not_saved": "Políticas aplicadas, mas não salvas: {error}",
+    "policy_failed": "Falhou: {error}",
+    "columns_policy_log": ["Hora", "Política", "PID", "Nome", "Resultado"],
+    "affinity_preset": "Predefinição:",
+    "affinity_preset_current": "Afinidade atual",
+    "affinity_preset_all": "Todas as CPUs",
+    "affinity_preset_physical": "Apenas núcleos físicos",
+    "affinity_preset_node": "Nó {node} (CPUs {cpus})",
+    "affinity_preset_socket": "Soquete {socket} (CPUs {cpus})",
+    "topology_socket": "Soquete {socket}",
+    "topology_node": "Nó NUMA {node}",
+    "topology_node_memory": "({size:.1f} MB deste processo)",
+    "topology_l3": "L3 compartilhado: CPUs {cpus}",
+    "topology_core": "Núcleo {core} (SMT: CPUs {cpus})",
+    "numa_memory_unknown": "Posicionamento da memória: indisponível",
+    "numa_memory_placement": "Posicionamento da memória: {placement}",
+    "numa_node_share": "nó {node}: {size:.1f} MB ({percent:.0f}%)",
+    "numa_nodes_header": "\nNós NUMA:\n",
+    "numa_node_format": "  Nó {node} (CPUs {cpus}): Usado {used_gb:.2f} GB / {total_gb:.2f} GB, Livre {free_gb:.2f} GB\n",
+    "limit_resources": "Limitar recursos...",
+    "limit_tree_resources": "Limitar árvore de processos...",
+    "limit_resources_title": "Limitar recursos",
+    "limit_resources_target": "{name} (PID {pid}): {count} processo(s) serão movidos para um novo cgroup.",
+    "limit_unlimited": "Ilimitado",
+    "limit_no_device": "Sem limite de E/S",
+    "limit_cpu": "Limite de CPU (100% = uma CPU):",
+    "limit_memory_high": "Memória alta (limitada acima):",
+    "limit_memory_max": "Memória máx. (OOM acima):",
+    "limit_io_device": "Dispositivo de E/S:",
+    "limit_io_read": "Limite de leitura:",
+    "limit_io_write": "Limite de escrita:",
+    "limit_error": "Não foi possível configurar o cgroup: {e}",
+    "limit_move_error": "Não foi possível mover o processo para {cgroup}: {e}",
+    "limit_success": "{count} processo(s) movido(s) para {cgroup}.",
+    "limit_partial": "{count} não puderam ser movidos.",
+    "remove_limits": "Remover limites",
+    "tab_limits": "Limites",
+    "limits_hint": "Clique com o botão direito em um processo e escolha Limitar recursos para movê-lo (ou sua árvore) para um cgroup com limites de CPU, memória e E/S.",
+    "columns_limits_table": ["Cgroup", "Processos", "CPU %", "Limite CPU %", "Memória MB", "Memória alta MB", "Memória máx. MB", "Leitura KB/s", "Limite leitura KB/s", "Escrita KB/s", "Limite escrita KB/s"],
+    "bulk_terminate": "Terminar",
+    "kill_tree": "Encerrar árvore de processos",
+    "bulk_more_names": "e mais {count}",
+    "bulk_busy": "Outra ação em massa ainda está em execução.",
+    "bulk_confirm": "{action} {count} processo(s)?\n{names}",
+    "bulk_renice_prompt": "Valor nice (-20 a 19):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "Finalizar processo",
+    "grace_period": "SIGKILL após:",
+    "bulk_outcome_ok": "concluídos",
+    "bulk_outcome_terminated": "encerrados após SIGTERM",
+    "bulk_outcome_killed": "encerrados à força após o período de espera",
+    "bulk_outcome_gone": "já encerrados",
+    "bulk_outcome_denied": "permissão negada",
+    "bulk_outcome_error": "falharam",
+    "tab_pattern_actions": "Ações por padrão",
+    "pattern_label": "Padrão (regex):",
+    "pattern_full_cmdline": "Comparar linha de comando completa",
+    "pattern_users": "Usuários (separados por vírgulas):",
+    "pattern_condition": "Condição (como nas regras de alerta):",
+    "pattern_preview": "Pré-visualizar",
+    "pattern_apply": "Aplicar às correspondências",
+    "pattern_error": "Consulta inválida: {error}",
+    "pattern_summary": "{count} processo(s): CPU {cpu:.1f}%, RSS {rss:.1f} MB, Leitura {read:.1f} KB/s, Escrita {write:.1f} KB/s",
+    "pattern_action_signal": "Enviar sinal",
+    "pattern_action_renice": "Definir valor nice",
+    "pattern_action_affinity": "Definir afinidade de CPU",
+    "columns_pattern_table": ["PID", "Nome", "Usuário", "CPU %", "Memória MB", "Linha de comando"],
+    "helper_start": "Agir como administrador",
+    "helper_stop": "Abrir mão dos privilégios",
+    "helper_starting": "Aguardando autenticação...",
+    "helper_running": "O assistente privilegiado está em execução.",
+    "helper_tooltip": "Iniciar um assistente privilegiado para gerenciar e inspecionar processos de outros usuários.",
+    "helper_start_error": "Não foi possível iniciar o assistente privilegiado: {e}",
+    "alert_system": "Sistema",
+    "alert_notification_system": "{rule}: todo o sistema",
+    "anomaly_window": "nos últimos:",
+    "limit_needs_helper": "Gerir cgroups requer root; use \"Agir como administrador\" e tente novamente.",
+    "numa_memory_pending": "Posicionamento da memória: a medir...",
 }
@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "Başlangıç Programları",
     "tab_about": "Hakkında",
 
-    "columns_process_table": ["PID", "Ad", "CPU %", "RAM %", "Kullanıcı", "Üst PID", "Başlangıç Zamanı", "Yol", "İş Parçacıkları", "Durum"],
+    "columns_process_table": ["PID", "Ad", "CPU %", "RAM %", "Kullanıcı", "Üst PID", "Başlangıç Zamanı", "Yol", "İş Parçacıkları", "Durum", "Okuma KB/s", "Yazma KB/s", "G/Ç Çağrı/s", "RSS MB", "PSS MB", "USS MB", "Takas MB", "Çalışma Bekleme ms/s", "Gönüllü BG/s", "Zorunlu BG/s", "Son CPU", "Küçük Hatalar/s", "Büyük Hatalar/s", "OOM Puanı", "Bellek Baskısı", "Konteyner", "Konteyner ID", "NS PID", "Büyüme MB/sa", "RAM dolmasına", "NUMA yerel %"],
 
     "about_text": (
         "Helwan Süreç Yöneticisi\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "Başlangıç programlarının listelenmesi karmaşık ve platforma özgüdür.\\npsutil bu amaçla sınırlı doğrudan erişim sunar.\\n\\nWindows'ta genellikle kayıt defteri anahtarları ve başlangıç klasörlerini içerir.\\nLinux'ta ise systemd, XDG otomatik başlatma ve oturum yöneticilerini içerir.\\n\\nBu özellik, platforma özgü uygulamalar gerektirecektir.",
     "startup_error": "Başlangıç programları alınırken hata oluştu: {e}",
     "startup_feature_note": "Bu özellik bir yer tutucudur ve başlangıç programlarını etkinleştirmek/devre dışı bırakmak için platforma özgü bir uygulama gerektirir.",
-    "language_file_missing_hint": "'lang' klasörünün içinde 'en.py' ve 'ar.py' (veya diğer dil dosyalarının) bulunduğundan emin olun."
+    "language_file_missing_hint": "'lang' klasörünün içinde 'en.py' ve 'ar.py' (veya diğer dil dosyalarının) bulunduğundan emin olun.",
+    "disk_iops_graph_title": "Disk IOPS (aygıt başına)",
+    "disk_throughput_graph_title": "Disk Aktarım Hızı (aygıt başına KB/s)",
+    "disk_await_graph_title": "Ortalama Disk Bekleme (ms)",
+    "disk_util_graph_title": "Disk Kullanımı (%)",
+    "disk_queue_graph_title": "Disk Kuyruk Derinliği (süren G/Ç)",
+    "smaps_age_tooltip": "{age:.0f}s önce ölçüldü",
+    "memory_map": "Bellek Haritası",
+    "memory_map_title": "Bellek Haritası - {name} ({pid})",
+    "memory_map_loading": "Bellek haritası okunuyor...",
+    "memory_map_progress": "{count} eşleme ayrıştırıldı...",
+    "memory_map_summary": "{count} eşleme, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Kirli {dirty:.1f} MB, Takas {swap:.1f} MB",
+    "memory_map_error": "Bellek haritası okunamadı: {e}",
+    "memory_map_groups_header": "Eşlemeye göre",
+    "memory_map_top_header": "En büyük eşlemeler (RSS'e göre)",
+    "memory_map_group_columns": ["Eşleme", "Sayı", "Boyut KB", "RSS KB", "PSS KB", "Kirli KB", "Takas KB"],
+    "memory_map_top_columns": ["Adres", "İzinler", "Eşleme", "Boyut KB", "RSS KB", "PSS KB", "Kirli KB", "Takas KB"],
+    "show_threads": "İş Parçacıklarını Göster",
+    "hide_threads": "İş Parçacıklarını Gizle",
+    "threads_select_process": "İş parçacıklarını görmek için bir işlem seçin.",
+    "threads_error": "PID {pid} iş parçacıkları okunamadı: {e}",
+    "threads_header": "PID {pid} iş parçacıkları ({count})",
+    "columns_thread_table": ["TID", "Ad", "Durum", "CPU %", "Gönüllü Geçişler", "Zorunlu Geçişler", "Son CPU"],
+    "inspect_section_open_files": "Açık Dosyalar",
+    "inspect_section_connections": "Bağlantılar",
+    "inspect_section_environment": "Ortam",
+    "inspect_section_limits": "Sınırlar",
+    "inspect_filter": "Filtrele...",
+    "prev_page": "Önceki",
+    "next_page": "Sonraki",
+    "inspect_loading": "Yükleniyor... {count} öğe",
+    "inspect_page": "Sayfa {page}/{pages} ({count} öğe)",
+    "inspect_section_denied": "İzin Reddedildi",
+    "inspect_section_error": "Alınırken hata ({error})",
+    "detail_metrics": ["CPU %", "RSS MB", "Okuma KB/s", "Yazma KB/s", "Açık FD'ler", "İş Parçacıkları", "Bağlam Geçişi/s"],
+    "run_delay_graph_title": "CPU Çalışma Kuyruğu Gecikmesi (ms/s, tüm CPU'lar)",
+    "run_delay_not_available": "Çalışma Kuyruğu Gecikmesi Kullanılamıyor",
+    "cpu_pressure_graph_title": "CPU Baskı Beklemesi (ms/s)",
+    "group_by": "Gruplama:",
+    "group_by_none": "Gruplama yok",
+    "group_by_cgroup": "Servis / cgroup",
+    "columns_group_tree": ["Grup / İşlem", "PID", "İşlemler", "CPU %", "Bellek MB", "Okuma KB/s", "Yazma KB/s"],
+    "group_by_container": "Konteyner",
+    "container_host": "Ana makine",
+    "group_by_user": "Kullanıcı",
+    "group_by_exe": "Çalıştırılabilir dosya",
+    "tab_recently_exited": "Yakın zamanda sonlananlar",
+    "columns_lifecycle_table": ["Çıkış zamanı", "PID", "PPID", "Ad", "Komut satırı", "Çalışma süresi sn", "CPU sn", "Çıkış durumu"],
+    "exit_signal": "Sinyal {signal}",
+    "lifecycle_source_connector": "Her işlem çıkışı çekirdeğin proc connector'ı ile yakalanıyor.",
+    "lifecycle_source_polling": "İşlem çıkışları /proc her {interval} ms'de taranarak yakalanıyor (tam yakalama için root olarak çalıştırın).",
+    "tab_cpu_leaderboard": "CPU Süresi",
+    "leaderboard_window": "CPU süresine göre sırala:",
+    "leaderboard_minutes": "{minutes} dakika",
+    "leaderboard_by_name": "Aynı adlı işlemleri birleştir",
+    "leaderboard_processes": "İşlemler",
+    "leaderboard_running": "Çalışıyor",
+    "leaderboard_exited": "Sonlandı",
+    "columns_leaderboard_table": ["PID", "Ad", "Komut", "CPU sn (5 dk)", "CPU sn (15 dk)", "CPU sn (60 dk)", "Durum"],
+    "leak_fit_tooltip": "Doğrusal uyum r² = {r2:.2f}",
+    "leak_eta": "{hours} sa {minutes:02d} dk",
+    "anomaly_threshold": "Şu z-skorunun üstündeki anormallikleri vurgula:",
+    "anomaly_off": "Kapalı",
+    "anomaly_tooltip": "z-skoru {z:.1f} (genelde {mean:.1f} ± {std:.1f})",
+    "tab_alerts": "Uyarılar",
+    "apply_alert_rules": "Kuralları uygula",
+    "alert_rules_error": "Kurallar uygulanmadı: {error}",
+    "alert_rules_loaded": "{count} kural etkin.",
+    "alert_rules_not_saved": "Kurallar uygulandı ancak kaydedilemedi: {error}",
+    "alert_firing": "Tetiklendi",
+    "alert_resolved": "Çözüldü",
+    "alert_title": "İşlem uyarısı",
+    "alert_notification": "{rule}: {name} (PID {pid})",
+    "alert_hook_error": "'{rule}' uyarısı: eylem başarısız: {error}",
+    "columns_alert_log": ["Zaman", "Kural", "PID", "Ad", "Durum"],
+    "tab_policies": "İlkeler",
+    "apply_policies": "İlkeleri uygula",
+    "policies_error": "İlkeler uygulanmadı: {error}",
+    "policies_loaded": "{count} ilke etkin.",
+    "policies_not_saved": "İlkeler uygulandı ancak kaydedilemedi: {error}",
+    "policy_failed": "Başarısız: {error}",
+    "columns_policy_log": ["Zaman", "İlke", "PID", "Ad", "Sonuç"],
+    "affinity_preset": "Hazır ayar:",
+    "affinity_preset_current": "Geçerli benzeşim",
+    "affinity_preset_all": "Tüm CPU'lar",
+    "affinity_preset_physical": "Yalnızca fiziksel çekirdekler",
+    "affinity_preset_node": "Düğüm {node} (CPU {cpus})",
+    "affinity_preset_socket": "Soket {socket} (CPU {cpus})",
+    "topology_socket": "Soket {socket}",
+    "topology_node": "NUMA düğümü {node}",
+    "topology_node_memory": "(bu işlemin {size:.1f} MB'ı)",
+    "topology_l3": "Paylaşılan L3: CPU {cpus}",
+    "topology_core": "Çekirdek {core} (SMT: CPU {cpus})",
+    "numa_memory_unknown": "Bellek yerleşimi: kullanılamıyor",
+    "numa_memory_placement": "Bellek yerleşimi: {placement}",
+    "numa_node_share": "düğüm {node}: {size:.1f} MB (%{percent:.0f})",
+    "numa_nodes_header": "\nNUMA Düğümleri:\n",
+    "numa_node_format": "  Düğüm {node} (CPU {cpus}): Kullanılan {used_gb:.2f} GB / {total_gb:.2f} GB, Boş {free_gb:.2f} GB\n",
+    "limit_resources": "Kaynakları sınırla...",
+    "limit_tree_resources": "İşlem ağacını sınırla...",
+    "limit_resources_title": "Kaynakları sınırla",
+    "limit_resources_target": "{name} (PID {pid}): {count} işlem yeni bir cgroup'a taşınacak.",
+    "limit_unlimited": "Sınırsız",
+    "limit_no_device": "G/Ç sınırı yok",
+    "limit_cpu": "CPU sınırı (%100 = bir CPU):",
+    "limit_memory_high": "Yüksek bellek (üstünde yavaşlatılır):",
+    "limit_memory_max": "Azami bellek (üstünde OOM):",
+    "limit_io_device": "G/Ç aygıtı:",
+    "limit_io_read": "Okuma sınırı:",
+    "limit_io_write": "Yazma sınırı:",
+    "limit_error": "cgroup ayarlanamadı: {e}",
+    "limit_move_error": "İşlem {cgroup} içine taşınamadı: {e}",
+    "limit_success": "{count} işlem {cgroup} içine taşındı.",
+    "limit_partial": "{count} tanesi taşınamadı.",
+    "remove_limits": "Sınırları kaldır",
+    "tab_limits": "Sınırlar",
+    "limits_hint": "Bir işleme sağ tıklayıp Kaynakları sınırla'yı seçerek onu (veya ağacını) CPU, bellek ve G/Ç sınırları olan bir cgroup'a taşıyın.",
+    "columns_limits_table": ["Cgroup", "İşlemler", "CPU %", "CPU Sınırı %", "Bellek MB", "Yüksek Bellek MB", "Azami Bellek MB", "Okuma KB/s", "Okuma Sınırı KB/s", "Yazma KB/s", "Yazma Sınırı KB/s"],
+    "bulk_terminate": "Sonlandır",
+    "kill_tree": "İşlem ağacını öldür",
+    "bulk_more_names": "ve {count} tane daha",
+    "bulk_busy": "Başka bir toplu işlem hâlâ çalışıyor.",
+    "bulk_confirm": "{count} işlem için {action}?\n{names}",
+    "bulk_renice_prompt": "Nice değeri (-20 ile 19 arası):",
+    "bulk_progress": "{action}: {done}/{total}",
+    "graceful_stop": "İşlemi sonlandır",
+    "grace_period": "SIGKILL süresi:",
+    "bulk_outcome_ok": "tamam",
+    "bulk_outcome_terminated": "SIGTERM sonrası çıktı",
+    "bulk_outcome_killed": "bekleme süresinden sonra öldürüldü",
+    "bulk_outcome_gone": "zaten bitmiş",
+    "bulk_outcome_denied": "izin reddedildi",
+    "bulk_outcome_error": "başarısız",
+    "tab_pattern_actions": "Desen eylemleri",
+    "pattern_label": "Desen (regex):",
+    "pattern_full_cmdline": "Tam komut satırını eşleştir",
+    "pattern_users": "Kullanıcılar (virgülle ayrılmış):",
+    "pattern_condition": "Koşul (uyarı kurallarındaki gibi):",
+    "pattern_preview": "Önizle",
+    "pattern_apply": "Eşleşenlere uygula",
+    "pattern_error": "Geçersiz sorgu: {error}",
+    "pattern_summary": "{count} işlem: CPU %{cpu:.1f}, RSS {rss:.1f} MB, Okuma {read:.1f} KB/s, Yazma {write:.1f} KB/s",
+    "pattern_action_signal": "Sinyal gönder",
+    "pattern_action_renice": "Nice değerini ayarla",
+    "pattern_action_affinity": "CPU benzeşimini ayarla",
+    "columns_pattern_table": ["PID", "Ad", "Kullanıcı", "CPU %", "Bellek MB", "Komut satırı"],
+    "helper_start": "Yönetici olarak çalış",
+    "helper_stop": "Yetkileri bırak",
+    "helper_starting": "Kimlik doğrulama bekleniyor...",
+    "helper_running": "Yetkili yardımcı çalışıyor.",
+    "helper_tooltip": "Diğer kullanıcıların işlemlerini yönetmek ve incelemek için yetkili bir yardımcı başlat.",
+    "helper_start_error": "Yetkili yardımcı başlatılamadı: {e}",
+    "alert_system": "Sistem",
+    "alert_notification_system": "{rule}: sistem genelinde",
+    "anomaly_window": "son:",
+    "limit_needs_helper": "Cgroup yönetimi root yetkisi gerektirir; \"Yönetici olarak çalış\" seçeneğini kullanıp yeniden deneyin.",
+    "numa_memory_pending": "Bellek yerleşimi: ölçülüyor...",
 }
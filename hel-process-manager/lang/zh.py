@@ -19,7 +19,7 @@ lang = {
     "tab_startup_programs": "启动程序",
     "tab_about": "关于",
 
-    "columns_process_table": ["PID", "名称", "CPU %", "RAM %", "用户", "父PID", "启动时间", "路径", "线程", "状态"],
+    "columns_process_table": ["PID", "名称", "CPU %", "RAM %", "用户", "父PID", "启动时间", "路径", "线程", "状态", "读取 KB/s", "写入 KB/s", "I/O 调用/s", "RSS MB", "PSS MB", "USS MB", "交换 MB", "运行等待 毫秒/秒", "自愿切换/秒", "非自愿切换/秒", "上次 CPU", "次要缺页/秒", "主要缺页/秒", "OOM 分数", "内存压力", "容器", "容器 ID", "命名空间 PID", "增长 MB/小时", "内存耗尽于", "NUMA 本地 %"],
 
     "about_text": (
         "赫尔万进程管理器\n"
@@ -133,5 +133,161 @@ lang = {
     "startup_info_placeholder": "启动程序的列表很复杂且与平台相关。\\npsutil对此目的提供了有限的直接访问。\\n\\n在Windows上，这通常涉及注册表项和启动文件夹。\\n在Linux上，这涉及systemd、XDG自动启动和会话管理器。\\n\\n此功能需要特定于平台的实现。",
     "startup_error": "获取启动程序时出错: {e}",
     "startup_feature_note": "此功能是一个占位符，需要特定于平台的实现才能启用/禁用启动程序。",
-    "language_file_missing_hint": "确保存在'lang'文件夹，并在其中包含'en.py'和'ar.py'（或其他语言文件）。"
+    "language_file_missing_hint": "确保存在'lang'文件夹，并在其中包含'en.py'和'ar.py'（或其他语言文件）。",
+    "disk_iops_graph_title": "磁盘 IOPS（按设备）",
+    "disk_throughput_graph_title": "磁盘吞吐量（每设备 KB/s）",
+    "disk_await_graph_title": "磁盘平均等待（毫秒）",
+    "disk_util_graph_title": "磁盘利用率 (%)",
+    "disk_queue_graph_title": "磁盘队列深度（进行中的 I/O）",
+    "smaps_age_tooltip": "{age:.0f} 秒前采样",
+    "memory_map": "内存映射",
+    "memory_map_title": "内存映射 - {name} ({pid})",
+    "memory_map_loading": "正在读取内存映射...",
+    "memory_map_progress": "已解析 {count} 个映射...",
+    "memory_map_summary": "{count} 个映射，RSS {rss:.1f} MB，PSS {pss:.1f} MB，脏页 {dirty:.1f} MB，交换 {swap:.1f} MB",
+    "memory_map_error": "无法读取内存映射：{e}",
+    "memory_map_groups_header": "按映射",
+    "memory_map_top_header": "最大的映射（按 RSS）",
+    "memory_map_group_columns": ["映射", "数量", "大小 KB", "RSS KB", "PSS KB", "脏页 KB", "交换 KB"],
+    "memory_map_top_columns": ["地址", "权限", "映射", "大小 KB", "RSS KB", "PSS KB", "脏页 KB", "交换 KB"],
+    "show_threads": "显示线程",
+    "hide_threads": "隐藏线程",
+    "threads_select_process": "选择一个进程以查看其线程。",
+    "threads_error": "无法读取 PID {pid} 的线程：{e}",
+    "threads_header": "PID {pid} 的线程（{count}）",
+    "columns_thread_table": ["TID", "名称", "状态", "CPU %", "自愿切换", "非自愿切换", "上次 CPU"],
+    "inspect_section_open_files": "打开的文件",
+    "inspect_section_connections": "连接",
+    "inspect_section_environment": "环境变量",
+    "inspect_section_limits": "资源限制",
+    "inspect_filter": "筛选...",
+    "prev_page": "上一页",
+    "next_page": "下一页",
+    "inspect_loading": "正在加载... {count} 项",
+    "inspect_page": "第 {page}/{pages} 页（{count} 项）",
+    "inspect_section_denied": "权限被拒绝",
+    "inspect_section_error": "获取出错（{error}）",
+    "detail_metrics": ["CPU %", "RSS MB", "读取 KB/s", "写入 KB/s", "打开的 FD", "线程", "上下文切换/秒"],
+    "run_delay_graph_title": "CPU 运行队列延迟（毫秒/秒，所有 CPU）",
+    "run_delay_not_available": "运行队列延迟不可用",
+    "cpu_pressure_graph_title": "CPU 压力停顿（毫秒/秒）",
+    "group_by": "分组方式：",
+    "group_by_none": "不分组",
+    "group_by_cgroup": "服务 / cgroup",
+    "columns_group_tree": ["组 / 进程", "PID", "进程数", "CPU %", "内存 MB", "读取 KB/s", "写入 KB/s"],
+    "group_by_container": "容器",
+    "container_host": "主机",
+    "group_by_user": "用户",
+    "group_by_exe": "可执行文件",
+    "tab_recently_exited": "最近退出",
+    "columns_lifecycle_table": ["退出时间", "PID", "PPID", "名称", "命令行", "运行时间 秒", "CPU 秒", "退出状态"],
+    "exit_signal": "信号 {signal}",
+    "lifecycle_source_connector": "正在通过内核 proc connector 捕获每个进程的退出。",
+    "lifecycle_source_polling": "正在每 {interval} 毫秒轮询 /proc 捕获进程退出（以 root 运行可精确捕获）。",
+    "tab_cpu_leaderboard": "CPU 时间",
+    "leaderboard_window": "按以下时间段的 CPU 时间排名：",
+    "leaderboard_minutes": "{minutes} 分钟",
+    "leaderboard_by_name": "合并同名进程",
+    "leaderboard_processes": "进程数",
+    "leaderboard_running": "运行中",
+    "leaderboard_exited": "已退出",
+    "columns_leaderboard_table": ["PID", "名称", "命令", "CPU 秒 (5 分钟)", "CPU 秒 (15 分钟)", "CPU 秒 (60 分钟)", "状态"],
+    "leak_fit_tooltip": "线性拟合 r² = {r2:.2f}",
+    "leak_eta": "{hours}小时{minutes:02d}分",
+    "anomaly_threshold": "高亮 z 分数超过此值的异常：",
+    "anomaly_off": "关闭",
+    "anomaly_tooltip": "z 分数 {z:.1f}（通常为 {mean:.1f} ± {std:.1f}）",
+    "tab_alerts": "警报",
+    "apply_alert_rules": "应用规则",
+    "alert_rules_error": "规则未应用：{error}",
+    "alert_rules_loaded": "{count} 条规则已启用。",
+    "alert_rules_not_saved": "规则已应用但未保存：{error}",
+    "alert_firing": "触发",
+    "alert_resolved": "已恢复",
+    "alert_title": "进程警报",
+    "alert_notification": "{rule}：{name}（PID {pid}）",
+    "alert_hook_error": "警报“{rule}”：操作失败：{error}",
+    "columns_alert_log": ["时间", "规则", "PID", "名称", "状态"],
+    "tab_policies": "策略",
+    "apply_policies": "应用策略",
+    "policies_error": "策略未应用：{error}",
+    "policies_loaded": "{count} 条策略已启用。",
+    "policies_not_saved": "策略已应用但未保存：{error}",
+    "policy_failed": "失败：{error}",
+    "columns_policy_log": ["时间", "策略", "PID", "名称", "结果"],
+    "affinity_preset": "预设：",
+    "affinity_preset_current": "当前亲和性",
+    "affinity_preset_all": "所有 CPU",
+    "affinity_preset_physical": "仅物理核心",
+    "affinity_preset_node": "节点 {node}（CPU {cpus}）",
+    "affinity_preset_socket": "插槽 {socket}（CPU {cpus}）",
+    "topology_socket": "插槽 {socket}",
+    "topology_node": "NUMA 节点 {node}",
+    "topology_node_memory": "（此进程 {size:.1f} MB）",
+    "topology_l3": "共享 L3：CPU {cpus}",
+    "topology_core": "核心 {core}（SMT：CPU {cpus}）",
+    "numa_memory_unknown": "内存分布：不可用",
+    "numa_memory_placement": "内存分布：{placement}",
+    "numa_node_share": "节点 {node}：{size:.1f} MB（{percent:.0f}%）",
+    "numa_nodes_header": "\nNUMA 节点：\n",
+    "numa_node_format": "  节点 {node}（CPU {cpus}）：已用 {used_gb:.2f} GB / {total_gb:.2f} GB，可用 {free_gb:.2f} GB\n",
+    "limit_resources": "限制资源...",
+    "limit_tree_resources": "限制进程树...",
+    "limit_resources_title": "限制资源",
+    "limit_resources_target": "{name}（PID {pid}）：{count} 个进程将被移入新的 cgroup。",
+    "limit_unlimited": "不限",
+    "limit_no_device": "无 I/O 限制",
+    "limit_cpu": "CPU 限制（100% = 一个 CPU）：",
+    "limit_memory_high": "内存上限 high（超出后节流）：",
+    "limit_memory_max": "内存上限 max（超出后 OOM）：",
+    "limit_io_device": "I/O 设备：",
+    "limit_io_read": "读取限制：",
+    "limit_io_write": "写入限制：",
+    "limit_error": "无法设置 cgroup：{e}",
+    "limit_move_error": "无法将进程移入 {cgroup}：{e}",
+    "limit_success": "已将 {count} 个进程移入 {cgroup}。",
+    "limit_partial": "{count} 个无法移动。",
+    "remove_limits": "移除限制",
+    "tab_limits": "限制",
+    "limits_hint": "右键单击进程并选择“限制资源”，将其（或其进程树）移入带有 CPU、内存和 I/O 限制的 cgroup。",
+    "columns_limits_table": ["Cgroup", "进程数", "CPU %", "CPU 限制 %", "内存 MB", "内存 high MB", "内存 max MB", "读取 KB/s", "读取限制 KB/s", "写入 KB/s", "写入限制 KB/s"],
+    "bulk_terminate": "终止",
+    "kill_tree": "结束进程树",
+    "bulk_more_names": "以及另外 {count} 个",
+    "bulk_busy": "另一个批量操作仍在运行。",
+    "bulk_confirm": "{action} {count} 个进程？\n{names}",
+    "bulk_renice_prompt": "Nice 值（-20 到 19）：",
+    "bulk_progress": "{action}：{done}/{total}",
+    "graceful_stop": "结束进程",
+    "grace_period": "SIGKILL 等待：",
+    "bulk_outcome_ok": "完成",
+    "bulk_outcome_terminated": "收到 SIGTERM 后退出",
+    "bulk_outcome_killed": "宽限期后被强制结束",
+    "bulk_outcome_gone": "已退出",
+    "bulk_outcome_denied": "权限被拒绝",
+    "bulk_outcome_error": "失败",
+    "tab_pattern_actions": "按模式操作",
+    "pattern_label": "模式（正则）：",
+    "pattern_full_cmdline": "匹配完整命令行",
+    "pattern_users": "用户（逗号分隔）：",
+    "pattern_condition": "条件（同告警规则）：",
+    "pattern_preview": "预览",
+    "pattern_apply": "应用到匹配项",
+    "pattern_error": "无效查询：{error}",
+    "pattern_summary": "{count} 个进程：CPU {cpu:.1f}%，RSS {rss:.1f} MB，读取 {read:.1f} KB/s，写入 {write:.1f} KB/s",
+    "pattern_action_signal": "发送信号",
+    "pattern_action_renice": "设置 nice 值",
+    "pattern_action_affinity": "设置 CPU 亲和性",
+    "columns_pattern_table": ["PID", "名称", "用户", "CPU %", "内存 MB", "命令行"],
+    "helper_start": "以管理员身份操作",
+    "helper_stop": "放弃权限",
+    "helper_starting": "正在等待身份验证...",
+    "helper_running": "特权助手正在运行。",
+    "helper_tooltip": "启动特权助手，以管理和检查其他用户的进程。",
+    "helper_start_error": "无法启动特权助手：{e}",
+    "alert_system": "系统",
+    "alert_notification_system": "{rule}：全系统",
+    "anomaly_window": "基于最近：",
+    "limit_needs_helper": "管理 cgroup 需要 root 权限；请使用“以管理员身份操作”后重试。",
+    "numa_memory_pending": "内存分布：正在测量...",
 }
@@ -0,0 +1,87 @@
+import numpy as np
+
+from snapshot_columns import SlotAllocator
+
+# RSS is sampled for the regression at most this often.
+LEAK_SAMPLE_INTERVAL = 30.0
+# Older samples fade out with this half-life, so a process that stops growing
+# is un-flagged again and the fit follows its recent behaviour.
+LEAK_HALF_LIFE = 1800.0
+# Growth (bytes/s) and goodness of fit (r²) a process needs to be flagged,
+# and the number of samples (10 min at the default interval) before it can be.
+LEAK_MIN_GROWTH = 1024 * 1024 / 60.0
+LEAK_MIN_R2 = 0.8
+LEAK_MIN_SAMPLES = 20
+
+class LeakDetector:
+    """
+    Streaming linear regression of RSS over time for every process.
+
+    Each process owns one slot in a set of numpy arrays holding the
+    exponentially decayed sums (weight, t, y, t², t·y, y²) of a weighted
+    least-squares fit, so memory per process is constant no matter how long
+    it runs, and a sample for all processes is a handful of array operations.
+    Times and sizes are taken relative to each process's first sample to keep
+    the sums well conditioned.
+    """
+    SUMS = ('w', 't', 'y', 'tt', 'ty', 'yy')
+
+    def __init__(self, sample_interval=LEAK_SAMPLE_INTERVAL, half_life=LEAK_HALF_LIFE,
+                 min_growth=LEAK_MIN_GROWTH, min_r2=LEAK_MIN_R2, min_samples=LEAK_MIN_SAMPLES):
+        self.sample_interval = sample_interval
+        self.half_life = half_life
+        self.min_growth = min_growth
+        self.min_r2 = min_r2
+        self.min_samples = min_samples
+        self.last_sample = None
+        fields = {name: np.float64 for name in self.SUMS}
+        fields.update(origin_t=np.float64, origin_y=np.float64, samples=np.int64)
+        self.state = SlotAllocator(fields)
+        self.results = {}  # pid -> (growth bytes/s, r², flagged)
+
+    def due(self, now):
+        return self.last_sample is None or now - self.last_sample >= self.sample_interval
+
+    def update(self, columns, now):
+        """Adds one RSS sample for every process in the columnar snapshot, at most every sample_interval seconds."""
+        if not self.due(now):
+            return False
+        decay = 0.5 ** ((now - self.last_sample) / self.half_life) if self.last_sample is not None else 1.0
+        self.last_sample = now
+
+        known = ~np.isnan(columns['rss'])
+        pids = columns['pid'][known]
+        rss = columns['rss'][known]
+        slots, is_new = self.state.assign(pids, columns['create_time'][known])
+        s = self.state.arrays
+        new_slots = slots[is_new]
+        for name in self.SUMS:
+            s[name][new_slots] = 0.0
+        s['samples'][new_slots] = 0
+        s['origin_t'][new_slots] = now
+        s['origin_y'][new_slots] = rss[is_new]
+
+        t = now - s['origin_t'][slots]
+        y = rss - s['origin_y'][slots]
+        for name, value in (('w', 1.0), ('t', t), ('y', y), ('tt', t * t), ('ty', t * y), ('yy', y * y)):
+            s[name][slots] = s[name][slots] * decay + value
+        s['samples'][slots] += 1
+
+        w, st, sy = s['w'][slots], s['t'][slots], s['y'][slots]
+        var_t = w * s['tt'][slots] - st * st
+        var_y = w * s['yy'][slots] - sy * sy
+        cov = w * s['ty'][slots] - st * sy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = cov / var_t
+            r2 = cov * cov / (var_t * var_y)
+        valid = (s['samples'][slots] >= self.min_samples) & np.isfinite(slope) & np.isfinite(r2)
+        flagged = valid & (slope >= self.min_growth) & (r2 >= self.min_r2)
+        self.results = {
+            pid: (growth, fit, bool(flag))
+            for pid, growth, fit, flag in zip(pids[valid].tolist(), slope[valid].tolist(), r2[valid].tolist(), flagged[valid].tolist())
+        }
+        return True
+
+    def estimate(self, pid):
+        """Returns (growth in bytes/s, r², flagged) for a PID, or None while it has too few samples."""
+        return self.results.get(pid)
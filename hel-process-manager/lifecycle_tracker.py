@@ -0,0 +1,184 @@
+import os
+import select
+import threading
+import time
+from collections import deque, namedtuple
+import psutil
+
+from proc_connector_linux import ProcConnector
+from procfs_linux import PROC_ROOT, CLK_TCK, read_pid_stat, read_pid_cmdline
+
+# kind is 'exec' or 'exit'; time is wall-clock; runtime and cpu are seconds and,
+# like exit_code (a raw wait status), only set on exit events. create_time is
+# the process start time exactly as psutil.Process.create_time() reports it,
+# so (pid, create_time) matches the collector's snapshot rows.
+LifecycleEvent = namedtuple('LifecycleEvent', 'kind time pid ppid name cmdline runtime cpu exit_code create_time')
+
+EVENT_RING_SIZE = 10000
+# PID-set diffing interval when the proc connector isn't available.
+POLL_INTERVAL = 0.05
+# While polling, processes younger than this have their CPU time re-read on
+# every poll so short-lived ones exit with an accurate total; older ones are
+# refreshed every FULL_REFRESH seconds.
+YOUNG_AGE = 5.0
+FULL_REFRESH = 5.0
+
+def uptime():
+    return time.clock_gettime(time.CLOCK_BOOTTIME)
+
+class ProcessLifecycleTracker(threading.Thread):
+    """
+    Background thread that records process exec and exit events, including
+    processes that live for less than one refresh of the process table.
+
+    It listens on the kernel's proc connector when we are allowed to (root or
+    CAP_NET_ADMIN) and otherwise diffs the set of PIDs in /proc every
+    poll_interval seconds. Events are kept in a bounded ring; consumers keep
+    the last sequence number they saw and call events_since() each tick.
+    """
+    def __init__(self, ring_size=EVENT_RING_SIZE, poll_interval=POLL_INTERVAL, use_connector=True):
+        super().__init__(daemon=True)
+        self.poll_interval = poll_interval
+        self.events = deque(maxlen=ring_size)  # (seq, LifecycleEvent)
+        self.seq = 0
+        # pid -> {'name', 'ppid', 'cmdline', 'start', 'ticks'}; start is in
+        # seconds since boot, the clock /proc/<pid>/stat's starttime uses.
+        self.known = {}
+        self.connector = None
+        if use_connector:
+            try:
+                self.connector = ProcConnector()
+            except OSError:
+                self.connector = None
+        self.source = 'connector' if self.connector is not None else 'polling'
+        # Called from this thread with every event as it is recorded (e.g. the
+        # policy daemon, which must act on new processes right away).
+        self.listeners = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def events_since(self, seq):
+        """Returns (events newer than seq, oldest first; latest seq)."""
+        with self._lock:
+            newer = []
+            for event_seq, event in reversed(self.events):
+                if event_seq <= seq:
+                    break
+                newer.append(event)
+            newer.reverse()
+            return newer, self.seq
+
+    def stop(self):
+        self._stop_event.set()
+
+    def read_info(self, pid):
+        """Reads what we want to remember about a process while it is still alive, or None if it is gone."""
+        try:
+            stat = read_pid_stat(pid)
+        except (OSError, ValueError, IndexError):
+            return None
+        try:
+            cmdline = read_pid_cmdline(pid)
+        except OSError:
+            cmdline = ''
+        return {
+            'name': stat['name'], 'ppid': stat['ppid'], 'cmdline': cmdline or f"[{stat['name']}]",
+            'start': stat['starttime'] / CLK_TCK, 'ticks': stat['utime'] + stat['stime'],
+        }
+
+    def emit(self, kind, pid, info, now, exit_code=None):
+        create_time = psutil.boot_time() + info['start']
+        if kind == 'exit':
+            event = LifecycleEvent(kind, now, pid, info['ppid'], info['name'], info['cmdline'],
+                                   max(uptime() - info['start'], 0.0), info['ticks'] / CLK_TCK, exit_code, create_time)
+        else:
+            event = LifecycleEvent(kind, now, pid, info['ppid'], info['name'], info['cmdline'], None, None, None, create_time)
+        with self._lock:
+            self.seq += 1
+            self.events.append((self.seq, event))
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"Error in lifecycle listener: {e}")
+
+    def process_started(self, pid, now, emit=True, ppid=None):
+        info = self.read_info(pid)
+        if info is None and ppid in self.known:
+            # The child was already gone by the time we looked; a fork starts
+            # out as a copy of its parent, so that is the best we can record.
+            info = dict(self.known[ppid], ppid=ppid, start=uptime(), ticks=0)
+        if info is not None:
+            self.known[pid] = info
+            if emit:
+                self.emit('exec', pid, info, now)
+
+    def process_exited(self, pid, now, exit_code=None):
+        info = self.known.pop(pid, None)
+        # Right after exit the process is usually still a zombie whose stat
+        # holds its final CPU time; its cmdline is already gone.
+        final = self.read_info(pid) if self.connector is not None else None
+        if final is not None:
+            if info is not None:
+                final['cmdline'] = info['cmdline']
+            info = final
+        if info is not None:
+            self.emit('exit', pid, info, now, exit_code)
+
+    def scan_pids(self):
+        return {int(name) for name in os.listdir(PROC_ROOT) if name.isdigit()}
+
+    def run(self):
+        now = time.time()
+        for pid in self.scan_pids():
+            self.process_started(pid, now, emit=False)
+        if self.connector is not None:
+            self.run_connector()
+        else:
+            self.run_polling()
+
+    def run_connector(self):
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select([self.connector], [], [], 1.0)
+            if not readable:
+                continue
+            try:
+                events = self.connector.receive()
+            except OSError:
+                continue  # ENOBUFS: the kernel dropped events while we were busy
+            now = time.time()
+            for kind, pid, ppid, exit_code in events:
+                if kind == 'exit':
+                    self.process_exited(pid, now, exit_code)
+                else:
+                    # A fork is remembered silently so that a fork without exec
+                    # still has a command line when it exits.
+                    self.process_started(pid, now, emit=kind == 'exec', ppid=ppid)
+        self.connector.close()
+
+    def run_polling(self):
+        last_full_refresh = time.monotonic()
+        while not self._stop_event.wait(self.poll_interval):
+            now = time.time()
+            try:
+                pids = self.scan_pids()
+            except OSError:
+                continue
+            known = set(self.known)
+            for pid in pids - known:
+                self.process_started(pid, now)
+            for pid in known - pids:
+                self.process_exited(pid, now)
+
+            full_refresh = time.monotonic() - last_full_refresh >= FULL_REFRESH
+            if full_refresh:
+                last_full_refresh = time.monotonic()
+            young_since = uptime() - YOUNG_AGE
+            for pid, info in list(self.known.items()):
+                if full_refresh or info['start'] > young_since:
+                    fresh = self.read_info(pid)
+                    if fresh is not None:
+                        # Keep the first command line unless the process exec'd since.
+                        if fresh['name'] == info['name']:
+                            fresh['cmdline'] = info['cmdline']
+                        self.known[pid] = fresh
@@ -0,0 +1,47 @@
+from datetime import datetime
+from PyQt5.QtWidgets import QTableWidgetItem
+
+from process_data_handler import NumericTableWidgetItem
+
+# Rows kept in the "Recently Exited" table, newest first.
+RECENT_EXITED_ROWS = 1000
+
+class LifecycleViewHandler:
+    def format_exit_status(self, status):
+        """Formats a raw wait status from the proc connector as an exit code or signal."""
+        if status is None:
+            return self.lang.get('not_available', 'N/A')
+        if status & 0x7f:
+            return self.lang.get('exit_signal', "Signal {signal}").format(signal=status & 0x7f)
+        return str(status >> 8)
+
+    def update_lifecycle_source_label(self):
+        if self.lifecycle_tracker.source == 'connector':
+            text = self.lang.get('lifecycle_source_connector', "Capturing every process exit via the kernel proc connector.")
+        else:
+            text = self.lang.get('lifecycle_source_polling', "Capturing process exits by polling /proc every {interval} ms (run as root for exact capture).").format(interval=int(self.lifecycle_tracker.poll_interval * 1000))
+        self.lifecycle_source_label.setText(text)
+
+    def update_lifecycle_view(self):
+        """Adds exits recorded since the last update. Pending events wait in the tracker's ring while the tab is hidden."""
+        if not self.lifecycle_table.isVisible():
+            return
+        events, self.lifecycle_seq = self.lifecycle_tracker.events_since(self.lifecycle_seq)
+        exits = [event for event in events if event.kind == 'exit'][-RECENT_EXITED_ROWS:]
+        if not exits:
+            return
+        self.lifecycle_table.setSortingEnabled(False)
+        for event in exits:
+            self.lifecycle_table.insertRow(0)
+            self.lifecycle_table.setItem(0, 0, QTableWidgetItem(datetime.fromtimestamp(event.time).strftime('%H:%M:%S.%f')[:-3]))
+            self.lifecycle_table.setItem(0, 1, NumericTableWidgetItem(str(event.pid), event.pid))
+            self.lifecycle_table.setItem(0, 2, NumericTableWidgetItem(str(event.ppid), event.ppid))
+            self.lifecycle_table.setItem(0, 3, QTableWidgetItem(event.name))
+            cmdline_item = QTableWidgetItem(event.cmdline)
+            cmdline_item.setToolTip(event.cmdline)
+            self.lifecycle_table.setItem(0, 4, cmdline_item)
+            self.lifecycle_table.setItem(0, 5, NumericTableWidgetItem(f"{event.runtime:.3f}", event.runtime))
+            self.lifecycle_table.setItem(0, 6, NumericTableWidgetItem(f"{event.cpu:.2f}", event.cpu))
+            self.lifecycle_table.setItem(0, 7, QTableWidgetItem(self.format_exit_status(event.exit_code)))
+        self.lifecycle_table.setRowCount(min(self.lifecycle_table.rowCount(), RECENT_EXITED_ROWS))
+        self.lifecycle_table.setSortingEnabled(True)
@@ -0,0 +1,155 @@
+import functools
+import heapq
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+
+from procfs_linux import iter_pid_smaps
+from process_data_handler import NumericTableWidgetItem
+
+# Number of individual mappings kept (largest by RSS); everything else is only
+# counted in its group, so memory use doesn't grow with the mapping count.
+TOP_MAPPINGS = 200
+PROGRESS_EVERY = 10000
+
+def mapping_group(pathname):
+    """Returns the aggregation key of a mapping: its backing file, [heap], [stack] or [anon]."""
+    if not pathname:
+        return '[anon]'
+    if pathname.startswith('[stack'):
+        return '[stack]'
+    if pathname.startswith('[anon'):
+        return '[anon]'
+    return pathname
+
+class MemoryMapWorker(QThread):
+    """
+    Parses /proc/<pid>/smaps off the UI thread, aggregating mappings by
+    backing file, heap, stack and anonymous memory as it streams.
+
+    Emits finished_map with a dict {'groups', 'top', 'totals', 'count'};
+    each group and total is [count, size, rss, pss, dirty, swap].
+    """
+    progress = pyqtSignal(int)
+    finished_map = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, pid, parent=None):
+        super().__init__(parent)
+        self.pid = pid
+
+    def run(self):
+        groups = {}
+        top = []
+        totals = [0, 0, 0, 0, 0, 0]
+        count = 0
+        try:
+            for mapping in iter_pid_smaps(self.pid):
+                if self.isInterruptionRequested():
+                    return
+                address, perms, pathname, size, rss, pss, dirty, swap = mapping
+                key = mapping_group(pathname)
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = [0, 0, 0, 0, 0, 0]
+                for acc in (group, totals):
+                    acc[0] += 1
+                    acc[1] += size
+                    acc[2] += rss
+                    acc[3] += pss
+                    acc[4] += dirty
+                    acc[5] += swap
+                entry = (rss, count, mapping)
+                if len(top) < TOP_MAPPINGS:
+                    heapq.heappush(top, entry)
+                elif rss > top[0][0]:
+                    heapq.heapreplace(top, entry)
+                count += 1
+                if count % PROGRESS_EVERY == 0:
+                    self.progress.emit(count)
+        except OSError as e:
+            self.failed.emit(str(e))
+            return
+        except (ValueError, IndexError) as e:
+            # A malformed smaps line; report it rather than leave the dialog waiting.
+            self.failed.emit(f"malformed smaps: {e}")
+            return
+        self.finished_map.emit({
+            'groups': groups,
+            'top': [mapping for _, _, mapping in sorted(top, reverse=True)],
+            'totals': totals,
+            'count': count,
+        })
+
+def stop_worker(worker):
+    worker.requestInterruption()
+    worker.wait()
+
+class MemoryMapDialog(QDialog):
+    """Non-modal view of a process's address space, filled in by a MemoryMapWorker."""
+    def __init__(self, parent, lang, pid, name):
+        super().__init__(parent)
+        self.lang = lang
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setWindowTitle(lang.get('memory_map_title', "Memory Map - {name} ({pid})").format(name=name, pid=pid))
+        self.resize(900, 600)
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel(lang.get('memory_map_loading', "Reading memory map..."))
+        layout.addWidget(self.summary_label)
+        layout.addWidget(QLabel(lang.get('memory_map_groups_header', "By mapping")))
+        self.groups_table = self.make_table(lang.get('memory_map_group_columns', ["Mapping", "Count", "Size KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"]))
+        layout.addWidget(self.groups_table)
+        layout.addWidget(QLabel(lang.get('memory_map_top_header', "Largest mappings (by RSS)")))
+        self.top_table = self.make_table(lang.get('memory_map_top_columns', ["Address", "Perms", "Mapping", "Size KB", "RSS KB", "PSS KB", "Dirty KB", "Swap KB"]))
+        layout.addWidget(self.top_table)
+
+        self.worker = MemoryMapWorker(pid, self)
+        self.worker.progress.connect(self.show_progress)
+        self.worker.finished_map.connect(self.show_map)
+        self.worker.failed.connect(self.show_error)
+        # Stop the parse before the dialog (and the worker it owns) goes
+        # away, whether it is closed or destroyed along with its parent.
+        stop = functools.partial(stop_worker, self.worker)
+        self.finished.connect(stop)
+        self.destroyed.connect(stop)
+        self.worker.start()
+
+    def make_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        return table
+
+    def fill_row(self, table, row, texts, sizes, first_size_col=None):
+        for col, text in enumerate(texts):
+            table.setItem(row, col, QTableWidgetItem(text))
+        for col, value in enumerate(sizes, start=first_size_col or len(texts)):
+            table.setItem(row, col, NumericTableWidgetItem(f"{value / 1024:.0f}", value))
+
+    def show_progress(self, count):
+        self.summary_label.setText(self.lang.get('memory_map_progress', "Parsed {count} mappings...").format(count=count))
+
+    def show_error(self, error):
+        self.summary_label.setText(self.lang.get('memory_map_error', "Could not read memory map: {e}").format(e=error))
+
+    def show_map(self, result):
+        mb = 1024 * 1024
+        totals = result['totals']
+        self.summary_label.setText(self.lang.get('memory_map_summary', "{count} mappings, RSS {rss:.1f} MB, PSS {pss:.1f} MB, Dirty {dirty:.1f} MB, Swap {swap:.1f} MB").format(
+            count=result['count'], rss=totals[2] / mb, pss=totals[3] / mb, dirty=totals[4] / mb, swap=totals[5] / mb))
+
+        groups = result['groups']
+        self.groups_table.setRowCount(len(groups))
+        for row, (key, (count, size, rss, pss, dirty, swap)) in enumerate(groups.items()):
+            self.fill_row(self.groups_table, row, [key], [size, rss, pss, dirty, swap], first_size_col=2)
+            self.groups_table.setItem(row, 1, NumericTableWidgetItem(str(count), count))
+        self.groups_table.setSortingEnabled(True)
+        self.groups_table.sortItems(3, Qt.DescendingOrder)
+
+        self.top_table.setRowCount(len(result['top']))
+        for row, (address, perms, pathname, size, rss, pss, dirty, swap) in enumerate(result['top']):
+            self.fill_row(self.top_table, row, [address, perms, mapping_group(pathname)], [size, rss, pss, dirty, swap])
+        self.top_table.setSortingEnabled(True)
+        self.top_table.sortItems(4, Qt.DescendingOrder)
@@ -0,0 +1,136 @@
+import os
+from collections import namedtuple
+
+from procfs_linux import PROC_ROOT
+
+SYS_CPU_ROOT = '/sys/devices/system/cpu'
+SYS_NODE_ROOT = '/sys/devices/system/node'
+
+# socket: physical package id; core: (socket, core id); l3: CPUs sharing the
+# L3 cache, as a tuple (None without cache info); siblings: SMT threads of the core.
+CpuTopology = namedtuple('CpuTopology', 'cpu socket node core l3 siblings')
+
+def parse_cpu_list(text):
+    """Parses a kernel CPU/node list such as '0-3,8' into a sorted list of numbers ('' gives [])."""
+    numbers = set()
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        numbers.update(range(int(first), int(last or first) + 1))
+    return sorted(numbers)
+
+def read_sys_value(path):
+    """Returns the stripped content of a sysfs file, or None if it can't be read."""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def read_numa_nodes():
+    """Returns {node: [cpus]} for the online NUMA nodes; machines without NUMA support report one node 0."""
+    node_list = read_sys_value(os.path.join(SYS_NODE_ROOT, 'online'))
+    if node_list is None:
+        return {0: parse_cpu_list(read_sys_value(os.path.join(SYS_CPU_ROOT, 'online')) or '0')}
+    return {
+        node: parse_cpu_list(read_sys_value(os.path.join(SYS_NODE_ROOT, f'node{node}', 'cpulist')) or '')
+        for node in parse_cpu_list(node_list)
+    }
+
+def read_l3_cpus(cpu):
+    """Returns the CPUs sharing cpu's L3 cache (or its last-level cache below L3) as a tuple, or None."""
+    cache_root = os.path.join(SYS_CPU_ROOT, f'cpu{cpu}', 'cache')
+    try:
+        indexes = [entry for entry in os.listdir(cache_root) if entry.startswith('index')]
+    except OSError:
+        return None
+    best = None
+    for index in indexes:
+        level = read_sys_value(os.path.join(cache_root, index, 'level'))
+        shared = read_sys_value(os.path.join(cache_root, index, 'shared_cpu_list'))
+        if level is None or shared is None or not level.isdigit() or int(level) > 3:
+            continue
+        if best is None or int(level) > best[0]:
+            best = (int(level), tuple(parse_cpu_list(shared)))
+    return best[1] if best else None
+
+def read_cpu_topology():
+    """
+    Reads the socket, NUMA node, shared L3 and SMT siblings of every online
+    CPU from sysfs and returns a list of CpuTopology sorted by CPU number.
+    Missing files (containers, other architectures) fall back to one socket,
+    node 0 and no sharing.
+    """
+    cpu_node = {cpu: node for node, cpus in read_numa_nodes().items() for cpu in cpus}
+    online = parse_cpu_list(read_sys_value(os.path.join(SYS_CPU_ROOT, 'online')) or '') or list(range(os.cpu_count() or 1))
+    topology = []
+    for cpu in online:
+        topology_dir = os.path.join(SYS_CPU_ROOT, f'cpu{cpu}', 'topology')
+        socket = read_sys_value(os.path.join(topology_dir, 'physical_package_id'))
+        core = read_sys_value(os.path.join(topology_dir, 'core_id'))
+        siblings = (read_sys_value(os.path.join(topology_dir, 'core_cpus_list'))
+                    or read_sys_value(os.path.join(topology_dir, 'thread_siblings_list')))
+        socket = int(socket) if socket and socket.lstrip('-').isdigit() and int(socket) >= 0 else 0
+        core = int(core) if core and core.isdigit() else cpu
+        topology.append(CpuTopology(
+            cpu, socket, cpu_node.get(cpu, 0), (socket, core), read_l3_cpus(cpu),
+            tuple(parse_cpu_list(siblings)) if siblings else (cpu,),
+        ))
+    return topology
+
+def read_pid_numa_maps(pid):
+    """
+    Sums /proc/<pid>/numa_maps into {node: resident bytes}. Each mapping line
+    lists pages per node as N<node>=<pages> with its page size in
+    kernelpagesize_kB. Reading the file walks the process's page tables, so
+    it is meant for one process at a time, not every tick for every process.
+    Raises OSError if the file can't be read.
+    """
+    nodes = {}
+    with open(os.path.join(PROC_ROOT, str(pid), 'numa_maps'), 'rb') as f:
+        for line in f:
+            page_size = 4096
+            counts = []
+            for token in line.split():
+                if token.startswith(b'N') and b'=' in token:
+                    node, _, pages = token[1:].partition(b'=')
+                    if node.isdigit() and pages.isdigit():
+                        counts.append((int(node), int(pages)))
+                elif token.startswith(b'kernelpagesize_kB='):
+                    page_size = int(token[18:]) * 1024
+            for node, pages in counts:
+                nodes[node] = nodes.get(node, 0) + pages * page_size
+    return nodes
+
+def format_cpu_list(numbers):
+    """The inverse of parse_cpu_list: [0, 1, 2, 3, 8] -> '0-3,8'."""
+    ranges = []
+    for number in sorted(numbers):
+        if ranges and number == ranges[-1][1] + 1:
+            ranges[-1][1] = number
+        else:
+            ranges.append([number, number])
+    return ','.join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+def read_node_meminfo():
+    """
+    Reads /sys/devices/system/node/node*/meminfo and returns {node: {field:
+    bytes}} with the MemTotal, MemFree and MemUsed fields ('Node 0 MemFree:
+    123 kB' lines). Returns {} without NUMA support in sysfs.
+    """
+    nodes = {}
+    node_list = read_sys_value(os.path.join(SYS_NODE_ROOT, 'online'))
+    for node in parse_cpu_list(node_list or ''):
+        fields = {}
+        try:
+            with open(os.path.join(SYS_NODE_ROOT, f'node{node}', 'meminfo'), 'rb') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 4 and parts[2] in (b'MemTotal:', b'MemFree:', b'MemUsed:'):
+                        fields[parts[2][:-1].decode()] = int(parts[3]) * 1024
+        except OSError:
+            continue
+        nodes[node] = fields
+    return nodes
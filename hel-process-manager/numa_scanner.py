@@ -0,0 +1,26 @@
+import time
+
+from numa_linux import read_pid_numa_maps
+from smaps_scanner import SmapsRollupScanner
+
+class NumaMapsScanner(SmapsRollupScanner):
+    """
+    Background reader of /proc/<pid>/numa_maps (resident bytes per NUMA
+    node). Reading numa_maps walks the page tables of every mapping, which
+    takes long for large processes, so the UI only queues the selected
+    process and the largest ones, and results are kept for longer than
+    PSS/USS samples.
+    """
+    def __init__(self, max_reads_per_sec=10, refresh_age=30.0):
+        super().__init__(max_reads_per_sec, refresh_age)
+
+    def sample(self, pid):
+        return read_pid_numa_maps(pid)
+
+    def get(self, pid):
+        """Returns ({node: bytes}, age_seconds) for pid, or None if not scanned yet."""
+        entry = self.results.get(pid)
+        if entry is None:
+            return None
+        sample_time, nodes = entry
+        return nodes, time.monotonic() - sample_time
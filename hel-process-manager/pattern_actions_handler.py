@@ -0,0 +1,84 @@
+import os
+import signal
+import numpy as np
+from PyQt5.QtWidgets import QTableWidgetItem, QMessageBox
+
+from numa_linux import parse_cpu_list
+from process_data_handler import NumericTableWidgetItem
+from process_query import ProcessQuery, QueryError
+
+MB = 1024 * 1024
+# Signals offered by the pattern panel, most common first.
+PATTERN_SIGNALS = ('SIGTERM', 'SIGKILL', 'SIGHUP', 'SIGINT', 'SIGSTOP', 'SIGCONT', 'SIGUSR1', 'SIGUSR2')
+# Actions of the pattern panel: (action, lang key, default label)
+PATTERN_ACTIONS = (
+    ('signal', 'pattern_action_signal', "Send signal"),
+    ('renice', 'pattern_action_renice', "Set nice value"),
+    ('affinity', 'pattern_action_affinity', "Set CPU affinity"),
+)
+# Matches listed in the preview table; totals always cover every match.
+PATTERN_PREVIEW_ROWS = 1000
+
+class PatternActionsHandler:
+    def tracked_cmdline(self, pid):
+        info = self.lifecycle_tracker.known.get(pid)
+        return info['cmdline'] if info else None
+
+    def update_pattern_preview(self):
+        """Evaluates the panel's query against the current snapshot and lists the matches with their totals."""
+        users = [user.strip() for user in self.pattern_user_edit.text().split(',') if user.strip()]
+        try:
+            query = ProcessQuery(self.pattern_edit.text(), self.pattern_full_cmdline.isChecked(), users,
+                                 self.pattern_condition_edit.text().strip(), self.group_interners)
+        except QueryError as e:
+            self.pattern_matches = []
+            self.pattern_table.setRowCount(0)
+            self.pattern_summary_label.setText(self.lang.get('pattern_error', "Invalid query: {error}").format(error=e))
+            return
+        columns = self.process_columns
+        mask = query.match(columns, self.tracked_cmdline)
+        # Like pgrep, never match ourselves.
+        mask &= columns['pid'] != os.getpid()
+        # (pid, create_time), so Apply can tell the previewed processes from later ones reusing their PIDs.
+        self.pattern_matches = list(zip(columns['pid'][mask].tolist(), columns['create_time'][mask].tolist()))
+        self.pattern_summary_label.setText(self.lang.get('pattern_summary', "{count} process(es): CPU {cpu:.1f}%, RSS {rss:.1f} MB, Read {read:.1f} KB/s, Write {write:.1f} KB/s").format(
+            count=len(self.pattern_matches), cpu=columns['cpu'][mask].sum(), rss=np.nansum(columns['rss'][mask]) / MB,
+            read=np.nansum(columns['read'][mask]), write=np.nansum(columns['write'][mask])))
+
+        not_available = self.lang.get('not_available', 'N/A')
+        shown = [self.process_snapshot[pid] for pid, _ in self.pattern_matches[:PATTERN_PREVIEW_ROWS] if pid in self.process_snapshot]
+        self.pattern_table.setSortingEnabled(False)
+        self.pattern_table.setRowCount(len(shown))
+        for row, row_data in enumerate(shown):
+            rss = row_data['rss']
+            self.pattern_table.setItem(row, 0, NumericTableWidgetItem(str(row_data['pid']), row_data['pid']))
+            self.pattern_table.setItem(row, 1, QTableWidgetItem(row_data['name']))
+            self.pattern_table.setItem(row, 2, QTableWidgetItem(row_data['user'] or ""))
+            self.pattern_table.setItem(row, 3, NumericTableWidgetItem(f"{row_data['cpu']:.1f}", row_data['cpu']))
+            self.pattern_table.setItem(row, 4, NumericTableWidgetItem(f"{rss / MB:.1f}" if rss is not None else not_available, rss))
+            self.pattern_table.setItem(row, 5, QTableWidgetItem(self.tracked_cmdline(row_data['pid']) or ""))
+        self.pattern_table.setSortingEnabled(True)
+
+    def change_pattern_action(self):
+        action = self.pattern_action_selector.currentData()
+        self.pattern_signal_selector.setVisible(action == 'signal')
+        self.pattern_nice_spin.setVisible(action == 'renice')
+        self.pattern_affinity_edit.setVisible(action == 'affinity')
+
+    def apply_pattern_action(self):
+        """Applies the chosen action to the previewed matches in one batched pass on the bulk worker."""
+        action = self.pattern_action_selector.currentData()
+        if action == 'signal':
+            operation, argument = 'signal', getattr(signal, self.pattern_signal_selector.currentText())
+        elif action == 'renice':
+            operation, argument = 'renice', self.pattern_nice_spin.value()
+        else:
+            try:
+                operation, argument = 'affinity', parse_cpu_list(self.pattern_affinity_edit.text())
+            except ValueError:
+                argument = None
+            if not argument:
+                QMessageBox.warning(self, self.lang['title'], self.lang.get('select_at_least_one_cpu', "Please select at least one CPU core."))
+                return
+        # Matches whose PID now belongs to another process are dropped by run_bulk_action().
+        self.run_bulk_action(operation, self.pattern_matches, argument, status_label=self.pattern_status_label)
@@ -0,0 +1,66 @@
+import os
+import threading
+from datetime import datetime
+from PyQt5.QtWidgets import QTableWidgetItem
+from PyQt5.QtGui import QBrush, QColor
+
+from process_policies import POLICIES_PATH, EXAMPLE_POLICIES, PolicyError, parse_policies
+from process_data_handler import NumericTableWidgetItem
+
+# Entries kept in the policy log table, newest first.
+POLICY_LOG_ROWS = 500
+
+class PoliciesHandler:
+    def load_policies(self):
+        """Loads POLICIES_PATH into the editor and activates it; without a file, the commented example is shown."""
+        try:
+            with open(POLICIES_PATH, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            text = EXAMPLE_POLICIES
+        self.policy_editor.setPlainText(text)
+        self.compile_policies(text)
+
+    def compile_policies(self, text):
+        try:
+            policies = parse_policies(text)
+        except PolicyError as e:
+            self.policy_status_label.setText(self.lang.get('policies_error', "Policies not applied: {error}").format(error=e))
+            return False
+        self.policy_daemon.set_policies(policies)
+        self.policy_status_label.setText(self.lang.get('policies_loaded', "{count} policy(ies) active.").format(count=len(policies)))
+        # New processes are handled by the daemon as they start; the ones
+        # already running are checked once, off the GUI thread.
+        threading.Thread(target=self.policy_daemon.sweep, args=(dict(self.process_snapshot),), daemon=True).start()
+        return True
+
+    def apply_policies(self):
+        text = self.policy_editor.toPlainText()
+        if not self.compile_policies(text):
+            return
+        try:
+            os.makedirs(os.path.dirname(POLICIES_PATH), exist_ok=True)
+            with open(POLICIES_PATH, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            self.policy_status_label.setText(self.lang.get('policies_not_saved', "Policies applied but not saved: {error}").format(error=e))
+
+    def update_policy_log(self):
+        results, self.policy_seq = self.policy_daemon.results_since(self.policy_seq)
+        if not results:
+            return
+        self.policy_log_table.setSortingEnabled(False)
+        for result in results[-POLICY_LOG_ROWS:]:
+            applied = result.outcome == 'applied'
+            self.policy_log_table.insertRow(0)
+            self.policy_log_table.setItem(0, 0, QTableWidgetItem(datetime.fromtimestamp(result.time).strftime('%Y-%m-%d %H:%M:%S')))
+            self.policy_log_table.setItem(0, 1, QTableWidgetItem(result.policy))
+            self.policy_log_table.setItem(0, 2, NumericTableWidgetItem(str(result.pid), result.pid))
+            self.policy_log_table.setItem(0, 3, QTableWidgetItem(result.name or ""))
+            outcome_item = QTableWidgetItem(result.details if applied else
+                                            self.lang.get('policy_failed', "Failed: {error}").format(error=result.details))
+            if not applied:
+                outcome_item.setBackground(QBrush(QColor(255, 170, 170)))
+            self.policy_log_table.setItem(0, 4, outcome_item)
+        self.policy_log_table.setRowCount(min(self.policy_log_table.rowCount(), POLICY_LOG_ROWS))
+        self.policy_log_table.setSortingEnabled(True)
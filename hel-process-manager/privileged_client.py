@@ -0,0 +1,194 @@
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+import psutil
+
+from privileged_helper import IO_FIELDS, peer_uid, recv_message, send_message
+
+# Root-owned launcher of privileged_helper.py installed by the package, and
+# the only program pkexec is asked to run (see org.helwan.hel-process.helper.policy).
+HELPER_PATH = '/usr/lib/hel-process/hel-process-helper'
+# Seconds the user gets to authenticate before the helper is given up on.
+AUTH_TIMEOUT = 120
+# Seconds one round-trip may take before the helper is considered dead.
+CALL_TIMEOUT = 10
+
+class HelperError(OSError):
+    pass
+
+class PrivilegedHelperClient:
+    """
+    The GUI's end of the privileged helper (see privileged_helper.py).
+
+    start() listens on a socket in a private temporary directory and runs
+    the helper through pkexec; a background thread accepts its connection,
+    which must come from root. Calls are serialised by a lock, so the
+    collector and the bulk action worker can share one connection; the
+    collector's I/O counters are fetched on a thread of their own so the UI
+    never waits for that lock or the helper. If the helper dies, the client
+    drops back to unprivileged operation.
+    """
+    def __init__(self):
+        self.connection = None
+        self.process = None
+        self.error = None
+        self.lock = threading.Lock()
+        self.io_thread = None
+        self.latest_io = (None, {})  # (monotonic time of the read, io_counters() result)
+
+    @property
+    def connected(self):
+        return self.connection is not None
+
+    @property
+    def starting(self):
+        return self.connection is None and self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Launches the helper; raises OSError if pkexec or the helper is missing or the socket can't be created."""
+        if self.connected or self.starting:
+            return
+        pkexec = shutil.which('pkexec')
+        if pkexec is None:
+            raise HelperError("pkexec was not found; install polkit")
+        try:
+            helper = os.stat(HELPER_PATH)
+        except FileNotFoundError:
+            raise HelperError(f"the privileged helper is not installed at {HELPER_PATH}") from None
+        # Whatever runs as root must not be replaceable by anyone but root.
+        if helper.st_uid != 0 or helper.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise HelperError(f"{HELPER_PATH} must be owned and only writable by root")
+        self.error = None
+        socket_dir = tempfile.mkdtemp(prefix='hel-process-')
+        socket_path = os.path.join(socket_dir, 'helper.sock')
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(socket_path)
+            listener.listen(1)
+            listener.settimeout(0.5)
+            self.process = subprocess.Popen([pkexec, HELPER_PATH, socket_path])
+        except OSError:
+            listener.close()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+            raise
+        threading.Thread(target=self.accept, args=(listener, socket_dir, self.process), daemon=True).start()
+
+    def accept(self, listener, socket_dir, process):
+        deadline = time.monotonic() + AUTH_TIMEOUT
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    if process.poll() is not None:
+                        # Authentication cancelled or failed.
+                        self.error = f"pkexec exited with status {process.returncode}"
+                        return
+                    continue
+                if peer_uid(connection) != 0:
+                    connection.close()
+                    continue
+                connection.settimeout(CALL_TIMEOUT)
+                self.connection = connection
+                return
+            self.error = "timed out waiting for authentication"
+            process.terminate()
+        finally:
+            listener.close()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+    def stop(self):
+        """Closes the connection; the helper exits when it sees the end of it."""
+        self.latest_io = (None, {})
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            connection.close()
+        elif self.starting:
+            self.process.terminate()
+
+    def call(self, calls):
+        """Sends a batch of calls in one round-trip and returns their [status, value] results."""
+        with self.lock:
+            if self.connection is None:
+                raise HelperError("the privileged helper is not running")
+            try:
+                send_message(self.connection, calls)
+                return recv_message(self.connection)
+            except (OSError, EOFError, ValueError) as e:
+                self.error = str(e)
+                self.stop()
+                raise HelperError(self.error) from None
+
+    def call_one(self, call, pid):
+        """Makes a single call, turning its status into the matching psutil exception."""
+        status, value = self.call([call])[0]
+        if status == 'gone':
+            raise psutil.NoSuchProcess(pid)
+        if status == 'denied':
+            raise psutil.AccessDenied(pid)
+        if status == 'error':
+            raise HelperError(value)
+        return value
+
+    def io_counters(self, pids):
+        """Returns {pid: /proc/<pid>/io counters} (see IO_FIELDS) for the readable ones, {} if the helper is unavailable."""
+        try:
+            counters = self.call_one(['io', pids], None)
+        except (HelperError, psutil.Error):
+            return {}
+        return {pid: dict(zip(IO_FIELDS, values)) for pid, values in zip(pids, counters) if values is not None}
+
+    def request_io_counters(self, pids):
+        """
+        Starts reading the I/O counters of pids in the background unless a
+        read is still in flight; the result shows up in latest_io.
+        """
+        if self.io_thread is not None and self.io_thread.is_alive():
+            return
+        self.io_thread = threading.Thread(target=self.fetch_io_counters, args=(list(pids),), daemon=True)
+        self.io_thread.start()
+
+    def fetch_io_counters(self, pids):
+        counters = self.io_counters(pids)
+        if self.connected:
+            self.latest_io = (time.monotonic(), counters)
+
+    def apply(self, operation, argument, targets):
+        """Applies an operation to (pid, create_time) targets and returns one (outcome, message) each."""
+        try:
+            return [tuple(result) for result in self.call_one(['act', operation, argument, [list(target) for target in targets]], None)]
+        except (HelperError, psutil.Error) as e:
+            return [('denied', str(e))] * len(targets)
+
+    def open_fds(self, pid, create_time):
+        return self.call_one(['fds', pid, create_time], pid)
+
+    def connections(self, pid, create_time):
+        return self.call_one(['connections', pid, create_time], pid)
+
+    def call_cgroup(self, call):
+        """Makes a cgroup call; any failure is raised as HelperError, an OSError like the direct writes raise."""
+        status, value = self.call([call])[0]
+        if status != 'ok':
+            raise HelperError(value or f"{call[0]}: {status}")
+        return value
+
+    def create_limits_cgroup(self, name):
+        """create_transient_cgroup() as root; returns the cgroup path."""
+        return self.call_cgroup(['cgroup_create', name])
+
+    def write_cgroup_limits(self, cgroup_path, limits):
+        self.call_cgroup(['cgroup_limits', cgroup_path, limits])
+
+    def move_to_cgroup(self, cgroup_path, pids):
+        """Moves processes into a transient cgroup as root; returns {pid: HelperError} for the ones that couldn't be moved."""
+        return {pid: HelperError(message) for pid, message in self.call_cgroup(['cgroup_move', cgroup_path, list(pids)])}
+
+    def remove_cgroups(self, cgroup_paths):
+        """Removes empty transient cgroups as root; returns the paths that were removed."""
+        return [path for path, removed in zip(cgroup_paths, self.call_cgroup(['cgroup_remove', cgroup_paths])) if removed]
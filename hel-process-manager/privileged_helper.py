@@ -0,0 +1,234 @@
+"""
+Privileged helper for Helwan Process Manager.
+
+The GUI runs as the desktop user and starts this script as root through
+pkexec and the root-owned hel-process-helper launcher the package installs
+(see privileged_client.HELPER_PATH), passing the path of a Unix socket it
+listens on (inside a directory only that user can enter). The helper connects back, checks that the peer is
+the user pkexec authenticated, and serves requests until the GUI closes the
+connection. It imports neither Qt nor the rest of the GUI.
+
+Protocol: every message is a 4-byte big-endian length followed by compact
+JSON. A request is a list of calls, each a list [name, *arguments], and the
+reply is a list of [status, value] in the same order, status being 'ok',
+'gone', 'denied' or 'error'. One round-trip can therefore carry thousands of
+PIDs, e.g. [['io', [pid, ...]]] for the I/O counters of every process.
+
+Calls:
+- ['io', pids] -> one [read_bytes, write_bytes, syscr, syscw] (or null) per PID
+- ['act', operation, argument, [[pid, create_time], ...]] -> one [status, message] per target
+- ['fds', pid, create_time] -> ['fd -> target', ...]
+- ['connections', pid, create_time] -> [[status, local, remote], ...]
+- ['cgroup_create', name] -> cgroup path of the new transient limit cgroup
+- ['cgroup_limits', cgroup_path, limits] -> null (limits as for write_cgroup_limits)
+- ['cgroup_move', cgroup_path, pids] -> [[pid, error], ...] for the PIDs not moved
+- ['cgroup_remove', cgroup_paths] -> one true/false (removed) per path
+
+The cgroup calls only touch the transient cgroups below LIMITS_PARENT.
+
+Processes are identified by PID and start time, so a PID reused since the
+GUI's snapshot is reported as gone instead of being acted on.
+"""
+import json
+import os
+import re
+import socket
+import struct
+import sys
+
+import psutil
+
+from cgroup_linux import (
+    LIMITS_PARENT, create_transient_cgroup, move_pids_to_cgroup, remove_cgroup_if_empty, write_cgroup_limits
+)
+from procfs_linux import PROC_ROOT, read_pid_io
+
+HEADER = struct.Struct('!I')
+# Names of the transient limit cgroups, and the 'major:minor' of a block device.
+CGROUP_NAME = re.compile(r'[A-Za-z0-9_-][A-Za-z0-9_.-]*')
+DEVICE_NUMBER = re.compile(r'[0-9]+:[0-9]+')
+# Largest message either side accepts.
+MAX_MESSAGE = 64 * 1024 * 1024
+# Fields of /proc/<pid>/io sent back by the 'io' call, in order.
+IO_FIELDS = ('read_bytes', 'write_bytes', 'syscr', 'syscw')
+# Operations the 'act' call may apply; each takes the psutil.Process and the argument.
+OPERATIONS = {
+    'kill': lambda proc, argument: proc.kill(),
+    'terminate': lambda proc, argument: proc.terminate(),
+    'suspend': lambda proc, argument: proc.suspend(),
+    'resume': lambda proc, argument: proc.resume(),
+    'renice': lambda proc, argument: proc.nice(int(argument)),
+    'signal': lambda proc, argument: proc.send_signal(int(argument)),
+    'affinity': lambda proc, argument: proc.cpu_affinity([int(cpu) for cpu in argument]),
+    'ionice': lambda proc, argument: proc.ionice(int(argument)),
+}
+
+def send_message(connection, message):
+    data = json.dumps(message, separators=(',', ':')).encode()
+    connection.sendall(HEADER.pack(len(data)) + data)
+
+def recv_exactly(connection, size):
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise EOFError("connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def recv_message(connection):
+    """Reads one message; raises EOFError when the peer has gone and ValueError on a malformed one."""
+    size, = HEADER.unpack(recv_exactly(connection, HEADER.size))
+    if size > MAX_MESSAGE:
+        raise ValueError(f"message of {size} bytes is too large")
+    return json.loads(recv_exactly(connection, size))
+
+def peer_uid(connection):
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', credentials)[1]
+
+def open_process(pid, create_time):
+    proc = psutil.Process(pid)
+    if proc.create_time() != create_time:
+        raise psutil.NoSuchProcess(pid)
+    return proc
+
+def read_io(pids):
+    counters = []
+    for pid in pids:
+        try:
+            io = read_pid_io(int(pid))
+        except OSError:
+            counters.append(None)
+            continue
+        counters.append([io.get(field, 0) for field in IO_FIELDS])
+    return counters
+
+def act(operation, argument, targets):
+    if operation not in OPERATIONS:
+        raise ValueError(f"unknown operation {operation!r}")
+    operation = OPERATIONS[operation]
+    results = []
+    for pid, create_time in targets:
+        try:
+            operation(open_process(pid, create_time), argument)
+            results.append(['ok', ""])
+        except psutil.NoSuchProcess:
+            results.append(['gone', ""])
+        except psutil.AccessDenied:
+            results.append(['denied', ""])
+        except (psutil.Error, OSError, ValueError, TypeError) as e:
+            results.append(['error', str(e)])
+    return results
+
+def list_fds(pid, create_time):
+    open_process(pid, create_time)
+    lines = []
+    with os.scandir(os.path.join(PROC_ROOT, str(pid), 'fd')) as entries:
+        for entry in entries:
+            try:
+                lines.append(f"{entry.name} -> {os.readlink(entry.path)}")
+            except OSError:
+                continue
+    return lines
+
+def list_connections(pid, create_time):
+    proc = open_process(pid, create_time)
+    connections = proc.net_connections() if hasattr(proc, 'net_connections') else proc.connections()
+    return [[conn.status,
+             f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "",
+             f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""] for conn in connections]
+
+class CallError(Exception):
+    """A failed call reported with just its message."""
+
+def check_cgroup_name(name):
+    if not isinstance(name, str) or not CGROUP_NAME.fullmatch(name):
+        raise ValueError(f"invalid cgroup name {name!r}")
+    return name
+
+def check_limits_cgroup(cgroup_path):
+    """Only the transient limit cgroups may be written through the helper."""
+    parent, _, name = str(cgroup_path).rpartition('/')
+    if parent != f'/{LIMITS_PARENT}':
+        raise ValueError(f"not a transient limit cgroup: {cgroup_path!r}")
+    check_cgroup_name(name)
+    return cgroup_path
+
+def cgroup_errors(function):
+    # A cgroup file that doesn't exist is a missing controller, not a
+    # process that has gone, so OSErrors are reported as they are.
+    def call(*arguments):
+        try:
+            return function(*arguments)
+        except OSError as e:
+            raise CallError(str(e)) from None
+    return call
+
+@cgroup_errors
+def cgroup_create(name):
+    return create_transient_cgroup(check_cgroup_name(name))
+
+@cgroup_errors
+def cgroup_limits(cgroup_path, limits):
+    if any(not DEVICE_NUMBER.fullmatch(str(device)) for device in limits.get('io', {})):
+        raise ValueError("invalid block device number")
+    write_cgroup_limits(check_limits_cgroup(cgroup_path), limits)
+
+def cgroup_move(cgroup_path, pids):
+    errors = move_pids_to_cgroup(check_limits_cgroup(cgroup_path), [int(pid) for pid in pids])
+    return [[pid, str(e)] for pid, e in errors.items()]
+
+def cgroup_remove(cgroup_paths):
+    return [remove_cgroup_if_empty(check_limits_cgroup(path)) for path in cgroup_paths]
+
+CALLS = {
+    'io': read_io,
+    'act': act,
+    'fds': list_fds,
+    'connections': list_connections,
+    'cgroup_create': cgroup_create,
+    'cgroup_limits': cgroup_limits,
+    'cgroup_move': cgroup_move,
+    'cgroup_remove': cgroup_remove,
+}
+
+def handle_call(call):
+    try:
+        name, *arguments = call
+        if name not in CALLS:
+            return ['error', f"unknown call {name!r}"]
+        return ['ok', CALLS[name](*arguments)]
+    except psutil.NoSuchProcess:
+        return ['gone', ""]
+    except (psutil.AccessDenied, PermissionError):
+        return ['denied', ""]
+    except FileNotFoundError:
+        return ['gone', ""]
+    except CallError as e:
+        return ['error', str(e)]
+    except Exception as e:
+        return ['error', f"{type(e).__name__}: {e}"]
+
+def serve(connection):
+    while True:
+        try:
+            calls = recv_message(connection)
+        except EOFError:
+            return
+        send_message(connection, [handle_call(call) for call in calls])
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: {sys.argv[0]} SOCKET")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(sys.argv[1])
+        # Only serve the user pkexec authenticated.
+        expected_uid = os.environ.get('PKEXEC_UID')
+        if expected_uid is not None and peer_uid(connection) != int(expected_uid):
+            sys.exit("socket is not owned by the calling user")
+        serve(connection)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import psutil
+from PyQt5.QtWidgets import QMessageBox
+
+from bulk_actions import BULK_OPERATIONS
+
+class PrivilegedHelperHandler:
+    def toggle_privileged_helper(self):
+        helper = self.privileged_helper
+        if helper.connected or helper.starting:
+            helper.stop()
+        else:
+            try:
+                helper.start()
+            except OSError as e:
+                QMessageBox.critical(self, self.lang['title'], self.lang.get('helper_start_error', "Could not start the privileged helper: {e}").format(e=e))
+        self.update_helper_status()
+
+    def update_helper_status(self):
+        helper = self.privileged_helper
+        if helper.connected:
+            self.helper_btn.setText(self.lang.get('helper_stop', "Drop Privileges"))
+            self.helper_btn.setToolTip(self.lang.get('helper_running', "The privileged helper is running."))
+        elif helper.starting:
+            self.helper_btn.setText(self.lang.get('helper_starting', "Waiting for authentication..."))
+        else:
+            self.helper_btn.setText(self.lang.get('helper_start', "Act as Administrator"))
+            self.helper_btn.setToolTip(helper.error or self.lang.get('helper_tooltip', "Start a privileged helper so other users' processes can be managed and inspected."))
+        # Running as root already, there is nothing to elevate.
+        self.helper_btn.setVisible(os.geteuid() != 0)
+
+    def run_privileged(self, proc, operation, argument=None):
+        """
+        Applies a bulk operation to one process, retrying through the
+        privileged helper when we may not. Raises the psutil exception of
+        the final outcome, like calling the psutil method directly would.
+        """
+        try:
+            BULK_OPERATIONS[operation](proc, argument)
+            return
+        except psutil.AccessDenied:
+            if not self.privileged_helper.connected:
+                raise
+        outcome, message = self.privileged_helper.apply(operation, argument, [(proc.pid, proc.create_time())])[0]
+        if outcome == 'gone':
+            raise psutil.NoSuchProcess(proc.pid)
+        if outcome == 'denied':
+            raise psutil.AccessDenied(proc.pid, msg=message or None)
+        if outcome == 'error':
+            raise psutil.Error(message)
@@ -0,0 +1,89 @@
+import os
+import socket
+import struct
+
+# Kernel process events connector (linux/cn_proc.h, linux/connector.h).
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+NLMSG_DONE = 3
+
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+
+RECEIVE_BUFFER = 4 * 1024 * 1024
+
+NLMSGHDR = struct.Struct('=IHHII')        # len, type, flags, seq, pid
+CN_MSG = struct.Struct('=IIIIHH')         # idx, val, seq, ack, len, flags
+PROC_EVENT_HEADER = struct.Struct('=IIQ')  # what, cpu, timestamp_ns
+FORK_EVENT = struct.Struct('=IIII')       # parent pid, parent tgid, child pid, child tgid
+EXEC_EVENT = struct.Struct('=II')         # pid, tgid
+EXIT_EVENT = struct.Struct('=IIII')       # pid, tgid, exit_code, exit_signal
+
+class ProcConnector:
+    """
+    Subscribes to fork/exec/exit notifications from the kernel's proc
+    connector. Needs CAP_NET_ADMIN; the constructor raises OSError
+    (usually PermissionError) when the subscription is refused.
+    """
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+        try:
+            # Room for bursts (e.g. a build forking thousands of compilers)
+            # while the GUI holds the GIL.
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER)
+            self.sock.bind((os.getpid(), CN_IDX_PROC))
+            self._send_op(PROC_CN_MCAST_LISTEN)
+        except OSError:
+            self.sock.close()
+            raise
+
+    def _send_op(self, op):
+        payload = struct.pack('=I', op)
+        cn_msg = CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0) + payload
+        header = NLMSGHDR.pack(NLMSGHDR.size + len(cn_msg), NLMSG_DONE, 0, 0, os.getpid())
+        self.sock.send(header + cn_msg)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def close(self):
+        try:
+            self._send_op(PROC_CN_MCAST_IGNORE)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def receive(self):
+        """
+        Blocks for one datagram and returns the process-level events in it as
+        (kind, pid, ppid, exit_code) tuples, kind being 'fork', 'exec' or
+        'exit'. Thread events (pid != tgid) are dropped; ppid is only known
+        for forks and exit_code only for exits (None otherwise).
+        """
+        data = self.sock.recv(8192)
+        events = []
+        offset = 0
+        while offset + NLMSGHDR.size <= len(data):
+            msg_len = NLMSGHDR.unpack_from(data, offset)[0]
+            if msg_len < NLMSGHDR.size:
+                break
+            body = offset + NLMSGHDR.size + CN_MSG.size
+            what = PROC_EVENT_HEADER.unpack_from(data, body)[0]
+            event = body + PROC_EVENT_HEADER.size
+            if what == PROC_EVENT_FORK:
+                parent_pid, parent_tgid, child_pid, child_tgid = FORK_EVENT.unpack_from(data, event)
+                if child_pid == child_tgid:
+                    events.append(('fork', child_tgid, parent_tgid, None))
+            elif what == PROC_EVENT_EXEC:
+                pid, tgid = EXEC_EVENT.unpack_from(data, event)
+                events.append(('exec', tgid, None, None))
+            elif what == PROC_EVENT_EXIT:
+                pid, tgid, exit_code, exit_signal = EXIT_EVENT.unpack_from(data, event)
+                if pid == tgid:
+                    events.append(('exit', tgid, None, exit_code))
+            offset += (msg_len + 3) & ~3  # NLMSG_ALIGN
+        return events
@@ -1,28 +1,22 @@
 import psutil
 import os
 import sys
-from PyQt5.QtWidgets import QMessageBox, QInputDialog, QDialog, QVBoxLayout, QCheckBox, QGridLayout, QPushButton, QLabel
+from PyQt5.QtWidgets import QMessageBox, QInputDialog, QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QTreeWidget, QTreeWidgetItem
+from PyQt5.QtCore import Qt, QTimer
+
+from numa_linux import read_cpu_topology, format_cpu_list
+
+# Milliseconds between checks for the numa_maps scan an open affinity dialog waits for.
+NUMA_POLL_INTERVAL = 250
 
 class ProcessActions:
     def kill_selected_process(self):
-        proc = self.get_selected_process_object()
-        if proc is None:
-            return
-        try:
-            reply = QMessageBox.question(self, self.lang['title'], self.lang.get('confirm_kill', "Are you sure you want to kill process {pid} ({name})?").format(pid=proc.pid, name=proc.name()), QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                proc.kill()
-                QMessageBox.information(self, self.lang['title'], self.lang.get('kill_success', "Process {pid} killed successfully.").format(pid=proc.pid))
-                self.update_processes()
-        except psutil.NoSuchProcess:
-            QMessageBox.warning(self, self.lang['title'], self.lang.get('no_such_process_error', "Process no longer exists."))
-            self.update_processes()
-        except psutil.AccessDenied:
-            QMessageBox.critical(self, self.lang['title'], self.lang.get('permission_denied_error', "Permission denied to kill this process. Try running as administrator/root."))
-        except Exception as e:
-            QMessageBox.critical(self, self.lang['title'], self.lang.get('kill_error', "An error occurred while trying to kill the process: {e}").format(e=e))
+        """Ends the selected processes gracefully (SIGTERM, then SIGKILL after the grace period) on a worker."""
+        self.run_bulk_action('stop')
 
     def renice_process(self):
+        if len(self.selected_pids()) > 1:
+            return self.bulk_renice()
         proc = self.get_selected_process_object()
         if proc is None:
             return
@@ -30,7 +24,7 @@ class ProcessActions:
             current_nice = proc.nice()
             value, ok = QInputDialog.getInt(self, self.lang.get('renice_title', "Change Priority"), self.lang.get('renice_prompt', "Nice Value (-20 to 19): Current: {current}").format(current=current_nice), current_nice, -20, 19)
             if ok:
-                proc.nice(value)
+                self.run_privileged(proc, 'renice', value)
                 QMessageBox.information(self, self.lang['title'], self.lang.get('renice_success', "Process {pid} priority set to {value}.").format(pid=proc.pid, value=value))
                 self.update_processes()
         except psutil.NoSuchProcess:
@@ -42,6 +36,8 @@ class ProcessActions:
             QMessageBox.critical(self, self.lang['title'], self.lang.get('renice_error', "An error occurred while trying to change priority: {e}").format(e=e))
 
     def suspend_selected_process(self):
+        if len(self.selected_pids()) > 1:
+            return self.run_bulk_action('suspend')
         proc = self.get_selected_process_object()
         if proc is None:
             return
@@ -49,7 +45,7 @@ class ProcessActions:
             if proc.status() == psutil.STATUS_STOPPED:
                 QMessageBox.information(self, self.lang['title'], self.lang.get('already_suspended', "Process {pid} is already suspended.").format(pid=proc.pid))
                 return
-            proc.suspend()
+            self.run_privileged(proc, 'suspend')
             QMessageBox.information(self, self.lang['title'], self.lang.get('suspend_success', "Process {pid} suspended successfully.").format(pid=proc.pid))
             self.update_processes()
         except psutil.NoSuchProcess:
@@ -61,6 +57,8 @@ class ProcessActions:
             QMessageBox.critical(self, self.lang['title'], self.lang.get('suspend_error', "An error occurred while trying to suspend the process: {e}").format(e=e))
 
     def resume_selected_process(self):
+        if len(self.selected_pids()) > 1:
+            return self.run_bulk_action('resume')
         proc = self.get_selected_process_object()
         if proc is None:
             return
@@ -68,7 +66,7 @@ class ProcessActions:
             if proc.status() != psutil.STATUS_STOPPED:
                 QMessageBox.information(self, self.lang['title'], self.lang.get('not_suspended', "Process {pid} is not suspended.").format(pid=proc.pid))
                 return
-            proc.resume()
+            self.run_privileged(proc, 'resume')
             QMessageBox.information(self, self.lang['title'], self.lang.get('resume_success', "Process {pid} resumed successfully.").format(pid=proc.pid))
             self.update_processes()
         except psutil.NoSuchProcess:
@@ -83,12 +81,13 @@ class ProcessActions:
         proc = self.get_selected_process_object()
         if proc is None:
             return
-        cpu_count = psutil.cpu_count(logical=True)
-        if cpu_count == 0:
+        topology = read_cpu_topology()
+        if not topology:
             QMessageBox.warning(self, self.lang['title'], self.lang.get('no_cpus_found', "No CPU cores found to set affinity."))
             return
         dialog = QDialog(self)
         dialog.setWindowTitle(self.lang.get('set_cpu_affinity_title', "Set CPU Affinity"))
+        dialog.resize(460, 560)
         layout = QVBoxLayout(dialog)
         try:
             current_affinity = proc.cpu_affinity()
@@ -98,32 +97,141 @@ class ProcessActions:
         except Exception as e:
             QMessageBox.critical(self, self.lang.get('general_error', "Error: {e}").format(e=e))
             return
-        layout.addWidget(QLabel(self.lang.get('current_affinity', "Current CPU Affinity: {affinity}").format(affinity=current_affinity)))
+        # numa_maps walks every mapping of the process, which can take long,
+        # so it is read by the scanner thread and filled in when it arrives.
+        numa = self.numa_scanner.get(proc.pid)
+        node_memory = numa[0] if numa else {}
+        waiting = (numa is None or numa[1] > self.numa_scanner.refresh_age) and proc.pid not in self.numa_scanner.unreadable
+        layout.addWidget(QLabel(self.lang.get('current_affinity', "Current CPU Affinity: {affinity}").format(affinity=format_cpu_list(current_affinity))))
+        placement_label = QLabel(self.format_node_memory(node_memory) if numa or not waiting
+                                 else self.lang.get('numa_memory_pending', "Memory placement: measuring..."))
+        layout.addWidget(placement_label)
+
+        preset_layout = QHBoxLayout()
+        preset_layout.addWidget(QLabel(self.lang.get('affinity_preset', "Preset:")))
+        preset_selector = QComboBox()
+        for label, cpus in self.affinity_presets(topology, current_affinity):
+            preset_selector.addItem(label, cpus)
+        preset_layout.addWidget(preset_selector, 1)
+        layout.addLayout(preset_layout)
+
         layout.addWidget(QLabel(self.lang.get('select_cpus', "Select CPU Cores:")))
-        grid_layout = QGridLayout()
-        self.affinity_checkboxes = []
-        for i in range(cpu_count):
-            checkbox = QCheckBox(f"CPU {i}")
-            if i in current_affinity:
-                checkbox.setChecked(True)
-            self.affinity_checkboxes.append(checkbox)
-            grid_layout.addWidget(checkbox, i // 4, i % 4)
-        layout.addLayout(grid_layout)
+        tree = QTreeWidget()
+        tree.setHeaderHidden(True)
+        self.affinity_cpu_items = self.build_topology_tree(tree, topology, node_memory)
+        layout.addWidget(tree, 1)
+        self.check_affinity_cpus(current_affinity)
+        preset_selector.activated.connect(lambda index: self.check_affinity_cpus(preset_selector.itemData(index)))
+
         apply_btn = QPushButton(self.lang.get('apply', "Apply"))
         apply_btn.clicked.connect(lambda: self._apply_cpu_affinity(proc, dialog))
         layout.addWidget(apply_btn)
+        if waiting:
+            self.numa_scanner.request([proc.pid])
+            timer = QTimer(dialog)
+            timer.timeout.connect(lambda: self.fill_numa_placement(proc.pid, placement_label, timer))
+            dialog.finished.connect(timer.stop)
+            timer.start(NUMA_POLL_INTERVAL)
         dialog.exec_()
 
+    def fill_numa_placement(self, pid, label, timer):
+        """Shows the scanner's numa_maps result in an open affinity dialog once a fresh one is in."""
+        numa = self.numa_scanner.get(pid)
+        if pid in self.numa_scanner.unreadable:
+            numa = ({}, 0.0)
+        elif numa is None or numa[1] > self.numa_scanner.refresh_age:
+            return
+        timer.stop()
+        label.setText(self.format_node_memory(numa[0]))
+        for node, item in self.affinity_node_items.items():
+            item.setText(0, self.topology_node_text(node, numa[0]))
+
+    def format_node_memory(self, node_memory):
+        """One line describing how much of a process's resident memory sits on each NUMA node."""
+        total = sum(node_memory.values())
+        if not total:
+            return self.lang.get('numa_memory_unknown', "Memory placement: not available")
+        placement = ", ".join(
+            self.lang.get('numa_node_share', "node {node}: {size:.1f} MB ({percent:.0f}%)").format(
+                node=node, size=size / (1024 * 1024), percent=size * 100 / total)
+            for node, size in sorted(node_memory.items()))
+        return self.lang.get('numa_memory_placement', "Memory placement: {placement}").format(placement=placement)
+
+    def affinity_presets(self, topology, current_affinity):
+        """Returns (label, cpus) presets: current, all, physical cores only, then each node and socket."""
+        all_cpus = [info.cpu for info in topology]
+        presets = [
+            (self.lang.get('affinity_preset_current', "Current affinity"), list(current_affinity)),
+            (self.lang.get('affinity_preset_all', "All CPUs"), all_cpus),
+        ]
+        if any(len(info.siblings) > 1 for info in topology):
+            # The first SMT thread of every core.
+            presets.append((self.lang.get('affinity_preset_physical', "Physical cores only"),
+                            [info.cpu for info in topology if info.cpu == min(info.siblings)]))
+        nodes = sorted({info.node for info in topology})
+        sockets = sorted({info.socket for info in topology})
+        for node in nodes if len(nodes) > 1 else ():
+            cpus = [info.cpu for info in topology if info.node == node]
+            presets.append((self.lang.get('affinity_preset_node', "Node {node} (CPUs {cpus})").format(node=node, cpus=format_cpu_list(cpus)), cpus))
+        for socket in sockets if len(sockets) > 1 else ():
+            cpus = [info.cpu for info in topology if info.socket == socket]
+            presets.append((self.lang.get('affinity_preset_socket', "Socket {socket} (CPUs {cpus})").format(socket=socket, cpus=format_cpu_list(cpus)), cpus))
+        return presets
+
+    def build_topology_tree(self, tree, topology, node_memory):
+        """
+        Fills the affinity tree as socket > NUMA node > shared L3 > core > CPU,
+        with tristate checkboxes so ticking a level selects everything below
+        it. Cores with a single thread are shown as a plain CPU row. Returns
+        {cpu: item} for the CPU rows; the node rows go to affinity_node_items.
+        """
+        checkable = Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        parents = {}
+
+        def branch(key, parent, text):
+            if key not in parents:
+                item = QTreeWidgetItem(parent, [text])
+                item.setFlags(checkable | Qt.ItemIsAutoTristate)
+                item.setCheckState(0, Qt.Unchecked)
+                item.setExpanded(True)
+                parents[key] = item
+            return parents[key]
+
+        cpu_items = {}
+        for info in topology:
+            socket_item = branch(('socket', info.socket), tree, self.lang.get('topology_socket', "Socket {socket}").format(socket=info.socket))
+            parent = branch(('node', info.socket, info.node), socket_item, self.topology_node_text(info.node, node_memory))
+            if info.l3 is not None:
+                parent = branch(('l3', info.socket, info.node, info.l3), parent,
+                                self.lang.get('topology_l3', "Shared L3: CPUs {cpus}").format(cpus=format_cpu_list(info.l3)))
+            if len(info.siblings) > 1:
+                parent = branch(('core', info.socket, info.node, info.core), parent,
+                                self.lang.get('topology_core', "Core {core} (SMT: CPUs {cpus})").format(core=info.core[1], cpus=format_cpu_list(info.siblings)))
+            item = QTreeWidgetItem(parent, [f"CPU {info.cpu}"])
+            item.setFlags(checkable)
+            item.setCheckState(0, Qt.Unchecked)
+            cpu_items[info.cpu] = item
+        self.affinity_node_items = {key[2]: item for key, item in parents.items() if key[0] == 'node'}
+        return cpu_items
+
+    def topology_node_text(self, node, node_memory):
+        text = self.lang.get('topology_node', "NUMA node {node}").format(node=node)
+        if node_memory.get(node):
+            text += " " + self.lang.get('topology_node_memory', "({size:.1f} MB of this process)").format(size=node_memory[node] / (1024 * 1024))
+        return text
+
+    def check_affinity_cpus(self, cpus):
+        cpus = set(cpus)
+        for cpu, item in self.affinity_cpu_items.items():
+            item.setCheckState(0, Qt.Checked if cpu in cpus else Qt.Unchecked)
+
     def _apply_cpu_affinity(self, proc, dialog):
-        selected_cpus = []
-        for i, checkbox in enumerate(self.affinity_checkboxes):
-            if checkbox.isChecked():
-                selected_cpus.append(i)
+        selected_cpus = [cpu for cpu, item in sorted(self.affinity_cpu_items.items()) if item.checkState(0) == Qt.Checked]
         if not selected_cpus:
             QMessageBox.warning(self, self.lang['title'], self.lang.get('select_at_least_one_cpu', "Please select at least one CPU core."))
             return
         try:
-            proc.cpu_affinity(selected_cpus)
+            self.run_privileged(proc, 'affinity', selected_cpus)
             QMessageBox.information(self, self.lang['title'], self.lang.get('affinity_success', "CPU affinity for {pid} set to {cpus}.").format(pid=proc.pid, cpus=selected_cpus))
             dialog.accept()
         except psutil.AccessDenied:
@@ -174,7 +282,7 @@ class ProcessActions:
 
     def _apply_io_priority(self, proc, new_priority_value, dialog):
         try:
-            proc.ionice(ioclass=new_priority_value)
+            self.run_privileged(proc, 'ionice', new_priority_value)
             QMessageBox.information(self, self.lang['title'], self.lang.get('io_priority_success', "I/O priority for {pid} set successfully.").format(pid=proc.pid))
             dialog.accept()
         except psutil.AccessDenied:
@@ -1,58 +1,480 @@
+import heapq
+import time
 import psutil
 from datetime import datetime
 from PyQt5.QtWidgets import QTableWidgetItem, QMessageBox
+from PyQt5.QtGui import QBrush, QColor
 from PyQt5.QtCore import Qt
 
+from cgroup_linux import read_pid_cgroup
+from container_linux import container_from_cgroup, lookup_container_name
+from snapshot_columns import ColumnBuilder
+from procfs_linux import read_pid_io, read_pid_status, read_pid_schedstat, read_pid_stat, read_pid_oom_score, read_pressure, read_pid_namespaces, read_pid_cmdline, extend_comm, COMM_LENGTH, parse_kb, CLK_TCK
+
+# Rates are only recomputed when at least this many seconds passed since the
+# previous sample, so quick refreshes (e.g. typing in the search bar) don't
+# produce noisy values from tiny deltas.
+MIN_RATE_INTERVAL = 0.5
+
+# Besides the visible rows, this many of the largest processes (by RSS) are
+# queued first for the background PSS/USS scan.
+SMAPS_TOP_ROWS = 50
+# numa_maps is only read for the selected process and this many of the largest.
+NUMA_TOP_ROWS = 20
+MB = 1024 * 1024
+
+# OOM scores move slowly, so each PID's is re-read at most this often.
+OOM_SCORE_REFRESH = 5.0
+# A process's cgroup and namespaces rarely change, so they are re-read at most this often.
+CGROUP_REFRESH = 10.0
+# Table columns highlighted for each AnomalyDetector metric, and the divisor
+# that converts the metric to the unit shown in those columns.
+ANOMALY_COLUMNS = {'cpu': ((2,), 1.0), 'rss': ((13,), MB), 'io': ((10, 11), 1.0)}
+# Weight of a minor fault relative to a major fault in the memory pressure score.
+MINFLT_WEIGHT = 0.001
+# psutil's status strings for the state letter of /proc/<pid>/stat.
+STAT_STATUSES = {
+    'R': psutil.STATUS_RUNNING, 'S': psutil.STATUS_SLEEPING, 'D': psutil.STATUS_DISK_SLEEP,
+    'T': psutil.STATUS_STOPPED, 't': psutil.STATUS_TRACING_STOP, 'Z': psutil.STATUS_ZOMBIE,
+    'X': psutil.STATUS_DEAD, 'x': psutil.STATUS_DEAD, 'K': 'wake-kill',
+    'W': psutil.STATUS_WAKING, 'I': psutil.STATUS_IDLE, 'P': psutil.STATUS_PARKED,
+}
+
+class NumericTableWidgetItem(QTableWidgetItem):
+    """
+    Table item that sorts by a numeric value instead of its display text.
+    Items without a value (N/A) sort below every number.
+    """
+    def __init__(self, text, value=None):
+        super().__init__(text)
+        self.sort_value = value if value is not None else float('-inf')
+
+    def __lt__(self, other):
+        if isinstance(other, NumericTableWidgetItem):
+            return self.sort_value < other.sort_value
+        return super().__lt__(other)
+
 class ProcessDataHandler:
-    def update_processes(self):
-        search_text = self.search_bar.text().lower()
-        self.table.setRowCount(0)
-        processes_data = []
+    def sample_counter_rates(self, prev_samples, pid, now, counters):
+        """
+        Returns the per-second rates of a tuple of cumulative counters against
+        the previous sample kept in prev_samples[pid] (all zeros on the first
+        sample). Within MIN_RATE_INTERVAL of the last sample the previous rates
+        are returned unchanged.
+        """
+        prev = prev_samples.get(pid)
+        if prev is None:
+            rates = (0.0,) * len(counters)
+            prev_samples[pid] = (now, counters, rates)
+            return rates
+        prev_time, prev_counters, prev_rates = prev
+        elapsed = now - prev_time
+        if elapsed < MIN_RATE_INTERVAL:
+            return prev_rates
+        rates = tuple(max(curr - last, 0) / elapsed for curr, last in zip(counters, prev_counters))
+        prev_samples[pid] = (now, counters, rates)
+        return rates
+
+    def sample_process_io(self, pid, now, helper_io):
+        """
+        Returns (read_kbps, write_kbps, syscalls_per_sec) for a PID, computed as
+        deltas from /proc/<pid>/io against the previous sample, or None if the
+        PID's io file can't be read. Unreadable PIDs are remembered so they are
+        not re-opened on every refresh; their counters come from helper_io,
+        the privileged helper's latest (read time, {pid: counters}), when it
+        has them.
+        """
+        if pid in self.proc_io_unreadable:
+            sample_time, counters = helper_io
+            io = counters.get(pid)
+            if io is None:
+                return None
+            # Rates follow the helper's read; a read already used keeps the previous rates.
+            now = sample_time
+        else:
+            try:
+                io = read_pid_io(pid)
+            except OSError:
+                self.proc_io_unreadable.add(pid)
+                self.proc_io_prev.pop(pid, None)
+                return None
+
+        counters = (io.get('read_bytes', 0), io.get('write_bytes', 0), io.get('syscr', 0) + io.get('syscw', 0))
+        read_rate, write_rate, syscall_rate = self.sample_counter_rates(self.proc_io_prev, pid, now, counters)
+        return read_rate / 1024, write_rate / 1024, syscall_rate
+
+    def sample_process_sched(self, pid, now, ctx_switches):
+        """
+        Returns (run_wait_ms_per_sec, voluntary_cs_per_sec, involuntary_cs_per_sec)
+        for a PID. Run-queue wait comes from /proc/<pid>/schedstat, which covers
+        the main thread only; the context switch counters are the ones already
+        read from status. Missing values are None.
+        """
+        try:
+            run_delay = read_pid_schedstat(pid)[1]
+        except (OSError, ValueError):
+            run_delay = None
+        counters = (run_delay or 0,) + (ctx_switches or (0, 0))
+        wait_rate, voluntary_rate, involuntary_rate = self.sample_counter_rates(self.proc_sched_prev, pid, now, counters)
+        return (
+            wait_rate / 1e6 if run_delay is not None else None,
+            voluntary_rate if ctx_switches else None,
+            involuntary_rate if ctx_switches else None,
+        )
+
+    def sample_process_faults(self, pid, now, stat):
+        """
+        Returns (minflt_per_sec, majflt_per_sec, oom_score) for a PID. Fault
+        rates are deltas of its /proc/<pid>/stat; the OOM score is cached for
+        OOM_SCORE_REFRESH seconds and is None if unreadable.
+        """
+        minflt_rate, majflt_rate = self.sample_counter_rates(self.proc_fault_prev, pid, now, (stat['minflt'], stat['majflt']))
+
+        cached = self.proc_oom_cache.get(pid)
+        if cached is None or now - cached[0] >= OOM_SCORE_REFRESH:
+            try:
+                cached = (now, read_pid_oom_score(pid))
+            except (OSError, ValueError):
+                cached = (now, None)
+            self.proc_oom_cache[pid] = cached
+        return minflt_rate, majflt_rate, cached[1]
+
+    def read_process_placement(self, pid, now):
+        """
+        Returns (cgroup_path, {kind: namespace inode}, container) for a PID,
+        cached for CGROUP_REFRESH seconds. container is (id, name, runtime) or
+        None for host processes.
+        """
+        cached = self.proc_placement_cache.get(pid)
+        if cached is None or now - cached[0] >= CGROUP_REFRESH:
+            try:
+                cgroup = read_pid_cgroup(pid)
+            except OSError:
+                cgroup = None
+            namespaces = read_pid_namespaces(pid)
+            cached = (now, cgroup, namespaces, self.resolve_container(cgroup))
+            self.proc_placement_cache[pid] = cached
+        return cached[1:]
+
+    def resolve_container(self, cgroup):
+        """
+        Maps a process to its container from its own cgroup path. Results are
+        cached by cgroup path, so the parsing and the runtime's name lookup
+        happen once per cgroup rather than once per process. The PID
+        namespace is not used: containers run with --pid=host share the
+        host's, and the containers of a pod share one.
+        """
+        if cgroup in self.cgroup_containers:
+            return self.cgroup_containers[cgroup]
+        container = None
+        identity = container_from_cgroup(cgroup)
+        if identity is not None:
+            runtime, container_id = identity
+            container = (container_id, lookup_container_name(runtime, container_id), runtime)
+        if cgroup is not None:
+            self.cgroup_containers[cgroup] = container
+        return container
+
+    def memory_pressure_score(self, minflt_rate, majflt_rate, oom_score):
+        """
+        Combines a process's fault rates and OOM score into one sortable value.
+        Major faults dominate; the OOM score is weighted by how much of the last
+        10s the whole system was stalled on memory (PSI "some" avg10), so OOM
+        candidates only rise to the top while the machine is under pressure.
+        """
+        score = (majflt_rate or 0.0) + (minflt_rate or 0.0) * MINFLT_WEIGHT
+        if oom_score is not None and self.memory_pressure is not None:
+            score += oom_score * self.memory_pressure['some']['avg10'] / 100
+        return score
+
+    def read_process_status(self, pid):
+        """
+        Returns (swap_bytes, (voluntary, involuntary) context switches, ns_pid)
+        from /proc/<pid>/status, or (None, None, None) if it can't be read.
+        ns_pid is the PID as seen inside the process's own PID namespace.
+        """
+        try:
+            status = read_pid_status(pid)
+        except OSError:
+            return None, None, None
+        try:
+            ctx_switches = (int(status.get('voluntary_ctxt_switches', 0)), int(status.get('nonvoluntary_ctxt_switches', 0)))
+        except ValueError:
+            ctx_switches = None
+        try:
+            ns_pid = int(status['NSpid'].split()[-1])
+        except (KeyError, IndexError, ValueError):
+            ns_pid = None
+        return parse_kb(status.get('VmSwap')), ctx_switches, ns_pid
+
+    def prune_process_caches(self, live_pids):
+        """Drops per-PID state for processes that no longer exist."""
+        self.proc_io_unreadable &= live_pids
+        for prev_samples in (self.proc_io_prev, self.proc_cpu_prev, self.proc_sched_prev, self.proc_fault_prev, self.proc_oom_cache, self.proc_placement_cache):
+            for pid in list(prev_samples):
+                if pid not in live_pids:
+                    del prev_samples[pid]
+        live_cgroups = {placement[1] for placement in self.proc_placement_cache.values()}
+        for cgroup in list(self.cgroup_containers):
+            if cgroup not in live_cgroups:
+                del self.cgroup_containers[cgroup]
+        self.smaps_scanner.prune(live_pids)
+        self.numa_scanner.prune(live_pids)
+
+    def request_smaps_scan(self, processes_data):
+        """
+        Queues PIDs for the background PSS/USS scanner: rows currently visible
+        in the table first, then the largest processes by RSS, then the rest.
+        """
+        ordered = []
+        first_row = self.table.rowAt(0)
+        if first_row != -1:
+            last_row = self.table.rowAt(self.table.viewport().height() - 1)
+            if last_row == -1:
+                last_row = self.table.rowCount() - 1
+            for row in range(first_row, last_row + 1):
+                item = self.table.item(row, 0)
+                if item is not None and item.data(Qt.UserRole) is not None:
+                    ordered.append(item.data(Qt.UserRole).pid)
+        by_rss = sorted(processes_data, key=lambda d: d['rss'] or 0, reverse=True)
+        ordered += [d['pid'] for d in by_rss[:SMAPS_TOP_ROWS]]
+        ordered += [d['pid'] for d in by_rss[SMAPS_TOP_ROWS:]]
+        self.smaps_scanner.request(dict.fromkeys(ordered))
+
+    def request_numa_scan(self, processes_data):
+        """Queues the selected process, then the NUMA_TOP_ROWS largest by RSS, for the numa_maps scanner."""
+        selected = self.selected_pid()
+        ordered = [selected] if selected is not None else []
+        by_rss = heapq.nlargest(NUMA_TOP_ROWS, processes_data, key=lambda d: d['rss'] or 0)
+        ordered += [d['pid'] for d in by_rss]
+        self.numa_scanner.request(dict.fromkeys(ordered))
+
+    def make_numa_item(self, pid, last_cpu):
+        """
+        Returns the NUMA Local % item of a row: the share of the process's
+        resident memory on the node of the CPU it last ran on. The tooltip
+        lists every node.
+        """
+        numa = self.numa_scanner.get(pid)
+        total = sum(numa[0].values()) if numa else 0
+        local_node = self.cpu_nodes.get(last_cpu)
+        if not total or local_node is None:
+            return NumericTableWidgetItem(self.lang.get('not_available', 'N/A'), None)
+        nodes, age = numa
+        local = nodes.get(local_node, 0) * 100 / total
+        item = NumericTableWidgetItem(f"{local:.0f}", local)
+        lines = [self.lang.get('numa_node_share', "node {node}: {size:.1f} MB ({percent:.0f}%)").format(
+            node=node, size=size / MB, percent=size * 100 / total) for node, size in sorted(nodes.items())]
+        lines.append(self.lang.get('smaps_age_tooltip', "Sampled {age:.0f}s ago").format(age=age))
+        item.setToolTip("\n".join(lines))
+        if age > self.numa_scanner.refresh_age:
+            item.setForeground(QBrush(QColor('gray')))
+        return item
+
+    def make_smaps_item(self, value, age):
+        item = NumericTableWidgetItem(f"{value / MB:.1f}" if value is not None else self.lang.get('not_available', 'N/A'), value)
+        if age is not None:
+            item.setToolTip(self.lang.get('smaps_age_tooltip', "Sampled {age:.0f}s ago").format(age=age))
+            if age > self.smaps_scanner.refresh_age:
+                item.setForeground(QBrush(QColor('gray')))
+        return item
 
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'username', 'create_time', 'exe', 'num_threads', 'ppid', 'status']):
+    def make_leak_items(self, pid):
+        """Returns the (growth, time until RAM is exhausted) items of a row; flagged leaks are highlighted."""
+        not_available = self.lang.get('not_available', 'N/A')
+        estimate = self.leak_detector.estimate(pid)
+        if estimate is None:
+            return NumericTableWidgetItem(not_available, None), NumericTableWidgetItem("", None)
+        growth, fit, flagged = estimate
+        growth_item = NumericTableWidgetItem(f"{growth * 3600 / MB:.1f}", growth)
+        growth_item.setToolTip(self.lang.get('leak_fit_tooltip', "Linear fit r² = {r2:.2f}").format(r2=fit))
+        if not flagged:
+            return growth_item, NumericTableWidgetItem("", None)
+        seconds_left = self.mem_available / growth
+        hours, minutes = divmod(int(seconds_left) // 60, 60)
+        eta_item = NumericTableWidgetItem(self.lang.get('leak_eta', "{hours}h {minutes:02d}m").format(hours=hours, minutes=minutes), seconds_left)
+        for item in (growth_item, eta_item):
+            item.setBackground(QBrush(QColor(255, 200, 120)))
+        return growth_item, eta_item
+
+    def change_anomaly_threshold(self, value):
+        self.anomaly_detector.z_threshold = value if value > 0 else float('inf')
+        self.anomaly_detector.anomalies = {}
+        self.render_process_table()
+
+    def change_anomaly_window(self, value):
+        # Takes effect from the next sample; existing baselines adapt at the new rate.
+        self.anomaly_detector.window = value
+
+    def highlight_anomalies(self, row, pid):
+        """Colours the cells of metrics on which a process is far outside its own usual range."""
+        for metric, (z, mean, std) in self.anomaly_detector.anomalies.get(pid, {}).items():
+            columns, unit = ANOMALY_COLUMNS[metric]
+            tooltip = self.lang.get('anomaly_tooltip', "z-score {z:.1f} (usually {mean:.1f} ± {std:.1f})").format(z=z, mean=mean / unit, std=std / unit)
+            for col in columns:
+                item = self.table.item(row, col)
+                item.setBackground(QBrush(QColor(255, 170, 170)))
+                item.setToolTip(tooltip)
+
+    def collect_processes(self):
+        """
+        Scans every process once and stores the result in self.process_snapshot
+        ({pid: row dict}) and, as numpy columns, in self.process_columns. Runs
+        on each timer tick; the table and every other per-process view read
+        this snapshot instead of scanning /proc again.
+        """
+        snapshot = {}
+        columns = ColumnBuilder(self.group_interners)
+        nan = float('nan')
+        now = time.monotonic()
+        virtual_memory = psutil.virtual_memory()
+        mem_total = virtual_memory.total
+        self.mem_available = virtual_memory.available
+        try:
+            self.memory_pressure = read_pressure('memory')
+        except (OSError, ValueError):
+            self.memory_pressure = None
+        # The I/O counters we may not read ourselves, read by the helper in
+        # one round-trip off this thread; this tick uses the latest result.
+        if self.privileged_helper.connected and self.proc_io_unreadable:
+            self.privileged_helper.request_io_counters(sorted(self.proc_io_unreadable))
+            helper_io = self.privileged_helper.latest_io
+        else:
+            helper_io = (None, {})
+
+        # Everything psutil would take from /proc/<pid>/stat (name, ppid,
+        # state, last CPU, CPU times) comes from our own single read of it,
+        # which also has the fault counters psutil doesn't expose.
+        for proc in psutil.process_iter(['pid', 'memory_info', 'username', 'exe', 'num_threads']):
             try:
                 pid = proc.info.get('pid', 'N/A')
-                name = proc.info.get('name', '') or ''
-                cpu_percent = proc.info.get('cpu_percent', 0.0)
-                mem_percent = proc.info.get('memory_percent', 0.0)
-                username = proc.info.get('username', 'N/A')
-                create_time = proc.info.get('create_time', None)
-                exe_path = proc.info.get('exe', '')
-                num_threads = proc.info.get('num_threads', 'N/A')
-                ppid = proc.info.get('ppid', 'N/A')
-                status = proc.info.get('status', 'N/A')
-
-                if search_text and search_text not in name.lower() and search_text not in str(pid):
-                    continue
-
-                start_time_str = "N/A"
-                if create_time:
-                    try:
-                        start_time_str = datetime.fromtimestamp(create_time).strftime('%Y-%m-%d %H:%M:%S')
-                    except (OSError, ValueError):
-                        pass
-
-                path_str = exe_path if exe_path else self.lang.get('not_available', 'N/A')
-                if not path_str or path_str == self.lang.get('not_available', 'N/A'):
-                    try:
-                        path_str = proc.exe() if proc.exe() else self.lang.get('not_available', 'N/A')
-                    except (psutil.AccessDenied, psutil.NoSuchProcess, OSError):
-                        path_str = self.lang.get('permission_denied', "Permission Denied / N/A")
-
-                processes_data.append({
-                    'pid': pid, 'name': name, 'cpu': cpu_percent, 'mem': mem_percent,
-                    'user': username, 'ppid': ppid, 'start_time': start_time_str,
-                    'path': path_str, 'threads': num_threads, 'status': status,
+                try:
+                    stat = read_pid_stat(pid)
+                except (OSError, ValueError, IndexError):
+                    continue  # exited since the listing
+                # RAM % is derived from the RSS psutil already read from statm,
+                # instead of asking memory_percent() to read it a second time.
+                mem_info = proc.info.get('memory_info')
+                rss = mem_info.rss if mem_info else None
+                swap, ctx_switches, ns_pid = self.read_process_status(pid)
+                cgroup, namespaces, container = self.read_process_placement(pid, now)
+                minflt_rate, majflt_rate, oom_score = self.sample_process_faults(pid, now, stat)
+                ticks = stat['utime'] + stat['stime']
+                cpu_rate, = self.sample_counter_rates(self.proc_cpu_prev, pid, now, (ticks,))
+                name = self.process_name(pid, stat['name'])
+                cpu = cpu_rate * 100.0 / CLK_TCK
+                mem = rss * 100.0 / mem_total if rss is not None else 0.0
+                user = proc.info.get('username', 'N/A')
+                # Read by psutil when it first saw the process, and cached since.
+                create_time = proc.create_time()
+                exe = proc.info.get('exe', '')
+                threads = proc.info.get('num_threads', 'N/A')
+                io_rates = self.sample_process_io(pid, now, helper_io)
+                snapshot[pid] = {
+                    'pid': pid, 'name': name, 'cpu': cpu, 'mem': mem, 'user': user, 'ppid': stat['ppid'],
+                    'create_time': create_time, 'exe': exe,
+                    'threads': threads, 'status': STAT_STATUSES.get(stat['state'], stat['state']),
+                    'io_rates': io_rates, 'rss': rss, 'swap': swap,
+                    'ctx_switches': ctx_switches, 'sched_rates': self.sample_process_sched(pid, now, ctx_switches),
+                    'cpu_time': ticks / CLK_TCK,
+                    'last_cpu': stat['processor'], 'minflt_rate': minflt_rate, 'majflt_rate': majflt_rate,
+                    'oom_score': oom_score, 'mem_pressure': self.memory_pressure_score(minflt_rate, majflt_rate, oom_score),
+                    'cgroup': cgroup, 'namespaces': namespaces, 'container': container, 'ns_pid': ns_pid,
                     'proc_object': proc
-                })
+                }
+                # Same order as snapshot_columns.COLUMN_NAMES, NaN where missing;
+                # kernel threads and unreadable executables are grouped by '[name]'.
+                columns.add((pid, create_time or 0.0, cpu, mem, nan if rss is None else rss, nan if swap is None else swap,
+                             threads if isinstance(threads, int) else nan,
+                             io_rates[0] if io_rates else nan, io_rates[1] if io_rates else nan,
+                             user or '', exe or f"[{name}]", name))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
             except Exception as e:
                 print(f"Error processing process info: {e}")
                 continue
 
+        self.process_snapshot = snapshot
+        self.process_snapshot_time = now
+        self.process_columns = columns.finish()
+        self.leak_detector.update(self.process_columns, now)
+        self.anomaly_detector.update(self.process_columns)
+        self.prune_process_caches(set(snapshot))
+
+    def process_name(self, pid, comm):
+        """Extends a comm the kernel truncated, from the lifecycle tracker's command line when it has one."""
+        if len(comm) < COMM_LENGTH:
+            return comm
+        info = self.lifecycle_tracker.known.get(pid)
+        if info is not None:
+            return extend_comm(comm, info['cmdline'])
+        try:
+            return extend_comm(comm, read_pid_cmdline(pid))
+        except OSError:
+            return comm
+
+    def snapshot_wanted(self, now):
+        """
+        Whether a timer tick needs a fresh snapshot: per-process alert rules
+        are loaded, the leak detector is due a sample, or a view showing live per-process
+        data is on screen. Otherwise the scan and its per-PID /proc reads are
+        skipped, and consumers keep the previous snapshot. The anomaly
+        detector, on by default, only learns while the process table (where
+        its highlights are shown) is visible.
+        """
+        if any(rule.per_process for rule in self.alert_engine.rules) or self.leak_detector.due(now):
+            return True
+        if self.isMinimized():
+            return False
+        if self.inspect_panel is not None and self.inspect_panel.isVisible():
+            return True
+        return any(view.isVisible() for view in (self.table, self.group_tree, self.leaderboard_table, self.pattern_table))
+
+    def refresh_snapshot(self):
+        if self.snapshot_wanted(time.monotonic()):
+            self.collect_processes()
+            # The table is only redrawn on Refresh, so queue numa_maps reads
+            # from here for the results to be ready when it is.
+            self.request_numa_scan(self.process_snapshot.values())
+
+    def update_processes(self):
+        self.collect_processes()
+        self.render_process_table()
+
+    def render_process_table(self):
+        search_text = self.search_bar.text().lower()
+        self.table.setRowCount(0)
+        processes_data = []
+        not_available = self.lang.get('not_available', 'N/A')
+
+        for row_data in self.process_snapshot.values():
+            name = row_data['name']
+            pid = row_data['pid']
+            if search_text and search_text not in name.lower() and search_text not in str(pid):
+                continue
+            processes_data.append(row_data)
+
+        if self.group_mode != 'none':
+            self.render_group_view(processes_data)
+            return
+
         self.table.setSortingEnabled(False)
         for row_data in processes_data:
+            start_time_str = "N/A"
+            if row_data['create_time']:
+                try:
+                    start_time_str = datetime.fromtimestamp(row_data['create_time']).strftime('%Y-%m-%d %H:%M:%S')
+                except (OSError, ValueError):
+                    pass
+
+            path_str = row_data['exe'] if row_data['exe'] else not_available
+            if not path_str or path_str == not_available:
+                proc = row_data['proc_object']
+                try:
+                    path_str = proc.exe() if proc.exe() else not_available
+                except (psutil.AccessDenied, psutil.NoSuchProcess, OSError):
+                    path_str = self.lang.get('permission_denied', "Permission Denied / N/A")
+
             row = self.table.rowCount()
             self.table.insertRow(row)
             self.table.setItem(row, 0, QTableWidgetItem(str(row_data['pid'])))
@@ -61,31 +483,121 @@ class ProcessDataHandler:
             self.table.setItem(row, 3, QTableWidgetItem(f"{row_data['mem']:.1f}"))
             self.table.setItem(row, 4, QTableWidgetItem(row_data['user']))
             self.table.setItem(row, 5, QTableWidgetItem(str(row_data['ppid'])))
-            self.table.setItem(row, 6, QTableWidgetItem(row_data['start_time']))
-            self.table.setItem(row, 7, QTableWidgetItem(row_data['path']))
+            self.table.setItem(row, 6, QTableWidgetItem(start_time_str))
+            self.table.setItem(row, 7, QTableWidgetItem(path_str))
             self.table.setItem(row, 8, QTableWidgetItem(str(row_data['threads'])))
             self.table.setItem(row, 9, QTableWidgetItem(row_data['status']))
+            io_rates = row_data['io_rates']
+            for col, value in enumerate(io_rates if io_rates else (None, None, None), start=10):
+                self.table.setItem(row, col, NumericTableWidgetItem(f"{value:.1f}" if value is not None else not_available, value))
+            rss = row_data['rss']
+            self.table.setItem(row, 13, NumericTableWidgetItem(f"{rss / MB:.1f}" if rss is not None else not_available, rss))
+            smaps = self.smaps_scanner.get(row_data['pid'])
+            pss, uss, age = smaps if smaps else (None, None, None)
+            self.table.setItem(row, 14, self.make_smaps_item(pss, age))
+            self.table.setItem(row, 15, self.make_smaps_item(uss, age))
+            swap = row_data['swap']
+            self.table.setItem(row, 16, NumericTableWidgetItem(f"{swap / MB:.1f}" if swap is not None else not_available, swap))
+            for col, value in enumerate(row_data['sched_rates'], start=17):
+                self.table.setItem(row, col, NumericTableWidgetItem(f"{value:.1f}" if value is not None else not_available, value))
+            last_cpu = row_data['last_cpu']
+            self.table.setItem(row, 20, NumericTableWidgetItem(str(last_cpu) if last_cpu is not None else not_available, last_cpu))
+            for col, key in ((21, 'minflt_rate'), (22, 'majflt_rate')):
+                value = row_data[key]
+                self.table.setItem(row, col, NumericTableWidgetItem(f"{value:.1f}" if value is not None else not_available, value))
+            oom_score = row_data['oom_score']
+            self.table.setItem(row, 23, NumericTableWidgetItem(str(oom_score) if oom_score is not None else not_available, oom_score))
+            self.table.setItem(row, 24, NumericTableWidgetItem(f"{row_data['mem_pressure']:.2f}", row_data['mem_pressure']))
+            container = row_data['container']
+            container_item = QTableWidgetItem(container[1] if container else "")
+            container_item.setToolTip(", ".join(f"{kind}:[{inode}]" for kind, inode in row_data['namespaces'].items()))
+            self.table.setItem(row, 25, container_item)
+            self.table.setItem(row, 26, QTableWidgetItem(container[0][:12] if container else ""))
+            ns_pid = row_data['ns_pid']
+            self.table.setItem(row, 27, NumericTableWidgetItem(str(ns_pid) if ns_pid is not None else not_available, ns_pid))
+            growth_item, eta_item = self.make_leak_items(row_data['pid'])
+            self.table.setItem(row, 28, growth_item)
+            self.table.setItem(row, 29, eta_item)
+            self.table.setItem(row, 30, self.make_numa_item(row_data['pid'], last_cpu))
+            self.highlight_anomalies(row, row_data['pid'])
             self.table.item(row, 0).setData(Qt.UserRole, row_data['proc_object'])
         self.table.setSortingEnabled(True)
+        self.request_smaps_scan(processes_data)
+        self.request_numa_scan(processes_data)
 
     def sort_processes_table(self, logical_index):
-        self.table.sortItems(logical_index, Qt.AscendingOrder)
+        # Follow the header's sort indicator so a second click sorts descending
+        # and the top consumers can be brought to the top.
+        self.table.sortItems(logical_index, self.table.horizontalHeader().sortIndicatorOrder())
 
-    def get_selected_process_object(self):
+    def selected_pid(self):
+        """Returns the PID of the selected row, or None, without any warning dialogs."""
+        if self.group_mode != 'none':
+            item = self.group_tree.currentItem()
+            return item.data(1, Qt.UserRole) if item is not None else None
         row = self.table.currentRow()
-        if row == -1:
+        item = self.table.item(row, 0) if row != -1 else None
+        proc_obj = item.data(Qt.UserRole) if item else None
+        return proc_obj.pid if proc_obj is not None else None
+
+    def selected_pids(self):
+        """
+        Returns the PIDs of every selected row, in display order. A selected
+        group row in the grouped view stands for all of its member processes.
+        """
+        return [pid for pid, _ in self.selected_processes()]
+
+    def selected_processes(self):
+        """
+        Returns (pid, create_time) for every selected row, in display order,
+        as it was when the rows were drawn; actions compare it with the
+        current snapshot so a PID reused since then isn't acted on.
+        """
+        processes = []
+        if self.group_mode != 'none':
+            pids = []
+            for item in self.group_tree.selectedItems():
+                pid = item.data(1, Qt.UserRole)
+                if pid is not None:
+                    pids.append(pid)
+                else:
+                    pids.extend(self.group_members.get(item.data(0, Qt.UserRole), ()))
+            processes = [(pid, self.group_snapshot[pid]['create_time']) for pid in pids if pid in self.group_snapshot]
+        else:
+            for index in self.table.selectionModel().selectedRows():
+                item = self.table.item(index.row(), 0)
+                proc_obj = item.data(Qt.UserRole) if item else None
+                if proc_obj is not None:
+                    # Cached by psutil when the collector read it, so this is the row's start time.
+                    processes.append((proc_obj.pid, proc_obj.create_time()))
+        return list(dict.fromkeys(processes))
+
+    def process_children(self):
+        """Returns the ppid -> [child pids] index of the current snapshot, built on first use after each collection."""
+        if self.children_index_time != self.process_snapshot_time:
+            children = {}
+            for row_data in self.process_snapshot.values():
+                children.setdefault(row_data['ppid'], []).append(row_data['pid'])
+            self.children_index = children
+            self.children_index_time = self.process_snapshot_time
+        return self.children_index
+
+    def descendant_pids(self, pid):
+        """Returns pid followed by all its descendants in the current snapshot, parents before children."""
+        children = self.process_children()
+        pids, queue = [pid], [pid]
+        while queue:
+            queue = [child for parent in queue for child in children.get(parent, ()) if child != parent]
+            pids.extend(queue)
+        return pids
+
+    def get_selected_process_object(self):
+        pid = self.selected_pid()
+        if pid is None:
             QMessageBox.warning(self, self.lang['title'], self.lang.get('select_process_warning', "Please select a process."))
             return None
-        item = self.table.item(row, 0)
-        if not item:
-            QMessageBox.warning(self, self.lang['title'], self.lang.get('invalid_process_warning', "Invalid process selected."))
-            return None
-        proc_obj = item.data(Qt.UserRole)
-        if proc_obj is None:
-            QMessageBox.warning(self, self.lang['title'], self.lang.get('invalid_process_warning', "Invalid process selected (no process object found)."))
-            return None
         try:
-            return psutil.Process(proc_obj.pid)
+            return psutil.Process(pid)
         except psutil.NoSuchProcess:
             QMessageBox.warning(self, self.lang['title'], self.lang.get('no_such_process_error', "Process no longer exists."))
             self.update_processes()
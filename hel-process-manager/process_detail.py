@@ -0,0 +1,61 @@
+from collections import deque
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel
+import pyqtgraph as pg
+
+# Samples kept per metric (one per timer tick).
+HISTORY_LENGTH = 120
+
+# (key, default label, value format) of each sparkline, in display order.
+DETAIL_METRICS = (
+    ('cpu', "CPU %", "{:.1f}"),
+    ('rss', "RSS MB", "{:.1f}"),
+    ('read', "Read KB/s", "{:.1f}"),
+    ('write', "Write KB/s", "{:.1f}"),
+    ('fds', "Open FDs", "{:.0f}"),
+    ('threads', "Threads", "{:.0f}"),
+    ('ctx', "Context Switches/s", "{:.0f}"),
+)
+
+class ProcessDetailView(QWidget):
+    """Grid of sparklines for one process, each backed by a fixed-size ring buffer."""
+    def __init__(self, lang):
+        super().__init__()
+        self.history = {key: deque(maxlen=HISTORY_LENGTH) for key, _, _ in DETAIL_METRICS}
+        self.value_labels = {}
+        self.curves = {}
+        self.prev_ctx = None
+
+        labels = lang.get('detail_metrics', [label for _, label, _ in DETAIL_METRICS])
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for index, (key, _, _) in enumerate(DETAIL_METRICS):
+            row, col = divmod(index, 2)
+            layout.addWidget(QLabel(labels[index]), row, col * 3)
+            self.value_labels[key] = QLabel("-")
+            layout.addWidget(self.value_labels[key], row, col * 3 + 1)
+            sparkline = pg.PlotWidget()
+            sparkline.hideAxis('left')
+            sparkline.hideAxis('bottom')
+            sparkline.setMouseEnabled(False, False)
+            sparkline.setMenuEnabled(False)
+            sparkline.setFixedHeight(40)
+            self.curves[key] = sparkline.plot(pen='c')
+            layout.addWidget(sparkline, row, col * 3 + 2)
+
+    def reset(self):
+        for values in self.history.values():
+            values.clear()
+        for key, _, _ in DETAIL_METRICS:
+            self.value_labels[key].setText("-")
+            self.curves[key].setData([])
+        self.prev_ctx = None
+
+    def add_sample(self, values):
+        """Appends one tick of values ({metric: number or None}) and redraws the sparklines."""
+        for key, _, fmt in DETAIL_METRICS:
+            value = values.get(key)
+            if value is None:
+                continue
+            self.history[key].append(value)
+            self.value_labels[key].setText(fmt.format(value))
+            self.curves[key].setData(list(self.history[key]))
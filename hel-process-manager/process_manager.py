@@ -1,4 +1,5 @@
 import sys
+import time
 import os
 import psutil
 import pyqtgraph as pg
@@ -17,10 +18,31 @@ from graph_handler import GraphHandler
 from process_actions import ProcessActions
 from inspect_handler import InspectHandler
 from startup_programs_handler import StartupProgramsHandler
+from thread_view_handler import ThreadViewHandler
+from group_view_handler import GroupViewHandler
+from lifecycle_view_handler import LifecycleViewHandler
+from cpu_leaderboard_handler import CpuLeaderboardHandler
+from alerts_handler import AlertsHandler
+from policies_handler import PoliciesHandler
+from resource_limits_handler import ResourceLimitsHandler
+from bulk_actions_handler import BulkActionsHandler
+from pattern_actions_handler import PatternActionsHandler
+from privileged_helper_handler import PrivilegedHelperHandler
+from smaps_scanner import SmapsRollupScanner
+from numa_scanner import NumaMapsScanner
+from lifecycle_tracker import ProcessLifecycleTracker
+from cpu_leaderboard import CpuTimeLeaderboard
+from leak_detector import LeakDetector
+from anomaly_detector import AnomalyDetector
+from alert_rules import AlertEngine
+from process_policies import PolicyDaemon
+from numa_linux import read_numa_nodes
+from snapshot_columns import ColumnBuilder, KeyInterner
+from privileged_client import PrivilegedHelperClient
 # Note: You don't need to import startup_linux or startup_windows here,
 # as startup_programs_handler handles the import logic.
 
-class ProcessManager(QWidget, UIManager, ProcessDataHandler, SystemMonitor, NetworkMonitor, GraphHandler, ProcessActions, InspectHandler, StartupProgramsHandler):
+class ProcessManager(QWidget, UIManager, ProcessDataHandler, SystemMonitor, NetworkMonitor, GraphHandler, ProcessActions, InspectHandler, StartupProgramsHandler, ThreadViewHandler, GroupViewHandler, LifecycleViewHandler, CpuLeaderboardHandler, AlertsHandler, PoliciesHandler, ResourceLimitsHandler, BulkActionsHandler, PatternActionsHandler, PrivilegedHelperHandler):
     def __init__(self):
         super().__init__()
         
@@ -48,6 +70,61 @@ class ProcessManager(QWidget, UIManager, ProcessDataHandler, SystemMonitor, Netw
         self.last_net_bytes_recv = 0
         self.last_disk_read_bytes = 0
         self.last_disk_write_bytes = 0
+        self.whole_disks = None
+        self.physical_disks = set()
+        self.diskstats_devices = set()
+        self.last_disk_device_sample = (None, {})
+        self.process_snapshot = {}
+        self.process_snapshot_time = None
+        self.children_index = {}
+        self.children_index_time = None
+        self.bulk_worker = None
+        self.bulk_label = ""
+        self.bulk_status_target = None
+        self.pattern_matches = []  # (pid, create_time) of the previewed processes
+        self.proc_io_prev = {}
+        self.proc_io_unreadable = set()
+        self.proc_cpu_prev = {}
+        self.proc_sched_prev = {}
+        self.proc_fault_prev = {}
+        self.proc_oom_cache = {}
+        self.memory_pressure = None
+        self.mem_available = 0
+        self.leak_detector = LeakDetector()
+        self.anomaly_detector = AnomalyDetector()
+        self.alert_engine = AlertEngine([])
+        self.proc_placement_cache = {}
+        self.cgroup_containers = {}
+        self.group_mode = 'none'
+        self.group_expanded = set()
+        self.group_members = {}
+        self.group_snapshot = {}  # the snapshot group_members were taken from
+        self.group_interners = {'user': KeyInterner(), 'exe': KeyInterner(), 'name': KeyInterner()}
+        self.process_columns = ColumnBuilder(self.group_interners).finish()
+        self.cgroup_root = None
+        self.cgroup_prev = {}
+        self.limit_cgroup_prev = {}
+        self.last_run_delay = None
+        self.smaps_scanner = SmapsRollupScanner()
+        self.smaps_scanner.start()
+        self.numa_scanner = NumaMapsScanner()
+        self.numa_scanner.start()
+        self.cpu_nodes = {cpu: node for node, cpus in read_numa_nodes().items() for cpu in cpus}
+        self.policy_daemon = PolicyDaemon()
+        self.policy_seq = 0
+        self.lifecycle_tracker = ProcessLifecycleTracker()
+        self.lifecycle_tracker.listeners.append(self.policy_daemon.on_lifecycle_event)
+        self.lifecycle_tracker.start()
+        self.lifecycle_seq = 0
+        self.cpu_leaderboard = CpuTimeLeaderboard()
+        self.leaderboard_seq = 0
+        self.leaderboard_prev = {}  # pid -> ((pid, create_time), CPU seconds already credited, last seen)
+        self.leaderboard_exited = {}  # (pid, create_time) -> when its exit was credited
+        self.leaderboard_started = time.time()
+        self.thread_view_pid = None
+        self.thread_prev = {}
+        self.inspect_panel = None
+        self.privileged_helper = PrivilegedHelperClient()
 
         # Call methods from imported classes
         self.init_ui()
@@ -57,6 +134,8 @@ class ProcessManager(QWidget, UIManager, ProcessDataHandler, SystemMonitor, Netw
         self.update_network_activity()
         self.update_disk_io_graph()
         self.update_startup_programs()
+        self.load_alert_rules()
+        self.load_policies()
         self.update_texts()
 
     def change_language(self):
@@ -0,0 +1,208 @@
+import configparser
+import fnmatch
+import os
+import pwd
+import threading
+import time
+from collections import deque, namedtuple
+
+import psutil
+
+from cgroup_linux import read_pid_cgroup
+from numa_linux import parse_cpu_list
+from procfs_linux import extend_comm, list_pid_tasks, read_pid_cmdline, read_pid_uid
+
+POLICIES_PATH = os.path.join(os.path.expanduser('~'), '.config', 'hel-process', 'policies.conf')
+
+EXAMPLE_POLICIES = """\
+# One section per policy; the first policy that matches a new process wins.
+# Match keys (shell-style patterns, all given ones must match):
+#   name, user, cmdline, cgroup
+# Actions (any combination):
+#   nice = -20..19
+#   ionice = realtime[:0-7] | best-effort[:0-7] | idle
+#   affinity = CPU list such as 0-3,8
+#
+# [background-builds]
+# name = cc1*
+# nice = 10
+# ionice = idle
+#
+# [batch-slice]
+# cgroup = /system.slice/batch*
+# affinity = 4-7
+"""
+
+IONICE_CLASSES = {
+    'realtime': psutil.IOPRIO_CLASS_RT,
+    'best-effort': psutil.IOPRIO_CLASS_BE,
+    'idle': psutil.IOPRIO_CLASS_IDLE,
+}
+MATCH_KEYS = ('name', 'user', 'cmdline', 'cgroup')
+POLICY_LOG_SIZE = 1000
+
+# outcome is 'applied' or 'failed'; details lists what was set, or the error.
+PolicyResult = namedtuple('PolicyResult', 'time policy pid name outcome details')
+
+class PolicyError(ValueError):
+    pass
+
+class ProcessPolicy:
+    def __init__(self, name, patterns, nice, ionice, affinity):
+        self.name = name
+        self.patterns = patterns  # {match key: pattern}
+        self.nice = nice
+        self.ionice = ionice      # (class, level or None) or None
+        self.affinity = affinity  # list of CPUs or None
+
+    def matches(self, facts):
+        return all(fnmatch.fnmatchcase(facts.get(key) or '', pattern) for key, pattern in self.patterns.items())
+
+def parse_policies(text):
+    """Parses a policies.conf; raises PolicyError naming the faulty policy."""
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read_string(text)
+    except configparser.Error as e:
+        raise PolicyError(str(e)) from None
+    policies = []
+    for name in parser.sections():
+        section = parser[name]
+        try:
+            unknown = set(section) - set(MATCH_KEYS) - {'nice', 'ionice', 'affinity'}
+            if unknown:
+                raise PolicyError(f"unknown key(s): {', '.join(sorted(unknown))}")
+            nice = section.getint('nice') if section.get('nice') else None
+            if nice is not None and not -20 <= nice <= 19:
+                raise PolicyError("nice must be between -20 and 19")
+            ionice = None
+            if section.get('ionice'):
+                io_class, _, level = section['ionice'].strip().partition(':')
+                if io_class not in IONICE_CLASSES:
+                    raise PolicyError(f"unknown ionice class '{io_class}'")
+                ionice = (IONICE_CLASSES[io_class], int(level) if level and io_class != 'idle' else None)
+            affinity = parse_cpu_list(section['affinity']) if section.get('affinity') else None
+            if affinity == []:
+                raise PolicyError("empty CPU list")
+        except PolicyError as e:
+            raise PolicyError(f"[{name}]: {e}") from None
+        except ValueError as e:
+            raise PolicyError(f"[{name}]: {e}") from None
+        if nice is None and ionice is None and affinity is None:
+            raise PolicyError(f"[{name}]: no action (nice, ionice or affinity)")
+        patterns = {key: section[key].strip() for key in MATCH_KEYS if section.get(key)}
+        policies.append(ProcessPolicy(name, patterns, nice, ionice, affinity))
+    return policies
+
+class ProcessFacts(dict):
+    """The match keys of one process, read from /proc only when a policy asks for them."""
+    user_names = {}
+
+    def __init__(self, pid, **known):
+        super().__init__(known)
+        self.pid = pid
+
+    def __missing__(self, key):
+        value = None
+        try:
+            if key == 'cmdline':
+                value = read_pid_cmdline(self.pid)
+            elif key == 'cgroup':
+                value = read_pid_cgroup(self.pid)
+            elif key == 'user':
+                uid = read_pid_uid(self.pid)
+                if uid not in self.user_names:
+                    try:
+                        self.user_names[uid] = pwd.getpwuid(uid).pw_name
+                    except KeyError:
+                        self.user_names[uid] = str(uid)
+                value = self.user_names[uid]
+        except OSError:
+            pass
+        self[key] = value
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in MATCH_KEYS else default
+
+def apply_policy(pid, policy):
+    """
+    Applies a policy's actions to every thread of a process (nice, I/O
+    priority and affinity are per-thread on Linux) and returns a description
+    of what was set. Raises psutil/OS errors.
+    """
+    applied = []
+    tids = list_pid_tasks(pid)
+    for tid in tids:
+        task = psutil.Process(tid)
+        if policy.nice is not None:
+            task.nice(policy.nice)
+        if policy.ionice is not None:
+            io_class, level = policy.ionice
+            task.ionice(io_class, level) if level is not None else task.ionice(io_class)
+        if policy.affinity is not None:
+            task.cpu_affinity(policy.affinity)
+    if policy.nice is not None:
+        applied.append(f"nice={policy.nice}")
+    if policy.ionice is not None:
+        applied.append(f"ionice={policy.ionice[0]}" + (f":{policy.ionice[1]}" if policy.ionice[1] is not None else ""))
+    if policy.affinity is not None:
+        applied.append(f"affinity={policy.affinity}")
+    return ", ".join(applied)
+
+class PolicyDaemon:
+    """
+    Applies the first matching policy to each new process. It is called from
+    the lifecycle tracker's thread for every exec, so a process is looked at
+    once per program it runs, right after it starts; sweep() handles the
+    processes that already exist when policies are (re)loaded. Results are
+    kept in a bounded log read with results_since(), like tracker events.
+    """
+    def __init__(self):
+        self.policies = []
+        self.results = deque(maxlen=POLICY_LOG_SIZE)  # (seq, PolicyResult)
+        self.seq = 0
+        self._lock = threading.Lock()
+
+    def set_policies(self, policies):
+        self.policies = policies  # replaced as a whole; readers see the old or the new list
+
+    def check(self, pid, facts):
+        policies = self.policies
+        for policy in policies:
+            if policy.matches(facts):
+                try:
+                    outcome, details = 'applied', apply_policy(pid, policy)
+                except (psutil.NoSuchProcess, FileNotFoundError):
+                    return  # already gone
+                except (psutil.AccessDenied, OSError, ValueError) as e:
+                    outcome, details = 'failed', str(e)
+                with self._lock:
+                    self.seq += 1
+                    self.results.append((self.seq, PolicyResult(time.time(), policy.name, pid, facts['name'], outcome, details)))
+                return
+
+    def on_lifecycle_event(self, event):
+        if event.kind == 'exec' and self.policies:
+            # The tracker reports the kernel's comm, truncated to 15 characters;
+            # extend it like the collector does so name patterns see the same
+            # name here as in sweep().
+            name = extend_comm(event.name, event.cmdline)
+            self.check(event.pid, ProcessFacts(event.pid, name=name, cmdline=event.cmdline))
+
+    def sweep(self, snapshot):
+        """Checks every process of a collector snapshot once, e.g. after policies change."""
+        if not self.policies:
+            return
+        for pid, row_data in snapshot.items():
+            self.check(pid, ProcessFacts(pid, name=row_data['name'], user=row_data['user'], cgroup=row_data.get('cgroup')))
+
+    def results_since(self, seq):
+        with self._lock:
+            newer = []
+            for result_seq, result in reversed(self.results):
+                if result_seq <= seq:
+                    break
+                newer.append(result)
+            newer.reverse()
+            return newer, self.seq
@@ -0,0 +1,56 @@
+import re
+
+import numpy as np
+
+from alert_rules import AlertRuleError, ExpressionCompiler
+
+class QueryError(ValueError):
+    pass
+
+class ProcessQuery:
+    """
+    A pgrep-style selection of processes, evaluated against the collector's
+    columnar snapshot rather than /proc:
+
+    - pattern: regular expression searched in the process name, or in the
+      full command line when full_cmdline is set (pgrep -f);
+    - users: user names, any of which must own the process (pgrep -u);
+    - condition: an alert-rule expression such as 'cpu > 50 and rss > 1G'.
+
+    Name patterns are matched once per distinct name (the interned labels),
+    not once per process; command lines come from the lifecycle tracker's
+    table, which already holds one for every live process.
+    """
+    def __init__(self, pattern, full_cmdline, users, condition, interners):
+        try:
+            self.pattern = re.compile(pattern) if pattern else None
+        except re.error as e:
+            raise QueryError(f"{pattern!r}: {e}") from None
+        self.full_cmdline = full_cmdline
+        self.users = users
+        try:
+            self.condition = ExpressionCompiler(interners).compile(condition, per_process=True)[0] if condition else None
+        except AlertRuleError as e:
+            raise QueryError(str(e)) from None
+        self.interners = interners
+
+    def match(self, columns, cmdline_of):
+        """Returns the boolean mask of matching rows; cmdline_of(pid) gives a command line or None."""
+        mask = np.ones(len(columns['pid']), bool)
+        if self.users:
+            codes = [self.interners['user'].codes.get(user, -1) for user in self.users]
+            mask &= np.isin(columns['user'], codes)
+        if self.condition is not None:
+            with np.errstate(all='ignore'):
+                mask &= self.condition(columns)
+        if self.pattern is not None:
+            labels = self.interners['name'].labels
+            if not self.full_cmdline:
+                codes = [code for code, name in enumerate(labels) if self.pattern.search(name)]
+                mask &= np.isin(columns['name'], codes)
+            else:
+                names, pids = columns['name'], columns['pid']
+                for row in np.flatnonzero(mask).tolist():
+                    text = cmdline_of(int(pids[row])) or labels[names[row]]
+                    mask[row] = self.pattern.search(text) is not None
+        return mask
@@ -0,0 +1,318 @@
+import os
+
+PROC_ROOT = '/proc'
+
+def read_pid_io(pid):
+    """
+    Reads /proc/<pid>/io and returns its counters as a dict of ints
+    (rchar, wchar, syscr, syscw, read_bytes, write_bytes, ...).
+    Raises OSError (usually PermissionError) if the file can't be read.
+    """
+    counters = {}
+    with open(os.path.join(PROC_ROOT, str(pid), 'io'), 'rb') as f:
+        for line in f:
+            key, _, value = line.partition(b':')
+            try:
+                counters[key.decode()] = int(value)
+            except ValueError:
+                continue
+    return counters
+
+SYS_BLOCK_ROOT = '/sys/block'
+
+# Field names of /proc/diskstats after "major minor name" (kernel docs,
+# Documentation/admin-guide/iostats.rst). Newer kernels append discard and
+# flush fields, which are ignored here.
+DISKSTATS_FIELDS = (
+    'reads', 'reads_merged', 'sectors_read', 'ms_reading',
+    'writes', 'writes_merged', 'sectors_written', 'ms_writing',
+    'in_flight', 'ms_io', 'weighted_ms_io',
+)
+
+def read_diskstats():
+    """
+    Parses /proc/diskstats in a single pass and returns a dict mapping each
+    device name to a dict of its counters (see DISKSTATS_FIELDS).
+    """
+    devices = {}
+    with open(os.path.join(PROC_ROOT, 'diskstats'), 'rb') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 3 + len(DISKSTATS_FIELDS):
+                continue
+            devices[parts[2].decode()] = dict(zip(DISKSTATS_FIELDS, map(int, parts[3:3 + len(DISKSTATS_FIELDS)])))
+    return devices
+
+def list_whole_disks():
+    """
+    Returns the set of whole block devices (entries of /sys/block), leaving out
+    loop and ram devices. Partitions are not listed there, so this is what
+    separates disks from their partitions in /proc/diskstats.
+    """
+    # sysfs spells '/' in device names (e.g. cciss/c0d0) as '!'
+    return {name.replace('!', '/') for name in os.listdir(SYS_BLOCK_ROOT) if not name.startswith(('loop', 'ram'))}
+
+def list_stacked_devices():
+    """
+    Returns the block devices built on top of others (device-mapper, md RAID),
+    i.e. the /sys/block entries with a non-empty slaves/ directory. Their I/O
+    is also counted on the devices underneath.
+    """
+    stacked = set()
+    for name in os.listdir(SYS_BLOCK_ROOT):
+        try:
+            if os.listdir(os.path.join(SYS_BLOCK_ROOT, name, 'slaves')):
+                stacked.add(name.replace('!', '/'))
+        except OSError:
+            continue
+    return stacked
+
+def read_pid_status(pid):
+    """
+    Reads /proc/<pid>/status and returns its fields as a dict of strings,
+    e.g. {'VmRSS': '1234 kB', 'Threads': '4', ...}.
+    """
+    fields = {}
+    with open(os.path.join(PROC_ROOT, str(pid), 'status'), 'rb') as f:
+        for line in f:
+            key, _, value = line.partition(b':')
+            fields[key.decode()] = value.strip().decode(errors='replace')
+    return fields
+
+def parse_kb(value):
+    """Converts a '1234 kB' field from /proc to bytes (0 if missing or malformed)."""
+    try:
+        return int(value.split()[0]) * 1024
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+def read_pid_smaps_rollup(pid):
+    """
+    Reads /proc/<pid>/smaps_rollup (Linux 4.14+) and returns its totals in
+    bytes, e.g. {'Rss': ..., 'Pss': ..., 'Private_Dirty': ..., 'Swap': ...}.
+    The kernel walks the whole address space to produce this file, so it is
+    far more expensive than statm/status and should not be read every tick.
+    """
+    totals = {}
+    with open(os.path.join(PROC_ROOT, str(pid), 'smaps_rollup'), 'rb') as f:
+        next(f, None)  # header line: address range and "[rollup]"
+        for line in f:
+            key, _, value = line.partition(b':')
+            totals[key.decode()] = parse_kb(value)
+    return totals
+
+# smaps fields kept per mapping; everything else is skipped while parsing.
+SMAPS_FIELDS = {b'Size:': 'size', b'Rss:': 'rss', b'Pss:': 'pss', b'Shared_Dirty:': 'dirty', b'Private_Dirty:': 'dirty', b'Swap:': 'swap'}
+
+def iter_pid_smaps(pid):
+    """
+    Stream-parses /proc/<pid>/smaps and yields one tuple per mapping:
+    (address, perms, pathname, size, rss, pss, dirty, swap), sizes in bytes.
+    Only one mapping is held in memory at a time, so this stays cheap for
+    processes with hundreds of thousands of mappings.
+    """
+    with open(os.path.join(PROC_ROOT, str(pid), 'smaps'), 'rb') as f:
+        header = None
+        values = None
+        for line in f:
+            parts = line.split(None, 5)
+            if not parts:
+                continue
+            field = SMAPS_FIELDS.get(parts[0])
+            if field is not None:
+                # Field lines before the first mapping header have nothing to add to.
+                if header is not None:
+                    values[field] += int(parts[1]) * 1024
+            elif not parts[0].endswith(b':'):
+                if header is not None:
+                    yield header + (values['size'], values['rss'], values['pss'], values['dirty'], values['swap'])
+                pathname = parts[5].strip().decode(errors='replace') if len(parts) > 5 else ''
+                header = (parts[0].decode(), parts[1].decode(), pathname)
+                values = {'size': 0, 'rss': 0, 'pss': 0, 'dirty': 0, 'swap': 0}
+        if header is not None:
+            yield header + (values['size'], values['rss'], values['pss'], values['dirty'], values['swap'])
+
+CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+def read_at(dir_fd, path, size=8192):
+    """Reads up to size bytes of a file relative to an open directory fd."""
+    fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+def status_int(status, key):
+    """Extracts an integer field from raw /proc status bytes (0 if missing)."""
+    start = status.find(b'\n' + key + b':')
+    if start == -1:
+        return 0
+    end = status.find(b'\n', start + 1)
+    try:
+        return int(status[start + len(key) + 2:end if end != -1 else None])
+    except ValueError:
+        return 0
+
+def read_pid_threads(pid):
+    """
+    Reads every thread of a process from /proc/<pid>/task and returns a list of
+    (tid, name, state, cpu_ticks, last_cpu, voluntary_ctxt_switches,
+    nonvoluntary_ctxt_switches) tuples. cpu_ticks is utime+stime in clock
+    ticks (see CLK_TCK).
+
+    The task directory is opened once and each thread's stat/status are read
+    relative to it with raw os.read calls, which keeps this cheap even for
+    processes with thousands of threads.
+    """
+    threads = []
+    task_fd = os.open(os.path.join(PROC_ROOT, str(pid), 'task'), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for tid in os.listdir(task_fd):
+            try:
+                stat = read_at(task_fd, tid + '/stat')
+                status = read_at(task_fd, tid + '/status')
+            except OSError:
+                continue  # the thread exited in the meantime
+            # comm may contain spaces and parentheses, so split around the last ')'
+            rparen = stat.rfind(b')')
+            name = stat[stat.find(b'(') + 1:rparen].decode(errors='replace')
+            fields = stat[rparen + 2:].split()
+            # fields[0] is field 3 (state) of proc(5); utime/stime are 14/15, processor is 39
+            threads.append((
+                int(tid), name, fields[0].decode(), int(fields[11]) + int(fields[12]), int(fields[36]),
+                status_int(status, b'voluntary_ctxt_switches'), status_int(status, b'nonvoluntary_ctxt_switches'),
+            ))
+    finally:
+        os.close(task_fd)
+    return threads
+
+def count_pid_fds(pid):
+    """
+    Returns the number of open file descriptors of a PID. Linux 6.2+ reports
+    the count as the size of /proc/<pid>/fd, which avoids listing a huge fd
+    table; older kernels report 0 there and the directory is listed instead.
+    """
+    fd_dir = os.path.join(PROC_ROOT, str(pid), 'fd')
+    size = os.stat(fd_dir).st_size
+    return size if size > 0 else len(os.listdir(fd_dir))
+
+def read_pid_schedstat(pid):
+    """
+    Reads /proc/<pid>/schedstat and returns (cpu_time_ns, run_delay_ns,
+    timeslices): time spent on a CPU, time spent runnable but waiting on a
+    run queue, and the number of times the task was scheduled in.
+    """
+    with open(os.path.join(PROC_ROOT, str(pid), 'schedstat'), 'rb') as f:
+        cpu_time, run_delay, timeslices = f.read().split()[:3]
+    return int(cpu_time), int(run_delay), int(timeslices)
+
+def read_system_run_delay():
+    """
+    Returns the total time (ns) tasks have spent waiting on any CPU's run queue,
+    summed from the per-CPU lines of /proc/schedstat (8th field, run_delay).
+    """
+    total = 0
+    with open(os.path.join(PROC_ROOT, 'schedstat'), 'rb') as f:
+        for line in f:
+            if line.startswith(b'cpu'):
+                fields = line.split()
+                if len(fields) > 8:
+                    total += int(fields[8])
+    return total
+
+def read_pressure(resource):
+    """
+    Reads /proc/pressure/<resource> (cpu, memory or io; Linux 4.20+ with PSI)
+    and returns {'some': {...}, 'full': {...}} with avg10/avg60/avg300 as
+    percentages and total as microseconds of stall time.
+    """
+    pressure = {}
+    with open(os.path.join(PROC_ROOT, 'pressure', resource), 'rb') as f:
+        for line in f:
+            kind, *fields = line.split()
+            values = {}
+            for field in fields:
+                key, _, value = field.partition(b'=')
+                values[key.decode()] = int(value) if key == b'total' else float(value)
+            pressure[kind.decode()] = values
+    return pressure
+
+def read_pid_stat(pid):
+    """
+    Reads /proc/<pid>/stat and returns the fields used by the process table:
+    name, state, ppid, minflt, majflt, utime, stime, starttime (clock ticks)
+    and processor.
+    """
+    with open(os.path.join(PROC_ROOT, str(pid), 'stat'), 'rb') as f:
+        stat = f.read()
+    # comm may contain spaces and parentheses, so split around the last ')'
+    end_of_name = stat.rfind(b')')
+    fields = stat[end_of_name + 2:].split()
+    # fields[0] is field 3 (state) of proc(5)
+    return {
+        'name': stat[stat.find(b'(') + 1:end_of_name].decode(errors='replace'),
+        'state': fields[0].decode(),
+        'ppid': int(fields[1]),
+        'minflt': int(fields[7]),
+        'majflt': int(fields[9]),
+        'utime': int(fields[11]),
+        'stime': int(fields[12]),
+        'starttime': int(fields[19]),
+        'processor': int(fields[36]),
+    }
+
+# Length at which the kernel truncates a process's comm.
+COMM_LENGTH = 15
+
+def extend_comm(comm, cmdline):
+    """
+    Returns the full name of a process whose comm may have been truncated to
+    COMM_LENGTH characters, the way psutil's name() does: the basename of
+    argv[0] when it starts with comm. cmdline is the space-joined command line.
+    """
+    if len(comm) >= COMM_LENGTH and cmdline:
+        name = os.path.basename(cmdline.split(' ', 1)[0])
+        if name.startswith(comm):
+            return name
+    return comm
+
+def read_pid_oom_score(pid):
+    """Returns the kernel's current OOM badness score (0-1000) for a PID."""
+    with open(os.path.join(PROC_ROOT, str(pid), 'oom_score'), 'rb') as f:
+        return int(f.read())
+
+NAMESPACE_KINDS = ('pid', 'mnt', 'net')
+
+def read_pid_namespaces(pid, kinds=NAMESPACE_KINDS):
+    """
+    Returns {kind: inode} for a PID's namespaces, read from the
+    /proc/<pid>/ns/<kind> links ('pid:[4026531836]'). Two processes share a
+    namespace exactly when the inodes match. Kinds we may not read are omitted.
+    """
+    namespaces = {}
+    ns_dir = os.path.join(PROC_ROOT, str(pid), 'ns')
+    for kind in kinds:
+        try:
+            link = os.readlink(os.path.join(ns_dir, kind))
+        except OSError:
+            continue
+        namespaces[kind] = int(link[link.index('[') + 1:-1])
+    return namespaces
+
+def read_pid_cmdline(pid):
+    """Returns the command line of a PID as one string ('' for kernel threads and zombies)."""
+    with open(os.path.join(PROC_ROOT, str(pid), 'cmdline'), 'rb') as f:
+        return f.read().rstrip(b'\0').replace(b'\0', b' ').decode(errors='replace')
+
+def list_pid_tasks(pid):
+    """Returns the thread IDs of a process (per-thread attributes such as nice must be set on each)."""
+    return [int(tid) for tid in os.listdir(os.path.join(PROC_ROOT, str(pid), 'task'))]
+
+def read_pid_uid(pid):
+    """Returns the real UID of a PID (the owner of its /proc directory)."""
+    return os.stat(os.path.join(PROC_ROOT, str(pid))).st_uid
+
+def read_block_device_number(name):
+    """Returns the 'major:minor' of a whole block device from /sys/block/<name>/dev."""
+    with open(os.path.join(SYS_BLOCK_ROOT, name.replace('/', '!'), 'dev'), 'r') as f:
+        return f.read().strip()
@@ -0,0 +1,234 @@
+import os
+import re
+import time
+import psutil
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QFormLayout, QLabel, QSpinBox, QComboBox,
+    QDialogButtonBox, QMessageBox, QTableWidgetItem
+)
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtCore import Qt
+
+from cgroup_linux import (
+    find_cgroup2_root, create_transient_cgroup, move_pids_to_cgroup, write_cgroup_limits,
+    read_cgroup_limits, list_transient_cgroups, remove_cgroup_if_empty, is_cgroup_populated
+)
+from procfs_linux import list_whole_disks, read_block_device_number
+from process_data_handler import NumericTableWidgetItem
+
+MB = 1024 * 1024
+# Usage at or above this share of a limit is highlighted in the Limits tab.
+LIMIT_WARNING_SHARE = 0.9
+
+class ResourceLimitsHandler:
+    def limits_cgroup_root(self):
+        if self.cgroup_root is None:
+            self.cgroup_root = find_cgroup2_root()
+        return self.cgroup_root
+
+    def limit_selected_process(self, whole_tree):
+        pid = self.selected_pid()
+        row_data = self.process_snapshot.get(pid)
+        if row_data is None:
+            return
+        pids = self.descendant_pids(pid) if whole_tree else [pid]
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(self.lang.get('limit_resources_title', "Limit Resources"))
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel(self.lang.get('limit_resources_target', "{name} (PID {pid}): {count} process(es) will be moved to a new cgroup.").format(
+            name=row_data['name'], pid=pid, count=len(pids))))
+        form = QFormLayout()
+        unlimited = self.lang.get('limit_unlimited', "Unlimited")
+
+        def spin(maximum, suffix):
+            box = QSpinBox()
+            box.setRange(0, maximum)
+            box.setSuffix(suffix)
+            box.setSpecialValueText(unlimited)
+            return box
+
+        cpu_spin = spin(100 * (psutil.cpu_count() or 1), " %")
+        memory_high_spin = spin(2 ** 31 - 1, " MB")
+        memory_max_spin = spin(2 ** 31 - 1, " MB")
+        device_selector = QComboBox()
+        device_selector.addItem(self.lang.get('limit_no_device', "No I/O limit"), None)
+        for disk in sorted(list_whole_disks()):
+            try:
+                device_selector.addItem(disk, read_block_device_number(disk))
+            except OSError:
+                continue
+        read_spin = spin(2 ** 31 - 1, " MB/s")
+        write_spin = spin(2 ** 31 - 1, " MB/s")
+        form.addRow(self.lang.get('limit_cpu', "CPU limit (100% = one CPU):"), cpu_spin)
+        form.addRow(self.lang.get('limit_memory_high', "Memory high (throttle above):"), memory_high_spin)
+        form.addRow(self.lang.get('limit_memory_max', "Memory max (OOM above):"), memory_max_spin)
+        form.addRow(self.lang.get('limit_io_device', "I/O device:"), device_selector)
+        form.addRow(self.lang.get('limit_io_read', "Read limit:"), read_spin)
+        form.addRow(self.lang.get('limit_io_write', "Write limit:"), write_spin)
+        layout.addLayout(form)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        if dialog.exec_() != QDialog.Accepted:
+            return
+
+        # Unlimited values are left out rather than written as 'max', so a
+        # controller that couldn't be enabled only matters if it is used.
+        limits = {}
+        if cpu_spin.value():
+            limits['cpu_percent'] = cpu_spin.value()
+        if memory_high_spin.value():
+            limits['memory_high'] = memory_high_spin.value() * MB
+        if memory_max_spin.value():
+            limits['memory_max'] = memory_max_spin.value() * MB
+        if device_selector.currentData() is not None and (read_spin.value() or write_spin.value()):
+            limits['io'] = {device_selector.currentData(): (read_spin.value() * MB or None, write_spin.value() * MB or None)}
+        self.apply_resource_limits(row_data['name'], pid, pids, limits)
+
+    def show_limit_error(self, message, error):
+        """Reports a failed cgroup operation, pointing at the privileged helper when it was a permission problem."""
+        if isinstance(error, PermissionError) and not self.privileged_helper.connected:
+            message += "\n" + self.lang.get('limit_needs_helper', "Managing cgroups needs root; use \"Act as Administrator\" and try again.")
+        QMessageBox.critical(self, self.lang['title'], message)
+
+    def apply_resource_limits(self, name, pid, pids, limits):
+        """
+        Creates a transient cgroup named after the process, sets its limits,
+        then moves the processes in. Writes the desktop user isn't allowed
+        to make go through the privileged helper when it is running.
+        """
+        root = self.limits_cgroup_root()
+        helper = self.privileged_helper
+        cgroup_name = f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}-{pid}"
+        try:
+            try:
+                cgroup_path = create_transient_cgroup(cgroup_name, root)
+                write_cgroup_limits(cgroup_path, limits, root)
+            except PermissionError:
+                if not helper.connected:
+                    raise
+                cgroup_path = helper.create_limits_cgroup(cgroup_name)
+                helper.write_cgroup_limits(cgroup_path, limits)
+        except OSError as e:
+            self.show_limit_error(self.lang.get('limit_error', "Could not set up the cgroup: {e}").format(e=e), e)
+            return None
+        errors = move_pids_to_cgroup(cgroup_path, pids, root)
+        denied = [pid for pid, e in errors.items() if isinstance(e, PermissionError)]
+        if denied and helper.connected:
+            try:
+                helper_errors = helper.move_to_cgroup(cgroup_path, denied)
+            except OSError as e:
+                helper_errors = dict.fromkeys(denied, e)
+            for pid in denied:
+                del errors[pid]
+            errors.update(helper_errors)
+        if len(errors) == len(pids):
+            if not remove_cgroup_if_empty(cgroup_path, root) and helper.connected:
+                try:
+                    helper.remove_cgroups([cgroup_path])
+                except OSError:
+                    pass
+            error = next(iter(errors.values()))
+            self.show_limit_error(self.lang.get('limit_move_error', "Could not move the process into {cgroup}: {e}").format(
+                cgroup=cgroup_path, e=error), error)
+            return None
+        message = self.lang.get('limit_success', "Moved {count} process(es) into {cgroup}.").format(count=len(pids) - len(errors), cgroup=cgroup_path)
+        if errors:
+            # Typically children that exited between the snapshot and the move.
+            message += "\n" + self.lang.get('limit_partial', "{count} could not be moved.").format(count=len(errors))
+        QMessageBox.information(self, self.lang['title'], message)
+        self.update_limits_view()
+        return cgroup_path
+
+    def remove_selected_limits(self):
+        """Lifts every limit of the selected transient cgroup; the cgroup itself goes away once its processes exit."""
+        row = self.limits_table.currentRow()
+        item = self.limits_table.item(row, 0) if row != -1 else None
+        if item is None:
+            return
+        cgroup_path = item.data(Qt.UserRole)
+        root = self.limits_cgroup_root()
+        limits = read_cgroup_limits(cgroup_path, root)
+        # Only the limits that are set, as their controllers are the ones known to be enabled.
+        lifted = {key: None for key in ('cpu_percent', 'memory_high', 'memory_max') if limits[key] is not None}
+        if limits['io']:
+            lifted['io'] = {device: (None, None) for device in limits['io']}
+        try:
+            try:
+                write_cgroup_limits(cgroup_path, lifted, root)
+            except PermissionError:
+                if not self.privileged_helper.connected:
+                    raise
+                self.privileged_helper.write_cgroup_limits(cgroup_path, lifted)
+        except OSError as e:
+            self.show_limit_error(self.lang.get('limit_error', "Could not set up the cgroup: {e}").format(e=e), e)
+        self.update_limits_view()
+
+    def make_limit_items(self, usage, limit, scale):
+        """Returns the (usage, limit) items of one resource, usage highlighted when close to its limit."""
+        not_available = self.lang.get('not_available', 'N/A')
+        usage_item = NumericTableWidgetItem(f"{usage / scale:.1f}" if usage is not None else not_available, usage)
+        limit_item = NumericTableWidgetItem(f"{limit / scale:.1f}" if limit is not None else self.lang.get('limit_unlimited', "Unlimited"), limit)
+        if usage is not None and limit and usage >= limit * LIMIT_WARNING_SHARE:
+            usage_item.setBackground(QBrush(QColor(255, 200, 120)))
+        return usage_item, limit_item
+
+    def remove_empty_limit_cgroups(self):
+        """Removes the transient cgroups whose processes have all exited and returns the paths of the others."""
+        root = self.limits_cgroup_root()
+        remaining = [path for path in list_transient_cgroups(root) if not remove_cgroup_if_empty(path, root)]
+        if remaining and self.privileged_helper.connected:
+            # Empty ones we weren't allowed to remove were created through the helper.
+            empty = []
+            for path in remaining:
+                try:
+                    if not is_cgroup_populated(path, root):
+                        empty.append(path)
+                except OSError:
+                    continue
+            if empty:
+                try:
+                    removed = set(self.privileged_helper.remove_cgroups(empty))
+                except OSError:
+                    removed = set()
+                remaining = [path for path in remaining if path not in removed]
+        return remaining
+
+    def update_limits_view(self):
+        """Removes transient cgroups that emptied and, while the Limits tab is shown, shows live usage against the limits of the others."""
+        cgroup_paths = self.remove_empty_limit_cgroups()
+        if not self.limits_table.isVisible():
+            return
+        root = self.limits_cgroup_root()
+        stats = self.collect_cgroup_stats(cgroup_paths, time.monotonic(), self.limit_cgroup_prev)
+        selected = self.limits_table.currentItem()
+        selected_path = self.limits_table.item(selected.row(), 0).data(Qt.UserRole) if selected is not None else None
+
+        self.limits_table.setSortingEnabled(False)
+        self.limits_table.setRowCount(len(cgroup_paths))
+        for row, path in enumerate(cgroup_paths):
+            cpu, memory, read_rate, write_rate, pids = stats[path]
+            limits = read_cgroup_limits(path, root)
+            io_limits = list(limits['io'].values())
+            read_limit = sum(rates[0] for rates in io_limits if rates[0] is not None) or None
+            write_limit = sum(rates[1] for rates in io_limits if rates[1] is not None) or None
+            name_item = QTableWidgetItem(os.path.basename(path))
+            name_item.setData(Qt.UserRole, path)
+            name_item.setToolTip(path)
+            self.limits_table.setItem(row, 0, name_item)
+            self.limits_table.setItem(row, 1, NumericTableWidgetItem(str(pids) if pids is not None else "", pids))
+            columns = (
+                self.make_limit_items(cpu, limits['cpu_percent'], 1.0)
+                + self.make_limit_items(memory, limits['memory_high'], MB)
+                + self.make_limit_items(memory, limits['memory_max'], MB)[1:]
+                # io.max is in bytes/s, usage in KB/s
+                + self.make_limit_items(read_rate, read_limit / 1024 if read_limit else None, 1.0)
+                + self.make_limit_items(write_rate, write_limit / 1024 if write_limit else None, 1.0)
+            )
+            for column, item in enumerate(columns, start=2):
+                self.limits_table.setItem(row, column, item)
+            if path == selected_path:
+                self.limits_table.selectRow(row)
+        self.limits_table.setSortingEnabled(True)
@@ -0,0 +1,82 @@
+import time
+import threading
+
+from procfs_linux import read_pid_smaps_rollup
+
+class SmapsRollupScanner(threading.Thread):
+    """
+    Background thread that reads /proc/<pid>/smaps_rollup for PSS and USS.
+
+    The UI hands it a priority-ordered list of PIDs (visible rows first, then
+    the biggest processes) with request(). PIDs are re-read once their cached
+    result is older than refresh_age, and reads are spaced so the scanner never
+    does more than max_reads_per_sec of them. Subclasses scan other per-PID
+    files by overriding sample().
+    """
+    def __init__(self, max_reads_per_sec=100, refresh_age=10.0):
+        super().__init__(daemon=True)
+        self.read_interval = 1.0 / max_reads_per_sec
+        self.refresh_age = refresh_age
+        self.results = {}  # pid -> (sample_time, sample())
+        self.unreadable = set()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+
+    def request(self, pids):
+        """Replaces the scan queue with pids, highest priority first."""
+        with self._lock:
+            self._pending = list(pids)
+        self._wakeup.set()
+
+    def get(self, pid):
+        """Returns (pss, uss, age_seconds) for pid, or None if not scanned yet."""
+        entry = self.results.get(pid)
+        if entry is None:
+            return None
+        sample_time, (pss, uss) = entry
+        return pss, uss, time.monotonic() - sample_time
+
+    def prune(self, live_pids):
+        """Drops cached results for processes that no longer exist."""
+        with self._lock:
+            for pid in [pid for pid in self.results if pid not in live_pids]:
+                del self.results[pid]
+            self.unreadable &= live_pids
+
+    def sample(self, pid):
+        """Reads one PID; raises OSError like the procfs readers."""
+        rollup = read_pid_smaps_rollup(pid)
+        return rollup.get('Pss', 0), rollup.get('Private_Clean', 0) + rollup.get('Private_Dirty', 0)
+
+    def stop(self):
+        self._stop_event.set()
+        self._wakeup.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._wakeup.wait(1.0)
+            self._wakeup.clear()
+            with self._lock:
+                pending = self._pending
+            for pid in pending:
+                if self._stop_event.is_set() or self._wakeup.is_set():
+                    # New priorities arrived; start over with the fresh queue.
+                    break
+                if pid in self.unreadable:
+                    continue
+                entry = self.results.get(pid)
+                if entry is not None and time.monotonic() - entry[0] < self.refresh_age:
+                    continue
+                try:
+                    value = self.sample(pid)
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    with self._lock:
+                        self.unreadable.add(pid)
+                    continue
+                with self._lock:
+                    self.results[pid] = (time.monotonic(), value)
+                time.sleep(self.read_interval)
@@ -0,0 +1,142 @@
+import numpy as np
+
+# Numeric columns summed per group by group_totals().
+TOTAL_COLUMNS = ('cpu', 'rss', 'read', 'write')
+# An interner is compacted once it holds more than this many labels and more
+# than twice as many as the current snapshot uses.
+COMPACT_MIN_LABELS = 1024
+
+class KeyInterner:
+    """
+    Assigns small integer codes to string keys (user names, executable
+    paths) so they can be grouped with np.bincount instead of Python dicts.
+    Codes are stable between compactions; ColumnBuilder.finish() compacts an
+    interner whose keys mostly belong to processes that are gone, so
+    labels[code] is valid for the columns built alongside it. Anything
+    keeping codes across snapshots should keep the key instead.
+    """
+    def __init__(self):
+        self.codes = {}
+        self.labels = []
+
+    def code(self, key):
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.labels)
+            self.labels.append(key)
+        return code
+
+    def compact(self, column):
+        """
+        Re-codes the interner from the keys used in a code column when it has
+        outgrown them, forgetting the rest. Returns the column with the new
+        codes (the same array if nothing changed).
+        """
+        if len(self.labels) <= COMPACT_MIN_LABELS:
+            return column
+        used = np.bincount(column, minlength=len(self.labels)) > 0
+        live = np.flatnonzero(used)
+        if len(self.labels) <= 2 * len(live):
+            return column
+        recode = np.cumsum(used) - 1
+        self.labels = [self.labels[code] for code in live.tolist()]
+        self.codes = {key: code for code, key in enumerate(self.labels)}
+        return recode[column].astype(column.dtype)
+
+# Columns of a snapshot, in the order ColumnBuilder.add() takes them, and
+# the ones that aren't float64 (missing float values are passed as NaN).
+COLUMN_NAMES = ('pid', 'create_time', 'cpu', 'mem', 'rss', 'swap', 'threads', 'read', 'write', 'user', 'exe', 'name')
+COLUMN_TYPES = {'pid': np.int64}
+CODE_COLUMNS = ('user', 'exe', 'name')
+
+class ColumnBuilder:
+    """
+    Builds the numpy columns of a process snapshot from the collector's own
+    loop: add() (a bound list.append) records one tuple per process in
+    COLUMN_NAMES order, and finish() transposes them once into columns, row
+    i of every column describing the same process. The 'user', 'exe' and
+    'name' values are keys that finish() turns into codes from the matching
+    KeyInterner. This avoids walking the snapshot's row dicts once per
+    column, which cost tens of milliseconds per tick at 20k processes.
+    """
+    def __init__(self, interners):
+        self.interners = interners
+        self.rows = []
+        self.add = self.rows.append
+
+    def finish(self):
+        """Returns the columns of the processes added so far, compacting interners that outgrew them."""
+        count = len(self.rows)
+        values = list(zip(*self.rows)) or [()] * len(COLUMN_NAMES)
+        columns = {}
+        for name, column in zip(COLUMN_NAMES, values):
+            if name in CODE_COLUMNS:
+                interner = self.interners[name]
+                codes = list(map(interner.codes.get, column))
+                if None in codes:
+                    codes = [code if code is not None else interner.code(key) for code, key in zip(codes, column)]
+                columns[name] = interner.compact(np.fromiter(codes, np.int32, count))
+            else:
+                columns[name] = np.fromiter(column, COLUMN_TYPES.get(name, np.float64), count)
+        return columns
+
+def group_totals(codes, columns, minlength=0):
+    """
+    Sums TOTAL_COLUMNS per group code with np.bincount (NaN counts as 0).
+    Returns {'count': ..., 'cpu': ..., ...}, each an array indexed by code.
+    """
+    totals = {'count': np.bincount(codes, minlength=minlength)}
+    for name in TOTAL_COLUMNS:
+        totals[name] = np.bincount(codes, weights=np.nan_to_num(columns[name]), minlength=minlength)
+    return totals
+
+class SlotAllocator:
+    """
+    Gives every process, identified by (pid, create_time), a stable row in a
+    set of numpy arrays of per-process state, so detectors can update all
+    processes with array operations. Rows of processes that are gone are
+    reused; assign() reports which rows are new so callers can reset them.
+    The key -> row mapping is itself kept as arrays sorted by PID and
+    matched with np.searchsorted, so assigning 20k processes costs about a
+    millisecond per tick.
+    """
+    def __init__(self, fields):
+        self.arrays = {name: np.zeros(0, dtype) for name, dtype in fields.items()}
+        self.key_pids = np.zeros(0, np.int64)
+        self.key_starts = np.zeros(0, np.float64)
+        self.key_rows = np.zeros(0, np.int64)
+        self.free_rows = np.zeros(0, np.int64)
+        self.capacity = 0
+
+    def grow(self, needed):
+        capacity = max(needed, self.capacity * 2, 256)
+        for name, array in self.arrays.items():
+            self.arrays[name] = np.resize(array, capacity)
+        self.free_rows = np.concatenate([self.free_rows, np.arange(self.capacity, capacity)])
+        self.capacity = capacity
+
+    def assign(self, pids, create_times):
+        """Returns (rows, is_new) for the given processes, freeing the rows of processes not among them."""
+        found = np.zeros(len(pids), bool)
+        rows = np.zeros(len(pids), np.int64)
+        if len(self.key_pids):
+            index = np.minimum(np.searchsorted(self.key_pids, pids), len(self.key_pids) - 1)
+            found = (self.key_pids[index] == pids) & (self.key_starts[index] == create_times)
+            rows[found] = self.key_rows[index[found]]
+            kept = np.zeros(len(self.key_pids), bool)
+            kept[index[found]] = True
+            self.free_rows = np.concatenate([self.free_rows, self.key_rows[~kept]])
+
+        is_new = ~found
+        new_count = int(is_new.sum())
+        if new_count > len(self.free_rows):
+            self.grow(self.capacity + new_count - len(self.free_rows))
+        if new_count:
+            rows[is_new] = self.free_rows[-new_count:]
+            self.free_rows = self.free_rows[:-new_count]
+
+        order = np.argsort(pids, kind='stable')
+        self.key_pids = pids[order]
+        self.key_starts = create_times[order]
+        self.key_rows = rows[order]
+        return rows, is_new
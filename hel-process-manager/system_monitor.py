@@ -1,6 +1,8 @@
 import psutil
 from datetime import datetime
 
+from numa_linux import read_node_meminfo, format_cpu_list
+
 class SystemMonitor:
     def update_system_info(self):
         boot = datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S')
@@ -16,6 +18,8 @@ class SystemMonitor:
             mount_point='/', disk_percent=disk_usage.percent
         )
 
+        info += self.format_numa_nodes()
+
         gpu_info_text = self.lang.get('gpu_info_header', "\nGPU Information:\n")
         try:
             gpu_info_text += self.lang.get('gpu_info_not_supported', "GPU monitoring not directly supported by psutil on this OS.\n")
@@ -55,6 +59,23 @@ class SystemMonitor:
             disk_details += self.lang.get('disk_details_error', "Error retrieving disk partitions: {error}\n").format(error=e)
         self.disk_info.setPlainText(disk_details)
 
+    def format_numa_nodes(self):
+        """Per-node memory from sysfs, so memory piling up on one node is visible."""
+        nodes = read_node_meminfo()
+        if not nodes:
+            return ""
+        cpus = {}
+        for cpu, node in self.cpu_nodes.items():
+            cpus.setdefault(node, []).append(cpu)
+        text = self.lang.get('numa_nodes_header', "\nNUMA Nodes:\n")
+        for node, fields in sorted(nodes.items()):
+            total = fields.get('MemTotal', 0)
+            used = fields.get('MemUsed', total - fields.get('MemFree', 0))
+            text += self.lang.get('numa_node_format', "  Node {node} (CPUs {cpus}): Used {used_gb:.2f} GB / {total_gb:.2f} GB, Free {free_gb:.2f} GB\n").format(
+                node=node, cpus=format_cpu_list(cpus.get(node, [])) or '-', used_gb=used / (1024**3),
+                total_gb=total / (1024**3), free_gb=fields.get('MemFree', 0) / (1024**3))
+        return text
+
     def update_status_bar(self):
         cpu = psutil.cpu_percent()
         ram = psutil.virtual_memory().percent
@@ -0,0 +1,69 @@
+import time
+from PyQt5.QtWidgets import QTableWidgetItem
+
+from procfs_linux import read_pid_threads, CLK_TCK
+from process_data_handler import NumericTableWidgetItem
+
+class ThreadViewHandler:
+    def toggle_thread_view(self, checked):
+        self.thread_label.setVisible(checked)
+        self.thread_table.setVisible(checked)
+        self.update_thread_toggle_text()
+        if checked:
+            self.thread_view_pid = self.selected_pid()
+            self.thread_prev = {}
+            self.update_thread_view()
+
+    def update_thread_toggle_text(self):
+        if self.threads_toggle_btn.isChecked():
+            self.threads_toggle_btn.setText(self.lang.get('hide_threads', "Hide Threads"))
+        else:
+            self.threads_toggle_btn.setText(self.lang.get('show_threads', "Show Threads"))
+
+    def on_process_selection_changed(self):
+        # The table is rebuilt on every refresh, which clears the selection;
+        # only follow selections that actually point at a process.
+        pid = self.selected_pid()
+        if pid is None or pid == self.thread_view_pid:
+            return
+        self.thread_view_pid = pid
+        self.thread_prev = {}
+        if self.thread_table.isVisible():
+            self.update_thread_view()
+
+    def update_thread_view(self):
+        """Samples the threads of the selected process. Does nothing while the view is hidden."""
+        if not self.thread_table.isVisible():
+            return
+        pid = self.thread_view_pid
+        if pid is None:
+            self.thread_label.setText(self.lang.get('threads_select_process', "Select a process to see its threads."))
+            self.thread_table.setRowCount(0)
+            return
+        try:
+            threads = read_pid_threads(pid)
+        except OSError as e:
+            self.thread_label.setText(self.lang.get('threads_error', "Could not read threads of PID {pid}: {e}").format(pid=pid, e=e))
+            self.thread_table.setRowCount(0)
+            return
+
+        now = time.monotonic()
+        prev_time, prev_ticks = self.thread_prev.get('time'), self.thread_prev.get('ticks', {})
+        elapsed = now - prev_time if prev_time is not None else None
+        self.thread_prev = {'time': now, 'ticks': {t[0]: t[3] for t in threads}}
+
+        self.thread_label.setText(self.lang.get('threads_header', "Threads of PID {pid} ({count})").format(pid=pid, count=len(threads)))
+        self.thread_table.setSortingEnabled(False)
+        self.thread_table.setRowCount(len(threads))
+        for row, (tid, name, state, ticks, last_cpu, voluntary, involuntary) in enumerate(threads):
+            cpu_percent = None
+            if elapsed and tid in prev_ticks:
+                cpu_percent = max(ticks - prev_ticks[tid], 0) / CLK_TCK / elapsed * 100
+            self.thread_table.setItem(row, 0, NumericTableWidgetItem(str(tid), tid))
+            self.thread_table.setItem(row, 1, QTableWidgetItem(name))
+            self.thread_table.setItem(row, 2, QTableWidgetItem(state))
+            self.thread_table.setItem(row, 3, NumericTableWidgetItem(f"{cpu_percent:.1f}" if cpu_percent is not None else self.lang.get('not_available', 'N/A'), cpu_percent))
+            self.thread_table.setItem(row, 4, NumericTableWidgetItem(str(voluntary), voluntary))
+            self.thread_table.setItem(row, 5, NumericTableWidgetItem(str(involuntary), involuntary))
+            self.thread_table.setItem(row, 6, NumericTableWidgetItem(str(last_cpu), last_cpu))
+        self.thread_table.setSortingEnabled(True)
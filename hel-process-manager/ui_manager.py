@@ -1,11 +1,19 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
     QLineEdit, QComboBox, QMessageBox, QTabWidget, QTextEdit, QInputDialog,
-    QMenu, QAction, QHeaderView, QListWidget, QDialog, QCheckBox, QGridLayout
+    QMenu, QAction, QHeaderView, QListWidget, QDialog, QCheckBox, QGridLayout,
+    QTreeWidget, QDoubleSpinBox, QSpinBox
 )
 from PyQt5.QtCore import Qt
 import pyqtgraph as pg
 
+from graph_handler import DISK_DEVICE_METRICS
+from group_view_handler import GROUP_MODES
+from cpu_leaderboard import LEADERBOARD_WINDOWS
+from anomaly_detector import DEFAULT_ANOMALY_WINDOW, DEFAULT_Z_THRESHOLD
+from bulk_actions import DEFAULT_GRACE_PERIOD
+from pattern_actions_handler import PATTERN_ACTIONS, PATTERN_SIGNALS
+
 class UIManager:
     def init_ui(self):
         self.layout = QVBoxLayout(self)
@@ -30,7 +38,7 @@ class UIManager:
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText(self.lang['search'])
-        self.search_bar.textChanged.connect(self.update_processes)
+        self.search_bar.textChanged.connect(self.render_process_table)
         top_layout.addWidget(self.search_bar)
         self.layout.addLayout(top_layout)
 
@@ -48,6 +56,7 @@ class UIManager:
         self.ram_plot = self.graph_widget.addPlot()
         self.ram_curve = self.ram_plot.plot(pen='c')
         self.ram_data = []
+        self.system_sample = {}
 
         self.graph_widget.nextRow()
         self.disk_read_plot = self.graph_widget.addPlot()
@@ -59,29 +68,108 @@ class UIManager:
         self.disk_write_curve = self.disk_write_plot.plot(pen='w')
         self.disk_write_data = []
 
+        self.graph_widget.nextRow()
+        self.run_delay_plot = self.graph_widget.addPlot()
+        self.run_delay_curve = self.run_delay_plot.plot(pen='g')
+        self.run_delay_data = []
+
+        # Per-device disk series, in a second column next to the aggregate graphs
+        self.disk_device_plots = {}
+        self.disk_device_curves = {}
+        self.disk_device_data = {}
+        for row, metric in enumerate(DISK_DEVICE_METRICS):
+            plot = self.graph_widget.addPlot(row=row, col=1)
+            plot.addLegend(offset=(5, 5))
+            self.disk_device_plots[metric] = plot
+            self.disk_device_curves[metric] = {}
+
         self.tabs.addTab(self.graph_widget, self.lang['tab_performance'])
 
         # --- Processes Tab ---
         self.process_tab = QWidget()
         self.process_layout = QVBoxLayout(self.process_tab)
+
+        group_layout = QHBoxLayout()
+        self.group_by_label = QLabel(self.lang.get('group_by', "Group by:"))
+        group_layout.addWidget(self.group_by_label)
+        self.group_mode_selector = QComboBox()
+        for mode, key, default in GROUP_MODES:
+            self.group_mode_selector.addItem(self.lang.get(key, default), mode)
+        self.group_mode_selector.currentIndexChanged.connect(self.change_group_mode)
+        group_layout.addWidget(self.group_mode_selector)
+        group_layout.addStretch(1)
+        self.anomaly_label = QLabel(self.lang.get('anomaly_threshold', "Highlight anomalies above z-score:"))
+        group_layout.addWidget(self.anomaly_label)
+        self.anomaly_threshold_spin = QDoubleSpinBox()
+        self.anomaly_threshold_spin.setRange(0.0, 50.0)
+        self.anomaly_threshold_spin.setSingleStep(0.5)
+        self.anomaly_threshold_spin.setSpecialValueText(self.lang.get('anomaly_off', "Off"))
+        self.anomaly_threshold_spin.setValue(DEFAULT_Z_THRESHOLD)
+        self.anomaly_threshold_spin.valueChanged.connect(self.change_anomaly_threshold)
+        group_layout.addWidget(self.anomaly_threshold_spin)
+        self.anomaly_window_label = QLabel(self.lang.get('anomaly_window', "over the last:"))
+        group_layout.addWidget(self.anomaly_window_label)
+        self.anomaly_window_spin = QSpinBox()
+        self.anomaly_window_spin.setRange(30, 3600)
+        self.anomaly_window_spin.setSingleStep(30)
+        self.anomaly_window_spin.setSuffix(" s")
+        self.anomaly_window_spin.setValue(DEFAULT_ANOMALY_WINDOW)
+        self.anomaly_window_spin.valueChanged.connect(self.change_anomaly_window)
+        group_layout.addWidget(self.anomaly_window_spin)
+        self.process_layout.addLayout(group_layout)
+
         self.table = QTableWidget()
-        self.table.setColumnCount(10)
+        self.table.setColumnCount(31)
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionMode(QTableWidget.ExtendedSelection)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.table.horizontalHeader().sectionClicked.connect(self.sort_processes_table)
-        self.process_layout.addWidget(self.table)
+        self.table.itemSelectionChanged.connect(self.on_process_selection_changed)
+        self.table.itemSelectionChanged.connect(self.on_inspect_selection_changed)
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(lambda position: self.show_process_context_menu(self.table, position))
+        self.process_layout.addWidget(self.table, 3)
+
+        # Grouped view (services, later containers/users); replaces the table while a grouping is selected
+        self.group_tree = QTreeWidget()
+        self.group_tree.setColumnCount(7)
+        self.group_tree.setSelectionMode(QTreeWidget.ExtendedSelection)
+        self.group_tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.group_tree.itemExpanded.connect(self.remember_group_expanded)
+        self.group_tree.itemCollapsed.connect(self.remember_group_expanded)
+        self.group_tree.itemSelectionChanged.connect(self.on_process_selection_changed)
+        self.group_tree.itemSelectionChanged.connect(self.on_inspect_selection_changed)
+        self.group_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.group_tree.customContextMenuRequested.connect(lambda position: self.show_process_context_menu(self.group_tree, position))
+        self.group_tree.setVisible(False)
+        self.process_layout.addWidget(self.group_tree, 3)
+
+        # Per-thread view of the selected process, hidden until expanded
+        self.thread_label = QLabel("")
+        self.thread_label.setVisible(False)
+        self.process_layout.addWidget(self.thread_label)
+        self.thread_table = QTableWidget()
+        self.thread_table.setColumnCount(7)
+        self.thread_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.thread_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.thread_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.thread_table.setVisible(False)
+        self.process_layout.addWidget(self.thread_table, 2)
 
         btns_layout = QHBoxLayout()
         self.refresh_btn = QPushButton(self.lang['refresh'])
         self.refresh_btn.clicked.connect(self.update_processes)
         btns_layout.addWidget(self.refresh_btn)
 
-        self.kill_btn = QPushButton(self.lang['kill'])
+        self.kill_btn = QPushButton(self.lang.get('graceful_stop', "End Process"))
         self.kill_btn.clicked.connect(self.kill_selected_process)
         btns_layout.addWidget(self.kill_btn)
 
+        self.kill_tree_btn = QPushButton(self.lang.get('kill_tree', "Kill Process Tree"))
+        self.kill_tree_btn.clicked.connect(self.kill_selected_trees)
+        btns_layout.addWidget(self.kill_tree_btn)
+
         self.renice_btn = QPushButton(self.lang.get('renice', "Renice"))
         self.renice_btn.clicked.connect(self.renice_process)
         btns_layout.addWidget(self.renice_btn)
@@ -90,6 +178,15 @@ class UIManager:
         self.inspect_btn.clicked.connect(self.inspect_process)
         btns_layout.addWidget(self.inspect_btn)
 
+        self.memory_map_btn = QPushButton(self.lang.get('memory_map', "Memory Map"))
+        self.memory_map_btn.clicked.connect(self.inspect_memory_map)
+        btns_layout.addWidget(self.memory_map_btn)
+
+        self.threads_toggle_btn = QPushButton(self.lang.get('show_threads', "Show Threads"))
+        self.threads_toggle_btn.setCheckable(True)
+        self.threads_toggle_btn.toggled.connect(self.toggle_thread_view)
+        btns_layout.addWidget(self.threads_toggle_btn)
+
         self.suspend_btn = QPushButton(self.lang.get('suspend_process', "Suspend"))
         self.suspend_btn.clicked.connect(self.suspend_selected_process)
         btns_layout.addWidget(self.suspend_btn)
@@ -111,6 +208,22 @@ class UIManager:
         btns_layout.addWidget(self.open_file_location_btn)
 
         self.process_layout.addLayout(btns_layout)
+        # Grace period of End Process, and the progress and outcome of bulk
+        # actions (per-PID results are listed in the label's tooltip)
+        status_layout = QHBoxLayout()
+        self.grace_period_label = QLabel(self.lang.get('grace_period', "SIGKILL after:"))
+        status_layout.addWidget(self.grace_period_label)
+        self.grace_period_spin = QSpinBox()
+        self.grace_period_spin.setRange(0, 600)
+        self.grace_period_spin.setValue(DEFAULT_GRACE_PERIOD)
+        self.grace_period_spin.setSuffix(" s")
+        status_layout.addWidget(self.grace_period_spin)
+        self.bulk_status_label = QLabel("")
+        status_layout.addWidget(self.bulk_status_label, 1)
+        self.helper_btn = QPushButton()
+        self.helper_btn.clicked.connect(self.toggle_privileged_helper)
+        status_layout.addWidget(self.helper_btn)
+        self.process_layout.addLayout(status_layout)
         self.tabs.addTab(self.process_tab, self.lang['tab_processes'])
 
         # --- System Info Tab ---
@@ -173,6 +286,168 @@ class UIManager:
         self.startup_layout.addLayout(startup_btns_layout)
         self.tabs.addTab(self.startup_tab, self.lang.get('tab_startup_programs', "Startup Programs"))
 
+        # --- Recently Exited Tab ---
+        self.lifecycle_tab = QWidget()
+        self.lifecycle_layout = QVBoxLayout(self.lifecycle_tab)
+        self.lifecycle_source_label = QLabel()
+        self.lifecycle_layout.addWidget(self.lifecycle_source_label)
+        self.lifecycle_table = QTableWidget()
+        self.lifecycle_table.setColumnCount(8)
+        self.lifecycle_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.lifecycle_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.lifecycle_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.lifecycle_table.horizontalHeader().setStretchLastSection(True)
+        self.lifecycle_layout.addWidget(self.lifecycle_table)
+        self.tabs.addTab(self.lifecycle_tab, self.lang.get('tab_recently_exited', "Recently Exited"))
+
+        # --- CPU Time Leaderboard Tab ---
+        self.leaderboard_tab = QWidget()
+        self.leaderboard_layout = QVBoxLayout(self.leaderboard_tab)
+        leaderboard_controls = QHBoxLayout()
+        self.leaderboard_window_label = QLabel(self.lang.get('leaderboard_window', "Rank by CPU time over:"))
+        leaderboard_controls.addWidget(self.leaderboard_window_label)
+        self.leaderboard_window_selector = QComboBox()
+        for window in LEADERBOARD_WINDOWS:
+            self.leaderboard_window_selector.addItem(self.lang.get('leaderboard_minutes', "{minutes} minutes").format(minutes=window // 60), window)
+        self.leaderboard_window_selector.currentIndexChanged.connect(lambda: self.render_cpu_leaderboard())
+        leaderboard_controls.addWidget(self.leaderboard_window_selector)
+        self.leaderboard_by_name = QCheckBox(self.lang.get('leaderboard_by_name', "Combine processes with the same name"))
+        self.leaderboard_by_name.toggled.connect(lambda: self.render_cpu_leaderboard())
+        leaderboard_controls.addWidget(self.leaderboard_by_name)
+        leaderboard_controls.addStretch(1)
+        self.leaderboard_layout.addLayout(leaderboard_controls)
+        self.leaderboard_table = QTableWidget()
+        self.leaderboard_table.setColumnCount(7)
+        self.leaderboard_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.leaderboard_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.leaderboard_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.leaderboard_layout.addWidget(self.leaderboard_table)
+        self.tabs.addTab(self.leaderboard_tab, self.lang.get('tab_cpu_leaderboard', "CPU Time"))
+
+        # --- Alerts Tab ---
+        self.alerts_tab = QWidget()
+        self.alerts_layout = QVBoxLayout(self.alerts_tab)
+        self.alert_rules_editor = QTextEdit()
+        self.alert_rules_editor.setAcceptRichText(False)
+        self.alert_rules_editor.setFontFamily("monospace")
+        self.alerts_layout.addWidget(self.alert_rules_editor, 1)
+        alert_controls = QHBoxLayout()
+        self.apply_alert_rules_btn = QPushButton(self.lang.get('apply_alert_rules', "Apply Rules"))
+        self.apply_alert_rules_btn.clicked.connect(self.apply_alert_rules)
+        alert_controls.addWidget(self.apply_alert_rules_btn)
+        self.alert_status_label = QLabel()
+        alert_controls.addWidget(self.alert_status_label, 1)
+        self.alerts_layout.addLayout(alert_controls)
+        self.alert_log_table = QTableWidget()
+        self.alert_log_table.setColumnCount(5)
+        self.alert_log_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.alert_log_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.alert_log_table.horizontalHeader().setStretchLastSection(True)
+        self.alerts_layout.addWidget(self.alert_log_table, 1)
+        self.tabs.addTab(self.alerts_tab, self.lang.get('tab_alerts', "Alerts"))
+
+        # --- Policies Tab ---
+        self.policies_tab = QWidget()
+        self.policies_layout = QVBoxLayout(self.policies_tab)
+        self.policy_editor = QTextEdit()
+        self.policy_editor.setAcceptRichText(False)
+        self.policy_editor.setFontFamily("monospace")
+        self.policies_layout.addWidget(self.policy_editor, 1)
+        policy_controls = QHBoxLayout()
+        self.apply_policies_btn = QPushButton(self.lang.get('apply_policies', "Apply Policies"))
+        self.apply_policies_btn.clicked.connect(self.apply_policies)
+        policy_controls.addWidget(self.apply_policies_btn)
+        self.policy_status_label = QLabel()
+        policy_controls.addWidget(self.policy_status_label, 1)
+        self.policies_layout.addLayout(policy_controls)
+        self.policy_log_table = QTableWidget()
+        self.policy_log_table.setColumnCount(5)
+        self.policy_log_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.policy_log_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.policy_log_table.horizontalHeader().setStretchLastSection(True)
+        self.policies_layout.addWidget(self.policy_log_table, 1)
+        self.tabs.addTab(self.policies_tab, self.lang.get('tab_policies', "Policies"))
+
+        # --- Resource Limits Tab ---
+        self.limits_tab = QWidget()
+        self.limits_layout = QVBoxLayout(self.limits_tab)
+        self.limits_hint_label = QLabel()
+        self.limits_hint_label.setWordWrap(True)
+        self.limits_layout.addWidget(self.limits_hint_label)
+        self.limits_table = QTableWidget()
+        self.limits_table.setColumnCount(11)
+        self.limits_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.limits_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.limits_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.limits_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.limits_layout.addWidget(self.limits_table, 1)
+        limits_controls = QHBoxLayout()
+        self.remove_limits_btn = QPushButton(self.lang.get('remove_limits', "Remove Limits"))
+        self.remove_limits_btn.clicked.connect(self.remove_selected_limits)
+        limits_controls.addWidget(self.remove_limits_btn)
+        limits_controls.addStretch(1)
+        self.limits_layout.addLayout(limits_controls)
+        self.tabs.addTab(self.limits_tab, self.lang.get('tab_limits', "Limits"))
+
+        # --- Pattern Actions Tab (pgrep/pkill over the current snapshot) ---
+        self.pattern_tab = QWidget()
+        self.pattern_layout = QVBoxLayout(self.pattern_tab)
+        pattern_form = QGridLayout()
+        self.pattern_label = QLabel()
+        pattern_form.addWidget(self.pattern_label, 0, 0)
+        self.pattern_edit = QLineEdit()
+        self.pattern_edit.setPlaceholderText("chrome.*--type=renderer")
+        pattern_form.addWidget(self.pattern_edit, 0, 1)
+        self.pattern_full_cmdline = QCheckBox()
+        pattern_form.addWidget(self.pattern_full_cmdline, 0, 2)
+        self.pattern_user_label = QLabel()
+        pattern_form.addWidget(self.pattern_user_label, 1, 0)
+        self.pattern_user_edit = QLineEdit()
+        pattern_form.addWidget(self.pattern_user_edit, 1, 1, 1, 2)
+        self.pattern_condition_label = QLabel()
+        pattern_form.addWidget(self.pattern_condition_label, 2, 0)
+        self.pattern_condition_edit = QLineEdit()
+        self.pattern_condition_edit.setPlaceholderText("cpu > 50 and rss > 1G")
+        pattern_form.addWidget(self.pattern_condition_edit, 2, 1, 1, 2)
+        self.pattern_layout.addLayout(pattern_form)
+        for edit in (self.pattern_edit, self.pattern_user_edit, self.pattern_condition_edit):
+            edit.textChanged.connect(self.update_pattern_preview)
+        self.pattern_full_cmdline.toggled.connect(self.update_pattern_preview)
+        self.pattern_summary_label = QLabel()
+        self.pattern_layout.addWidget(self.pattern_summary_label)
+        self.pattern_table = QTableWidget()
+        self.pattern_table.setColumnCount(6)
+        self.pattern_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.pattern_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.pattern_table.horizontalHeader().setStretchLastSection(True)
+        self.pattern_layout.addWidget(self.pattern_table, 1)
+        pattern_controls = QHBoxLayout()
+        self.pattern_preview_btn = QPushButton()
+        self.pattern_preview_btn.clicked.connect(self.update_pattern_preview)
+        pattern_controls.addWidget(self.pattern_preview_btn)
+        self.pattern_action_selector = QComboBox()
+        for action, key, default in PATTERN_ACTIONS:
+            self.pattern_action_selector.addItem(self.lang.get(key, default), action)
+        self.pattern_action_selector.currentIndexChanged.connect(self.change_pattern_action)
+        pattern_controls.addWidget(self.pattern_action_selector)
+        self.pattern_signal_selector = QComboBox()
+        self.pattern_signal_selector.addItems(PATTERN_SIGNALS)
+        pattern_controls.addWidget(self.pattern_signal_selector)
+        self.pattern_nice_spin = QSpinBox()
+        self.pattern_nice_spin.setRange(-20, 19)
+        pattern_controls.addWidget(self.pattern_nice_spin)
+        self.pattern_affinity_edit = QLineEdit()
+        self.pattern_affinity_edit.setPlaceholderText("0-3,8")
+        pattern_controls.addWidget(self.pattern_affinity_edit)
+        self.pattern_apply_btn = QPushButton()
+        self.pattern_apply_btn.clicked.connect(self.apply_pattern_action)
+        pattern_controls.addWidget(self.pattern_apply_btn)
+        self.pattern_status_label = QLabel("")
+        pattern_controls.addWidget(self.pattern_status_label, 1)
+        self.pattern_layout.addLayout(pattern_controls)
+        self.change_pattern_action()
+        self.tabs.addTab(self.pattern_tab, self.lang.get('tab_pattern_actions', "Pattern Actions"))
+
         # --- About Tab ---
         self.about_tab = QWidget()
         self.about_layout = QVBoxLayout(self.about_tab)
@@ -190,8 +465,13 @@ class UIManager:
         self.setWindowTitle(self.lang['title'])
         self.search_bar.setPlaceholderText(self.lang['search'])
         self.refresh_btn.setText(self.lang['refresh'])
-        self.kill_btn.setText(self.lang['kill'])
+        self.kill_btn.setText(self.lang.get('graceful_stop', "End Process"))
+        self.kill_tree_btn.setText(self.lang.get('kill_tree', "Kill Process Tree"))
+        self.grace_period_label.setText(self.lang.get('grace_period', "SIGKILL after:"))
+        self.update_helper_status()
         self.inspect_btn.setText(self.lang.get('inspect', "Inspect"))
+        self.memory_map_btn.setText(self.lang.get('memory_map', "Memory Map"))
+        self.update_thread_toggle_text()
         self.renice_btn.setText(self.lang.get('renice', "Renice"))
         self.suspend_btn.setText(self.lang.get('suspend_process', "Suspend"))
         self.resume_btn.setText(self.lang.get('resume_process', "Resume"))
@@ -200,6 +480,14 @@ class UIManager:
         self.open_file_location_btn.setText(self.lang.get('open_file_location', "Open File Location"))
 
         self.table.setHorizontalHeaderLabels(self.lang['columns_process_table'])
+        self.group_by_label.setText(self.lang.get('group_by', "Group by:"))
+        self.anomaly_label.setText(self.lang.get('anomaly_threshold', "Highlight anomalies above z-score:"))
+        self.anomaly_threshold_spin.setSpecialValueText(self.lang.get('anomaly_off', "Off"))
+        self.anomaly_window_label.setText(self.lang.get('anomaly_window', "over the last:"))
+        for index, (mode, key, default) in enumerate(GROUP_MODES):
+            self.group_mode_selector.setItemText(index, self.lang.get(key, default))
+        self.group_tree.setHeaderLabels(self.lang.get('columns_group_tree', ["Group / Process", "PID", "Processes", "CPU %", "Memory MB", "Read KB/s", "Write KB/s"]))
+        self.thread_table.setHorizontalHeaderLabels(self.lang.get('columns_thread_table', ["TID", "Name", "State", "CPU %", "Voluntary Switches", "Involuntary Switches", "Last CPU"]))
 
         self.tabs.setTabText(0, self.lang['tab_performance'])
         self.tabs.setTabText(1, self.lang['tab_processes'])
@@ -207,12 +495,47 @@ class UIManager:
         self.tabs.setTabText(3, self.lang['tab_network_sensors'])
         self.tabs.setTabText(4, self.lang['tab_network_monitor'])
         self.tabs.setTabText(5, self.lang.get('tab_startup_programs', "Startup Programs"))
-        self.tabs.setTabText(6, self.lang['tab_about'])
+        self.tabs.setTabText(6, self.lang.get('tab_recently_exited', "Recently Exited"))
+        self.tabs.setTabText(7, self.lang.get('tab_cpu_leaderboard', "CPU Time"))
+        self.tabs.setTabText(8, self.lang.get('tab_alerts', "Alerts"))
+        self.tabs.setTabText(9, self.lang.get('tab_policies', "Policies"))
+        self.tabs.setTabText(10, self.lang.get('tab_limits', "Limits"))
+        self.tabs.setTabText(11, self.lang.get('tab_pattern_actions', "Pattern Actions"))
+        self.tabs.setTabText(12, self.lang['tab_about'])
+        self.pattern_label.setText(self.lang.get('pattern_label', "Pattern (regex):"))
+        self.pattern_full_cmdline.setText(self.lang.get('pattern_full_cmdline', "Match full command line"))
+        self.pattern_user_label.setText(self.lang.get('pattern_users', "Users (comma-separated):"))
+        self.pattern_condition_label.setText(self.lang.get('pattern_condition', "Condition (as in alert rules):"))
+        self.pattern_preview_btn.setText(self.lang.get('pattern_preview', "Preview"))
+        self.pattern_apply_btn.setText(self.lang.get('pattern_apply', "Apply to Matches"))
+        for index, (action, key, default) in enumerate(PATTERN_ACTIONS):
+            self.pattern_action_selector.setItemText(index, self.lang.get(key, default))
+        self.pattern_table.setHorizontalHeaderLabels(self.lang.get('columns_pattern_table', ["PID", "Name", "User", "CPU %", "Memory MB", "Command Line"]))
+        self.limits_hint_label.setText(self.lang.get('limits_hint', "Right-click a process and choose Limit Resources to move it (or its tree) into a cgroup with CPU, memory and I/O limits."))
+        self.remove_limits_btn.setText(self.lang.get('remove_limits', "Remove Limits"))
+        self.limits_table.setHorizontalHeaderLabels(self.lang.get('columns_limits_table', ["Cgroup", "Processes", "CPU %", "CPU Limit %", "Memory MB", "Memory High MB", "Memory Max MB", "Read KB/s", "Read Limit KB/s", "Write KB/s", "Write Limit KB/s"]))
+        self.apply_policies_btn.setText(self.lang.get('apply_policies', "Apply Policies"))
+        self.policy_log_table.setHorizontalHeaderLabels(self.lang.get('columns_policy_log', ["Time", "Policy", "PID", "Name", "Result"]))
+        self.apply_alert_rules_btn.setText(self.lang.get('apply_alert_rules', "Apply Rules"))
+        self.alert_log_table.setHorizontalHeaderLabels(self.lang.get('columns_alert_log', ["Time", "Rule", "PID", "Name", "State"]))
+        self.leaderboard_window_label.setText(self.lang.get('leaderboard_window', "Rank by CPU time over:"))
+        for index, window in enumerate(LEADERBOARD_WINDOWS):
+            self.leaderboard_window_selector.setItemText(index, self.lang.get('leaderboard_minutes', "{minutes} minutes").format(minutes=window // 60))
+        self.leaderboard_by_name.setText(self.lang.get('leaderboard_by_name', "Combine processes with the same name"))
+        self.update_leaderboard_headers()
+        self.lifecycle_table.setHorizontalHeaderLabels(self.lang.get('columns_lifecycle_table', ["Exit Time", "PID", "PPID", "Name", "Command Line", "Runtime s", "CPU s", "Exit Status"]))
+        self.update_lifecycle_source_label()
 
         self.cpu_plot.setTitle(self.lang.get('cpu_graph_title', "CPU Usage (%)"))
         self.ram_plot.setTitle(self.lang.get('ram_graph_title', "RAM Usage (%)"))
         self.disk_read_plot.setTitle(self.lang.get('disk_read_graph_title', "Disk Read (KB/s)"))
         self.disk_write_plot.setTitle(self.lang.get('disk_write_graph_title', "Disk Write (KB/s)"))
+        self.run_delay_plot.setTitle(self.lang.get('run_delay_graph_title', "CPU Run Queue Delay (ms/s, all CPUs)"))
+        self.disk_device_plots['iops'].setTitle(self.lang.get('disk_iops_graph_title', "Disk IOPS (per device)"))
+        self.disk_device_plots['throughput'].setTitle(self.lang.get('disk_throughput_graph_title', "Disk Throughput (KB/s per device)"))
+        self.disk_device_plots['await'].setTitle(self.lang.get('disk_await_graph_title', "Disk Average Await (ms)"))
+        self.disk_device_plots['util'].setTitle(self.lang.get('disk_util_graph_title', "Disk Utilisation (%)"))
+        self.disk_device_plots['queue'].setTitle(self.lang.get('disk_queue_graph_title', "Disk Queue Depth (in-flight I/Os)"))
         self.upload_plot.setTitle(self.lang.get('upload_graph_title', "Upload (KB/s)"))
         self.download_plot.setTitle(self.lang.get('download_graph_title', "Download (KB/s)"))
 